@@ -1,422 +1,132 @@
-from flask import Flask, render_template, render_template_string, send_from_directory, jsonify, request, session
+from flask import Blueprint, Flask, Response, current_app, render_template, render_template_string, send_from_directory, request, session, g
+from jinja2 import FileSystemBytecodeCache
 import os
+import time
 import logging
-import json
-import sys
+import handlers
+import metrics
+from leaderboard_feed import HEARTBEAT, format_event
+from config import BASE_DIR, INSTANCE_DIR, load_config
+from diagnostics import take_inventory
 
-app = Flask(__name__)
-app.secret_key = os.urandom(24)
-
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
-os.makedirs('highscores', exist_ok=True)
-HIGHSCORE_FILE = os.path.join('highscores', 'highscores.json')
-if not os.path.exists(HIGHSCORE_FILE):
-    with open(HIGHSCORE_FILE, 'w') as f:
-        json.dump([], f)
+bp = Blueprint('main', __name__)
 
-@app.route('/')
-def index():
-    logger.info("Serving index page")
-    try:
-        return render_template('index.html')
-    except Exception as e:
-        logger.error(f"Error rendering index.html: {e}")
-        return '''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Echo Weaver</title>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body { font-family: Arial, sans-serif; text-align: center; padding: 50px; background: #000; color: #fff; }
-                .container { max-width: 600px; margin: 0 auto; }
-                h1 { color: #00ff00; }
-                .error { color: #ff0000; background: #300; padding: 20px; border-radius: 10px; margin: 20px 0; }
-                .info { color: #00ffff; background: #003; padding: 20px; border-radius: 10px; margin: 20px 0; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>ECHO WEAVER</h1>
-                <div class="error">
-                    <h2>Template Error</h2>
-                    <p>Error: ''' + str(e) + '''</p>
-                    <p>This is a fallback page. The template system is not working properly.</p>
-                </div>
-                <div class="info">
-                    <h3>Debug Information</h3>
-                    <p>Current working directory: ''' + os.getcwd() + '''</p>
-                    <p>Templates directory exists: ''' + str(os.path.exists('templates')) + '''</p>
-                    <p>Index.html exists: ''' + str(os.path.exists('templates/index.html')) + '''</p>
-                </div>
-                <p><a href="/diagnose" style="color: #00ff00;">Click here for detailed diagnostics</a></p>
-            </div>
-        </body>
-        </html>
-        ''', 200
 
-@app.route('/game')
-def game():
-    logger.info("Serving game page via /game route")
-    try:
-        return render_template('index.html')
-    except Exception as e:
-        logger.error(f"Error rendering game page: {e}")
-        return index()
+def create_app(config=None):
+    app = Flask(__name__, root_path=BASE_DIR, instance_path=INSTANCE_DIR)
+    app.config.from_mapping(load_config(config))
 
-@app.route('/guide')
-def guide():
-    logger.info("Serving game guide page")
-    try:
-        return render_template('guide.html')
-    except Exception as e:
-        logger.error(f"Error rendering guide page: {e}")
-        return '''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Echo Weaver - Game Guide</title>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body { font-family: Arial, sans-serif; text-align: center; padding: 50px; background: #000; color: #fff; }
-                .container { max-width: 600px; margin: 0 auto; }
-                h1 { color: #00ff00; }
-                .error { color: #ff0000; background: #300; padding: 20px; border-radius: 10px; margin: 20px 0; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>ECHO WEAVER - GAME GUIDE</h1>
-                <div class="error">
-                    <h2>Guide Template Error</h2>
-                    <p>Error: ''' + str(e) + '''</p>
-                    <p>The guide template is not loading properly.</p>
-                </div>
-                <p><a href="/" style="color: #00ff00;">← Back to Game</a></p>
-            </div>
-        </body>
-        </html>
-        ''', 200
+    template_cache = os.path.join(app.instance_path, 'template_cache')
+    os.makedirs(template_cache, exist_ok=True)
+    app.jinja_options = {**app.jinja_options, 'bytecode_cache': FileSystemBytecodeCache(template_cache)}
 
-@app.route('/play')
-def play_direct():
-    logger.info("Serving WebAssembly game via /play route")
-    try:
-        full_path = os.path.join(os.getcwd(), 'static', 'pygbag', 'index.html')
-        logger.info(f"Looking for file at: {full_path}")
-        logger.info(f"File exists: {os.path.exists(full_path)}")
-        
-        response = send_from_directory('static/pygbag', 'index.html')
-        response.headers['Cross-Origin-Embedder-Policy'] = 'require-corp'
-        response.headers['Cross-Origin-Opener-Policy'] = 'same-origin'
-        logger.info(f"Response headers: {dict(response.headers)}")
-        return response
-    except Exception as e:
-        logger.error(f"Error serving WebAssembly game: {e}")
-        raise
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.DEBUG if app.debug else logging.INFO)
 
-@app.route('/assets/<path:filename>')
-def assets(filename):
-    response = send_from_directory('assets', filename)
-    response.headers['Cache-Control'] = 'public, max-age=86400'
-    return response
+    # Taken here so /diagnose never walks the filesystem on a request.
+    inventory = take_inventory(app.root_path, app.instance_path, app.template_folder, app.static_folder)
+    app.extensions['echo_weaver_site'] = handlers.Site(app.config, inventory, render_template, render_template_string)
 
-@app.route('/static/<path:filename>')
-def static_files(filename):
-    logger.info(f"Serving static file: {filename}")
-    
-    try:
-        full_path = os.path.join(os.getcwd(), 'static', filename)
-        logger.info(f"Looking for static file at: {full_path}")
-        logger.info(f"File exists: {os.path.exists(full_path)}")
-        
-        response = send_from_directory('static', filename)
-        
-        response.headers['Cache-Control'] = 'public, max-age=86400'
-            
-        return response
-    except Exception as e:
-        logger.error(f"Error serving static file {filename}: {e}")
-        raise
+    app.register_blueprint(bp)
+    app.view_functions['static'] = _view(handlers.static_files)
+    return app
 
-@app.route('/api/highscores', methods=['GET'])
-def get_highscores():
-    try:
-        if not os.path.exists(HIGHSCORE_FILE) or os.path.getsize(HIGHSCORE_FILE) == 0:
-            with open(HIGHSCORE_FILE, 'w') as f:
-                json.dump([], f)
-            return jsonify([])
-            
-        with open(HIGHSCORE_FILE, 'r') as f:
-            content = f.read().strip()
-            if not content:
-                return jsonify([])
-                
-            highscores = json.loads(content)
-            if not isinstance(highscores, list):
-                logger.error(f"Highscores file contains invalid data: {highscores}")
-                return jsonify([])
-        
-        name_to_entry = {}
-        for entry in highscores:
-            if not isinstance(entry, dict):
-                continue
-                
-            name = entry.get('name')
-            score = entry.get('score')
-            
-            if not name or not isinstance(score, (int, float)):
-                continue
-                
-            if name not in name_to_entry or score > name_to_entry[name]['score']:
-                name_to_entry[name] = {'name': name, 'score': score}
-        
-        deduped_highscores = list(name_to_entry.values())
-        
-        deduped_highscores.sort(key=lambda x: x['score'], reverse=True)
-        
-        deduped_highscores = deduped_highscores[:10]
-        
-        with open(HIGHSCORE_FILE, 'w') as f:
-            json.dump(deduped_highscores, f)
-                
-        return jsonify(deduped_highscores)
-    except Exception as e:
-        logger.error(f"Error getting highscores: {e}")
-        return jsonify([])
 
-@app.route('/api/player', methods=['GET'])
-def get_player():
-    player_name = session.get('player_name', '')
-    return jsonify({"name": player_name})
+def _site():
+    return current_app.extensions['echo_weaver_site']
 
-@app.route('/api/player', methods=['POST'])
-def save_player():
-    data = request.json
-    name = data.get('name', 'Anonymous')
-    session['player_name'] = name
-    return jsonify({"success": True})
 
-@app.route('/api/highscores', methods=['POST'])
-def save_highscore():
-    try:
-        data = request.json
-        name = data.get('name', session.get('player_name', 'Anonymous'))
-        score = data.get('score', 0)
-        
-        if not os.path.exists(HIGHSCORE_FILE) or os.path.getsize(HIGHSCORE_FILE) == 0:
-            with open(HIGHSCORE_FILE, 'w') as f:
-                json.dump([], f)
-            highscores = []
-        else:
-            try:
-                with open(HIGHSCORE_FILE, 'r') as f:
-                    content = f.read().strip()
-                    if not content:
-                        highscores = []
-                    else:
-                        highscores = json.loads(content)
-                        if not isinstance(highscores, list):
-                            logger.error(f"Highscores file contains invalid data: {highscores}")
-                            highscores = []
-            except json.JSONDecodeError:
-                logger.error("Invalid JSON in highscores file")
-                highscores = []
-        
-        player_exists = False
-        player_index = -1
-        
-        filtered_highscores = []
-        for entry in highscores:
-            if isinstance(entry, dict) and entry.get('name') == name:
-                if not player_exists:
-                    player_exists = True
-                    player_index = len(filtered_highscores)
-                    filtered_highscores.append(entry)
-            else:
-                filtered_highscores.append(entry)
-        
-        highscores = filtered_highscores
-        
-        if player_exists:
-            if score > highscores[player_index].get('score', 0):
-                highscores[player_index]['score'] = score
-        else:
-            highscores.append({"name": name, "score": score})
-        
-        def safe_get_score(item):
-            if isinstance(item, dict):
-                return item.get('score', 0)
-            return 0
-            
-        highscores.sort(key=safe_get_score, reverse=True)
-        highscores = highscores[:10]
-        
-        with open(HIGHSCORE_FILE, 'w') as f:
-            json.dump(highscores, f)
-            
-        return jsonify({"success": True})
-    except Exception as e:
-        logger.error(f"Error saving highscore: {e}")
-        return jsonify({"error": str(e), "success": False}), 500
+def _respond(reply):
+    if isinstance(reply, handlers.FileReply):
+        response = send_from_directory(reply.directory, reply.filename, mimetype=reply.mimetype)
+        if reply.cache_control is not None:
+            response.headers['Cache-Control'] = reply.cache_control
+    elif isinstance(reply, handlers.StreamReply):
+        response = Response(_events(reply), content_type=reply.content_type)
+    else:
+        response = Response(reply.body, reply.status, content_type=reply.content_type)
+    for name, value in reply.headers:
+        response.headers[name] = value
+    return response
 
-@app.route('/health')
-def health_check():
-    return jsonify({'status': 'healthy'})
 
-@app.route('/test-universal-controls')
-def test_universal_controls():
-    logger.info("Testing universal_controls.js accessibility")
+def _events(reply):
+    feed = reply.feed
     try:
-        full_path = os.path.join(os.getcwd(), 'static', 'js', 'universal_controls.js')
-        logger.info(f"Looking for universal_controls.js at: {full_path}")
-        logger.info(f"File exists: {os.path.exists(full_path)}")
-        
-        if os.path.exists(full_path):
-            with open(full_path, 'r') as f:
-                content = f.read(100)
-            return jsonify({
-                'file_exists': True,
-                'file_size': os.path.getsize(full_path),
-                'content_preview': content,
-                'path': full_path
-            })
-        else:
-            return jsonify({
-                'file_exists': False,
-                'error': 'File not found',
-                'path': full_path
-            })
-    except Exception as e:
-        logger.error(f"Error testing universal_controls.js: {e}")
-        return jsonify({'error': str(e)}), 500
+        feed.sync()
+        snapshot = feed.snapshot()
+        version = snapshot['version']
+        yield reply.preamble(snapshot)
+        while True:
+            if not feed.wait(version, reply.heartbeat) and not feed.sync():
+                yield HEARTBEAT
+                continue
+            event, data = feed.event_since(version)
+            version = data['version']
+            yield format_event(event, data)
+    finally:
+        feed.release()
 
-@app.route('/diagnose')
-def diagnose():
-    logger.info("Running diagnostics")
-    
-    diagnostic_info = {
-        'current_working_directory': os.getcwd(),
-        'python_version': sys.version,
-        'flask_version': Flask.__version__,
-        'app_root_path': app.root_path,
-        'app_instance_path': app.instance_path,
-        'app_template_folder': app.template_folder,
-        'app_static_folder': app.static_folder,
-        'templates_dir_exists': os.path.exists('templates'),
-        'static_dir_exists': os.path.exists('static'),
-        'index_template_exists': os.path.exists('templates/index.html'),
-        'play_template_exists': os.path.exists('templates/play.html'),
-        'app_py_exists': os.path.exists('app.py'),
-        'wsgi_py_exists': os.path.exists('wsgi.py'),
-        'requirements_exists': os.path.exists('requirements.txt'),
-        'highscore_file_exists': os.path.exists(HIGHSCORE_FILE),
-        'highscore_file_size': os.path.getsize(HIGHSCORE_FILE) if os.path.exists(HIGHSCORE_FILE) else 0,
-        'directory_contents': {
-            'root': os.listdir('.') if os.path.exists('.') else [],
-            'templates': os.listdir('templates') if os.path.exists('templates') else [],
-            'static': os.listdir('static') if os.path.exists('static') else []
-        }
-    }
-    
-    try:
-        test_template = render_template_string('<h1>Template Test</h1>')
-        diagnostic_info['template_system_working'] = True
-    except Exception as e:
-        diagnostic_info['template_system_working'] = False
-        diagnostic_info['template_error'] = str(e)
-    
-    return jsonify(diagnostic_info)
 
-@app.route('/wasm-test')
-def wasm_test():
-    logger.info("Serving WebAssembly test page")
-    response = send_from_directory('static', 'wasm_test.html')
-    response.headers['Cross-Origin-Embedder-Policy'] = 'require-corp'
-    response.headers['Cross-Origin-Opener-Policy'] = 'same-origin'
-    logger.info(f"Response headers for wasm-test: {dict(response.headers)}")
-    return response
+def _view(handler):
+    def view(**url_args):
+        return _respond(handler(_site(), request, session, **url_args))
+    view.__name__ = handler.__name__
+    return view
 
-@app.errorhandler(404)
+
+for rule, name, methods in handlers.ROUTES:
+    bp.add_url_rule(rule, name, _view(getattr(handlers, name)), methods=methods)
+
+@bp.app_errorhandler(404)
 def page_not_found(e):
-    logger.info(f"404 error for path: {request.path}")
-    try:
-        return render_template('index.html'), 200
-    except Exception as template_error:
-        logger.error(f"Error rendering template in 404 handler: {template_error}")
-        return '''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Echo Weaver - Page Not Found</title>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body { font-family: Arial, sans-serif; text-align: center; padding: 50px; background: #000; color: #fff; }
-                .container { max-width: 600px; margin: 0 auto; }
-                h1 { color: #00ff00; }
-                .error { color: #ff0000; background: #300; padding: 20px; border-radius: 10px; margin: 20px 0; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>ECHO WEAVER</h1>
-                <div class="error">
-                    <h2>Page Not Found</h2>
-                    <p>The requested page was not found: ''' + request.path + '''</p>
-                    <p>Template error: ''' + str(template_error) + '''</p>
-                </div>
-                <p><a href="/" style="color: #00ff00;">Go to Home Page</a></p>
-                <p><a href="/diagnose" style="color: #00ffff;">View Diagnostics</a></p>
-            </div>
-        </body>
-        </html>
-        ''', 200
+    return _respond(handlers.not_found(_site(), request, session))
 
-@app.errorhandler(500)
+@bp.app_errorhandler(500)
 def server_error(e):
-    return jsonify({'error': 'Server error occurred', 'message': str(e)}), 500
+    return _respond(handlers.server_error(e))
 
-@app.before_request
+@bp.app_context_processor
+def asset_helpers():
+    return {'asset_bundle': _site().asset_manifest.get}
+
+@bp.before_app_request
 def log_request():
-    app.logger.debug(f"Request: {request.path} from {request.remote_addr}")
+    current_app.logger.debug(f"Request: {request.path} from {request.remote_addr}")
+
+def _metrics_endpoint():
+    return request.url_rule.rule if request.url_rule else '<unmatched>'
+
+@bp.before_app_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    if _metrics_endpoint() not in metrics.UNTIMED_ENDPOINTS:
+        g.in_flight = True
+        metrics.inc('echo_weaver_http_requests_in_flight')
+
+@bp.after_app_request
+def record_request_metrics(response):
+    start = g.pop('request_start', None)
+    if start is not None:
+        endpoint = _metrics_endpoint()
+        if endpoint not in metrics.UNTIMED_ENDPOINTS:
+            metrics.observe('echo_weaver_http_request_duration_seconds', time.perf_counter() - start,
+                            endpoint=endpoint, method=request.method)
+        metrics.inc('echo_weaver_http_requests_total', endpoint=endpoint, method=request.method,
+                    status=response.status_code)
+    return response
+
+@bp.teardown_app_request
+def finish_request(exc):
+    if g.pop('in_flight', False):
+        metrics.dec('echo_weaver_http_requests_in_flight')
 
-@app.after_request
+@bp.after_app_request
 def add_cors_headers(response):
-    if '/pygbag/' in request.path or '/play' in request.path or '/wasm-test' in request.path:
-        response.headers['Cross-Origin-Embedder-Policy'] = 'require-corp'
-        response.headers['Cross-Origin-Opener-Policy'] = 'same-origin'
-        response.headers['Cross-Origin-Resource-Policy'] = 'cross-origin'
-    else:
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    for name, value in handlers.cors_headers(request.path):
+        response.headers[name] = value
     return response
 
-@app.route('/static/pygbag/<path:filename>')
-def pygbag_files(filename):
-    logger.info(f"Serving pygbag file: {filename}")
-    try:
-        full_path = os.path.join(os.getcwd(), 'static', 'pygbag', filename)
-        logger.info(f"Looking for pygbag file at: {full_path}")
-        logger.info(f"File exists: {os.path.exists(full_path)}")
-        
-        response = send_from_directory('static/pygbag', filename)
-        response.headers['Cross-Origin-Embedder-Policy'] = 'require-corp'
-        response.headers['Cross-Origin-Opener-Policy'] = 'same-origin'
-        response.headers['Cross-Origin-Resource-Policy'] = 'cross-origin'
-        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
-        
-        logger.info(f"Response headers for pygbag file: {dict(response.headers)}")
-        return response
-    except Exception as e:
-        logger.error(f"Error serving pygbag file {filename}: {e}")
-        raise
-
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    create_app().run(debug=True, host='0.0.0.0', port=5000)
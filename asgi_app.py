@@ -0,0 +1,340 @@
+import io
+import os
+import sys
+import time
+import asyncio
+import logging
+
+from flask import Flask
+from flask.wrappers import Request
+from flask.sessions import SecureCookieSession, SecureCookieSessionInterface
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from werkzeug.exceptions import HTTPException, NotFound, RequestEntityTooLarge
+from werkzeug.routing import Map, Rule
+from werkzeug.utils import send_from_directory
+from werkzeug.wsgi import FileWrapper
+
+import handlers
+import metrics
+from config import ASGI_DEFAULTS, BASE_DIR, INSTANCE_DIR, load_config
+from diagnostics import take_inventory
+from leaderboard_feed import HEARTBEAT, format_event
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CONFIG = load_config(defaults=ASGI_DEFAULTS)
+# Flask's cookie session settings, so a session survives a switch between the apps.
+SESSION_COOKIE_NAME = Flask.default_config['SESSION_COOKIE_NAME']
+SESSION_MAX_AGE = int(Flask.default_config['PERMANENT_SESSION_LIFETIME'].total_seconds())
+MAX_BODY_SIZE = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_feed_changed = None
+_loop = None
+
+session_serializer = URLSafeTimedSerializer(
+    CONFIG['SECRET_KEY'],
+    salt=SecureCookieSessionInterface.salt,
+    serializer=SecureCookieSessionInterface.serializer,
+    signer_kwargs={'key_derivation': SecureCookieSessionInterface.key_derivation,
+                   'digest_method': SecureCookieSessionInterface.digest_method},
+)
+
+templates = Environment(
+    loader=FileSystemLoader(os.path.join(BASE_DIR, 'templates')),
+    autoescape=select_autoescape(['html']),
+)
+
+
+def static_dir(*parts):
+    return os.path.join(BASE_DIR, 'static', *parts)
+
+
+def url_for(endpoint, filename=None, **kwargs):
+    if endpoint == 'static':
+        return '/static/' + filename
+    return '/' + endpoint
+
+
+def render_template(name, **context):
+    return templates.get_template(name).render(**context)
+
+
+def render_template_string(source, **context):
+    return templates.from_string(source).render(**context)
+
+
+site = handlers.Site(CONFIG, take_inventory(BASE_DIR, INSTANCE_DIR, 'templates', static_dir()),
+                     render_template, render_template_string)
+templates.globals['url_for'] = url_for
+templates.globals['asset_bundle'] = site.asset_manifest.get
+
+url_map = Map([Rule(rule, endpoint=name, methods=methods) for rule, name, methods in handlers.ROUTES]
+              + [Rule(handlers.STATIC_RULE, endpoint='static_files')])
+
+
+def _environ(scope, body):
+    # Just enough WSGI environ for Werkzeug's Request, routing and send_file.
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': '',
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.file_wrapper': lambda f, size=CHUNK_SIZE: FileWrapper(f, CHUNK_SIZE),
+    }
+    for name, value in scope['headers']:
+        key = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            key = 'HTTP_' + key
+        if key in environ and key.startswith('HTTP_'):
+            value = environ[key] + ('; ' if key == 'HTTP_COOKIE' else ',') + value
+        environ[key] = value
+    return environ
+
+
+async def _read_body(receive):
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_SIZE:
+            raise RequestEntityTooLarge()
+        chunks.append(chunk)
+        more_body = message.get('more_body', False)
+    return b''.join(chunks)
+
+
+def _open_session(request):
+    cookie = request.cookies.get(SESSION_COOKIE_NAME)
+    if cookie:
+        try:
+            return SecureCookieSession(session_serializer.loads(cookie, max_age=SESSION_MAX_AGE))
+        except BadSignature:
+            pass
+    return SecureCookieSession()
+
+
+def _session_headers(session):
+    # What Flask's SecureCookieSessionInterface.save_session adds for a non-permanent session.
+    headers = []
+    if session.accessed:
+        headers.append(('Vary', 'Cookie'))
+    if session.modified:
+        headers.append(('Set-Cookie', f"{SESSION_COOKIE_NAME}={session_serializer.dumps(dict(session))}; HttpOnly; Path=/"))
+    return headers
+
+
+async def _start(send, status, headers):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(k.encode('latin-1'), str(v).encode('latin-1')) for k, v in headers],
+    })
+
+
+async def send_reply(send, request, reply, extra_headers=()):
+    headers = [('Content-Type', reply.content_type), ('Content-Length', str(len(reply.body)))]
+    headers += reply.headers + list(extra_headers) + handlers.cors_headers(request.path)
+    await _start(send, reply.status, headers)
+    await send({'type': 'http.response.body', 'body': reply.body if request.method != 'HEAD' else b''})
+
+
+async def send_response(send, request, response):
+    """Write a Werkzeug response as its WSGI call would, reading the body off the event loop."""
+    for name, value in handlers.cors_headers(request.path):
+        response.headers[name] = value
+    headers = response.get_wsgi_headers(request.environ)
+    await _start(send, response.status_code, headers.items())
+    chunks = iter(response.get_app_iter(request.environ))
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+    finally:
+        await asyncio.to_thread(response.close)
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def send_file(send, request, session, reply):
+    # send_from_directory resolves, stats and opens the file and answers
+    # conditional and range requests exactly as it does under Flask.
+    try:
+        response = await asyncio.to_thread(send_from_directory, reply.directory, reply.filename, request.environ,
+                                           mimetype=reply.mimetype)
+    except NotFound:
+        return await send_reply(send, request, await asyncio.to_thread(handlers.not_found, site, request, session))
+    if reply.cache_control is not None:
+        response.headers['Cache-Control'] = reply.cache_control
+    for name, value in reply.headers:
+        response.headers[name] = value
+    await send_response(send, request, response)
+
+
+def _changed_event():
+    global _feed_changed
+    if _feed_changed is None:
+        _feed_changed = asyncio.Event()
+    return _feed_changed
+
+
+def _announce_change():
+    global _feed_changed
+    changed = _changed_event()
+    _feed_changed = asyncio.Event()
+    changed.set()
+
+
+def _announce_change_threadsafe():
+    # Handlers publish from worker threads; wake stream listeners on the loop.
+    _loop.call_soon_threadsafe(_announce_change)
+
+
+site.on_change = _announce_change_threadsafe
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def send_stream(send, request, receive, reply):
+    feed = reply.feed
+    disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+    try:
+        if await asyncio.to_thread(feed.sync):
+            _announce_change()
+        headers = [('Content-Type', reply.content_type)] + reply.headers + handlers.cors_headers(request.path)
+        await _start(send, 200, headers)
+        snapshot = feed.snapshot()
+        version = snapshot['version']
+        await send({'type': 'http.response.body', 'body': reply.preamble(snapshot).encode('utf-8'), 'more_body': True})
+
+        while not disconnected.done():
+            if feed.version == version:
+                changed = asyncio.ensure_future(_changed_event().wait())
+                done, _ = await asyncio.wait({changed, disconnected}, timeout=reply.heartbeat,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                changed.cancel()
+                if disconnected.done():
+                    break
+                if not done:
+                    if not await asyncio.to_thread(feed.sync):
+                        await send({'type': 'http.response.body', 'body': HEARTBEAT.encode('utf-8'),
+                                    'more_body': True})
+                        continue
+                    _announce_change()
+            event, data = feed.event_since(version)
+            version = data['version']
+            await send({'type': 'http.response.body', 'body': format_event(event, data).encode('utf-8'),
+                        'more_body': True})
+    finally:
+        disconnected.cancel()
+        feed.release()
+
+
+async def dispatch(request, send, receive):
+    adapter = url_map.bind_to_environ(request.environ)
+    if request.method == 'OPTIONS':
+        allowed = adapter.allowed_methods()
+        if allowed:
+            # Flask's automatic OPTIONS response.
+            allow = ', '.join(sorted(set(allowed) | {'OPTIONS'}))
+            return await send_reply(send, request, handlers.Reply(b''), [('Allow', allow)])
+
+    session = _open_session(request)
+    try:
+        rule, url_args = adapter.match(return_rule=True)
+    except NotFound:
+        reply = await asyncio.to_thread(handlers.not_found, site, request, session)
+    except HTTPException as e:
+        return await send_response(send, request, e.get_response(request.environ))
+    else:
+        request.url_rule = rule
+        handler = getattr(handlers, rule.endpoint)
+        try:
+            reply = await asyncio.to_thread(handler, site, request, session, **url_args)
+        except HTTPException as e:
+            return await send_response(send, request, e.get_response(request.environ))
+
+    if isinstance(reply, handlers.FileReply):
+        return await send_file(send, request, session, reply)
+    if isinstance(reply, handlers.StreamReply):
+        return await send_stream(send, request, receive, reply)
+    await send_reply(send, request, reply, _session_headers(session))
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        return
+    global _loop
+    _loop = asyncio.get_running_loop()
+
+    start = time.perf_counter()
+    status = 500
+
+    async def send_and_record(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+        await send(message)
+
+    timed = scope['path'] not in metrics.UNTIMED_ENDPOINTS
+    if timed:
+        metrics.inc('echo_weaver_http_requests_in_flight')
+    request = None
+    try:
+        try:
+            body = await _read_body(receive)
+        except HTTPException as e:
+            request = Request(_environ(scope, b''))
+            return await send_response(send_and_record, request, e.get_response(request.environ))
+        request = Request(_environ(scope, body))
+        await dispatch(request, send_and_record, receive)
+    except Exception as e:
+        logger.error(f"Error handling {scope['path']}: {e}")
+        request = request or Request(_environ(scope, b''))
+        await send_reply(send_and_record, request, handlers.server_error(e))
+    finally:
+        endpoint = request.url_rule.rule if request is not None and request.url_rule else '<unmatched>'
+        if timed:
+            metrics.dec('echo_weaver_http_requests_in_flight')
+            metrics.observe('echo_weaver_http_request_duration_seconds', time.perf_counter() - start,
+                            endpoint=endpoint, method=scope['method'])
+        metrics.inc('echo_weaver_http_requests_total', endpoint=endpoint, method=scope['method'], status=status)
+
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run('asgi_app:app', host='0.0.0.0', port=5000)
@@ -0,0 +1,46 @@
+import os
+import json
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+
+from config import BASE_DIR
+
+BUNDLE_DIR = 'dist'
+MANIFEST_FILE = os.path.join(BUNDLE_DIR, 'manifest.json')
+# Bundle names carry a content hash, so a deploy never serves a stale copy.
+BUNDLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# The pygbag page asks for echo_weaver.apk by that exact name, so the archive
+# cannot carry a hash: browsers keep a copy but revalidate it on each load.
+PYGBAG_CACHE_CONTROL = 'no-cache'
+
+SOUND_DIR = os.path.join(BASE_DIR, 'assets', 'sounds')
+# WAV first: clients that send */* or rank both equally get the format every
+# browser can decode. Ogg/Opus goes to clients that ask for it by name.
+AUDIO_TYPES = ('audio/wav', 'audio/ogg')
+
+
+def load_manifest(folder):
+    try:
+        with open(os.path.join(folder, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def static_cache_control(filename):
+    if filename.startswith(BUNDLE_DIR + '/'):
+        return BUNDLE_CACHE_CONTROL
+    # Unhashed files revalidate on each load, as Flask's static route always
+    # served them; the ETag and Last-Modified make that a cheap 304.
+    return 'no-cache'
+
+
+def negotiate_audio(manifest, accept):
+    variants = manifest.get('sprite', {})
+    offered = [mimetype for mimetype in AUDIO_TYPES if mimetype in variants]
+    if not offered:
+        return None, None
+    mimetype = parse_accept_header(accept, MIMEAccept).best_match(offered) or offered[0]
+    return mimetype, variants[mimetype]
@@ -10,11 +10,16 @@ class BackgroundParticle(pygame.sprite.Sprite):
         self.color = BACKGROUND_PARTICLE_COLOR
         self.image.fill(self.color)
         self.rect = self.image.get_rect(center=(random.randint(0, WIDTH), random.randint(0, HEIGHT)))
+        self.previous_center = self.rect.center
         self.velocity = pygame.math.Vector2(random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5))
 
     def update(self):
+        self.previous_center = self.rect.center
         self.rect.move_ip(self.velocity)
+        wrapped = self.rect.copy()
         if self.rect.left > WIDTH: self.rect.right = 0
         if self.rect.right < 0: self.rect.left = WIDTH
         if self.rect.top > HEIGHT: self.rect.bottom = 0
         if self.rect.bottom < 0: self.rect.top = HEIGHT
+        if self.rect != wrapped:
+            self.previous_center = self.rect.center # Jumped to the far edge; nothing to interpolate
@@ -0,0 +1,59 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = '''
+import sys, time, json
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+response = app.test_client().get({path!r})
+responded = time.perf_counter()
+print(json.dumps({{
+    'status': response.status_code,
+    'import': imported - start,
+    'create_app': created - imported,
+    'first_response': responded - created,
+    'total': responded - start,
+}}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a fresh worker from import to first response")
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--path', default='/')
+    args = parser.parse_args()
+
+    code = CHILD.format(root=ROOT, path=args.path)
+    samples = []
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, '-c', code], cwd=cwd, capture_output=True, text=True, check=True)
+            sample = json.loads(output.stdout.strip().splitlines()[-1])
+            sample['process'] = time.perf_counter() - start
+            if sample['status'] != 200:
+                print(f"warning: {args.path} returned {sample['status']}")
+            samples.append(sample)
+
+    print(f"cold start over {args.runs} runs, first request GET {args.path}, cwd outside the repo")
+    print(f"{'phase':<16} {'median ms':>10} {'p90 ms':>10}")
+    for phase in ('import', 'create_app', 'first_response', 'total', 'process'):
+        values = sorted(s[phase] * 1000 for s in samples)
+        p90 = values[min(len(values) - 1, int(len(values) * 0.9))]
+        print(f"{phase:<16} {statistics.median(values):>10.1f} {p90:>10.1f}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import signal
+import socket
+import asyncio
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'gunicorn-sync': ['gunicorn', '--workers', '{workers}', '--bind', '127.0.0.1:{port}', 'app:create_app()'],
+    'gunicorn-asgi': ['gunicorn', '--workers', '{workers}', '--bind', '127.0.0.1:{port}',
+                      '--worker-class', 'uvicorn.workers.UvicornWorker', 'asgi_app:app'],
+}
+
+
+def wait_for_port(port, timeout=15.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+async def fetch(reader, writer, path):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = 0
+    keep_alive = True
+    for line in head.split(b'\r\n'):
+        lower = line.lower()
+        if lower.startswith(b'content-length:'):
+            length = int(line.split(b':', 1)[1])
+        elif lower.startswith(b'connection:') and b'close' in lower:
+            keep_alive = False
+    await reader.readexactly(length)
+    return status, keep_alive
+
+
+async def client(port, path, deadline, timeout, results):
+    writer = None
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if writer is None:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', port), timeout)
+            status, keep_alive = await asyncio.wait_for(fetch(reader, writer, path), timeout)
+            results['latencies'].append(time.perf_counter() - start)
+            if status != 200:
+                results['errors'] += 1
+            if not keep_alive:
+                writer.close()
+                writer = None
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+        results['errors'] += 1
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def run_level(port, path, connections, duration, timeout):
+    results = {'latencies': [], 'errors': 0}
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(client(port, path, deadline, timeout, results) for _ in range(connections)))
+    return results
+
+
+def percentile(values, pct):
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def bench_server(name, args):
+    command = [part.format(workers=args.workers, port=args.port) for part in SERVERS[name]]
+    proc = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                            start_new_session=True)
+    rows = []
+    try:
+        if not wait_for_port(args.port):
+            print(f"{name}: server did not start ({' '.join(command)})")
+            return rows
+        for connections in args.connections:
+            results = asyncio.run(run_level(args.port, args.path, connections, args.duration, args.timeout))
+            latencies = results['latencies']
+            total = len(latencies) + results['errors']
+            rows.append({
+                'server': name,
+                'connections': connections,
+                'rps': len(latencies) / args.duration,
+                'p50_ms': percentile(latencies, 50) * 1000,
+                'p99_ms': percentile(latencies, 99) * 1000,
+                'error_rate': results['errors'] / total if total else 1.0,
+            })
+    finally:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare concurrent-connection capacity of the sync and async servers")
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--path', default='/api/highscores')
+    parser.add_argument('--connections', type=int, nargs='+', default=[10, 50, 100, 250, 500])
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--timeout', type=float, default=2.0)
+    parser.add_argument('--slo-ms', type=float, default=500.0, help="p99 latency a level must stay under to count")
+    parser.add_argument('--servers', nargs='+', default=list(SERVERS), choices=list(SERVERS))
+    args = parser.parse_args()
+
+    print(f"{'server':<15} {'conns':>6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    capacity = {}
+    for name in args.servers:
+        for row in bench_server(name, args):
+            print(f"{row['server']:<15} {row['connections']:>6} {row['rps']:>9.1f} {row['p50_ms']:>9.1f} "
+                  f"{row['p99_ms']:>9.1f} {row['error_rate']:>7.1%}")
+            if row['error_rate'] < 0.01 and row['p99_ms'] < args.slo_ms:
+                capacity[name] = max(capacity.get(name, 0), row['connections'])
+
+    print()
+    for name in args.servers:
+        print(f"{name}: sustains {capacity.get(name, 0)} concurrent connections "
+              f"(p99 < {args.slo_ms:.0f} ms, < 1% errors, {args.workers} workers)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
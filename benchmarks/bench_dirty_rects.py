@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+from check_fixed_timestep import game_tree
+
+
+def populate(game, enemies):
+    from enemy import BASIC
+
+    game.active_powerups['invincibility_active'] = True
+    while len(game.enemies) < enemies:
+        game.enemies.spawn(BASIC)
+
+
+def run(mode, enemies, frames, seed, screen, verify=None):
+    import pygame
+    from game import Game
+    from dirty_renderer import DirtyRenderer
+
+    random.seed(seed)
+    game = Game()
+    renderer = DirtyRenderer(screen)
+    reference = DirtyRenderer(verify) if verify is not None else None
+    times = []
+    mismatches = 0
+    for frame in range(frames):
+        populate(game, enemies)
+        game.update()
+        start = time.perf_counter()
+        if mode == 'full':
+            game.draw(screen)
+            pygame.display.flip()
+        else:
+            game.draw_dirty(renderer)
+        times.append(time.perf_counter() - start)
+        if reference is not None:
+            # Same scene repainted from scratch; any pixel left behind by a
+            # missed clear shows up as a difference.
+            reference.invalidate()
+            game.rendered_state = None
+            game.draw_dirty(reference)
+            if pygame.image.tobytes(screen, 'RGB') != pygame.image.tobytes(verify, 'RGB'):
+                mismatches += 1
+
+    sprites = sum(len(group) for group in (game.enemies, game.enemy_trails, game.background_particles,
+                                           game.particles, game.waves, game.damage_numbers))
+    times.sort()
+    area = renderer.presented_area / max(renderer.frames, 1) / (screen.get_width() * screen.get_height())
+    return {
+        'mode': mode,
+        'enemies': enemies,
+        'sprites': sprites,
+        'median_ms': statistics.median(times) * 1000,
+        'p95_ms': times[int(len(times) * 0.95)] * 1000,
+        'presented': 1.0 if mode == 'full' else area,
+        'full_frames': frames if mode == 'full' else renderer.full_frames,
+        'mismatches': mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-screen and dirty-rectangle rendering frame times")
+    parser.add_argument('--enemies', type=int, nargs='+', default=[5, 40, 150])
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--verify', action='store_true', help="also compare every dirty frame with a full repaint")
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    with tempfile.TemporaryDirectory() as tree:
+        game_tree(tree)
+        sys.path.insert(0, tree)
+        os.chdir(tree)
+
+        import pygame
+        from settings import WIDTH, HEIGHT
+
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        verify = pygame.Surface((WIDTH, HEIGHT)).convert() if args.verify else None
+        results = []
+        for enemies in args.enemies:
+            for mode in ('full', 'dirty'):
+                results.append(run(mode, enemies, args.frames, args.seed, screen,
+                                   verify if mode == 'dirty' else None))
+        pygame.quit()
+
+    print(f"{args.frames} frames per run, {WIDTH}x{HEIGHT}, SDL video driver '{os.environ['SDL_VIDEODRIVER']}'")
+    print(f"{'enemies':>7} {'sprites':>8} {'mode':<6} {'median ms':>10} {'p95 ms':>8} {'screen presented':>17} "
+          f"{'full flips':>11}" + (f" {'mismatches':>11}" if args.verify else ''))
+    for r in results:
+        print(f"{r['enemies']:>7} {r['sprites']:>8} {r['mode']:<6} {r['median_ms']:>10.2f} {r['p95_ms']:>8.2f} "
+              f"{r['presented']:>16.0%} {r['full_frames']:>11}" + (f" {r['mismatches']:>11}" if args.verify else ''))
+    return 1 if any(r['mismatches'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
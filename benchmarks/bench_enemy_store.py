@@ -0,0 +1,146 @@
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each case runs in a fresh interpreter so peak RSS belongs to that case
+# alone. 'sprites' is the per-enemy Sprite design the store replaced: its own
+# Surface, a Vector2 for homing and Rect.move_ip per enemy per tick, plus a
+# trail Sprite with its own Surface per enemy per tick. 'lists' and 'arrays'
+# are the EnemyStore variants without and with NumPy, both feeding a
+# TrailStore. Every tick also ages the trails and draws them off screen.
+DESIGNS = ('sprites', 'lists', 'arrays')
+CHILD = '''
+import sys, math, time, json, random, resource
+sys.path.insert(0, sys.argv[1])
+import pygame
+from settings import *
+from enemy import ArrayEnemyStore, ListEnemyStore, KIND_COLORS, BASIC, ZIGZAG, draw_enemy_shape
+from enemy_trail import TrailStore
+design, count, seconds = sys.argv[2], int(sys.argv[3]), float(sys.argv[4])
+CHECK_TICKS = 120
+
+
+class SpriteEnemy(pygame.sprite.Sprite):
+    def __init__(self, zigzag):
+        super().__init__()
+        self.image = pygame.Surface((ENEMY_RADIUS * 2, ENEMY_RADIUS * 2), pygame.SRCALPHA)
+        draw_enemy_shape(self.image, GREEN if zigzag else RED, WHITE, ENEMY_RADIUS, 2)
+        edge = random.choice(['top', 'bottom', 'left', 'right'])
+        if edge == 'top':
+            self.rect = self.image.get_rect(center=(random.randint(0, WIDTH), 0))
+        elif edge == 'bottom':
+            self.rect = self.image.get_rect(center=(random.randint(0, WIDTH), HEIGHT))
+        elif edge == 'left':
+            self.rect = self.image.get_rect(center=(0, random.randint(0, HEIGHT)))
+        else:
+            self.rect = self.image.get_rect(center=(WIDTH, random.randint(0, HEIGHT)))
+        self.zigzag = zigzag
+        self.zigzag_timer = 0
+
+    def update(self, core, speed, trails):
+        dir_vec = pygame.math.Vector2(core.rect.centerx - self.rect.centerx,
+                                      core.rect.centery - self.rect.centery)
+        if dir_vec.length_squared() > 0:
+            dir_vec.normalize_ip()
+        if self.zigzag:
+            self.zigzag_timer += 1
+            dir_vec += dir_vec.rotate(90) * math.sin(self.zigzag_timer / 30) * 5
+        self.rect.move_ip(dir_vec * speed)
+        trails.add(TrailSprite(self.rect.center, self.image.get_at((ENEMY_RADIUS, ENEMY_RADIUS)), ENEMY_RADIUS))
+
+
+class TrailSprite(pygame.sprite.Sprite):
+    def __init__(self, position, color, size):
+        super().__init__()
+        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.image.fill(color)
+        self.rect = self.image.get_rect(center=position)
+        self.lifetime = 30
+
+    def update(self):
+        self.lifetime -= 1
+        if self.lifetime <= 0:
+            self.kill()
+        self.image.set_alpha(int(255 * (self.lifetime / 30)))
+
+
+class Core:
+    rect = pygame.Rect(0, 0, 40, 40)
+    rect.center = (WIDTH // 2, HEIGHT // 2)
+
+
+pygame.init()
+screen = pygame.Surface((WIDTH, HEIGHT))
+random.seed(1)
+kinds = [ZIGZAG if random.random() < 0.3 else BASIC for _ in range(count)]
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if design == 'sprites':
+    enemies = pygame.sprite.Group(SpriteEnemy(kind == ZIGZAG) for kind in kinds)
+    trails = pygame.sprite.Group()
+else:
+    enemies = (ListEnemyStore if design == 'lists' else ArrayEnemyStore)()
+    trails = TrailStore(KIND_COLORS)
+    for kind in kinds:
+        enemies.spawn(kind)
+    enemies.image(0) # Warm the shared image cache, as the first draw would
+
+# The first ticks double as a check that both designs move enemies identically.
+for _ in range(CHECK_TICKS):
+    enemies.update(Core, ENEMY_SPEED, trails)
+    trails.update()
+positions = sorted(tuple(e.rect.center) for e in enemies)
+
+ticks = 0
+elapsed = drawing = 0.0
+while ticks < 10 or elapsed + drawing < seconds:
+    start = time.perf_counter()
+    enemies.update(Core, ENEMY_SPEED, trails)
+    trails.update()
+    middle = time.perf_counter()
+    trails.draw(screen)
+    elapsed += middle - start
+    drawing += time.perf_counter() - middle
+    ticks += 1
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({'ticks': ticks, 'seconds': elapsed, 'drawing': drawing, 'rss_kib': after - before,
+                  'positions': positions}))
+'''
+
+
+def measure(design, count, seconds):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    output = subprocess.run([sys.executable, '-c', CHILD, ROOT, design, str(count), str(seconds)],
+                            env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare enemy update throughput and memory: sprites vs EnemyStore on lists and arrays")
+    parser.add_argument('--enemies', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--seconds', type=float, default=2.0, help="update and draw time per case")
+    args = parser.parse_args()
+
+    print(f"update() with trails, 30% zigzag, {args.seconds:.0f} s per case; ticks/s and ms/tick cover update() and "
+          f"trail ageing, draw ms the trail blits; memory is the peak RSS increase")
+    print(f"{'enemies':>7} {'design':<8} {'ticks/s':>9} {'ms/tick':>8} {'draw ms':>8} {'enemy-ticks/s':>14} "
+          f"{'memory MiB':>11} {'B/enemy':>8} {'same paths':>11}")
+    status = 0
+    for count in args.enemies:
+        results = {design: measure(design, count, args.seconds) for design in DESIGNS}
+        for design, r in results.items():
+            same = r['positions'] == results['sprites']['positions']
+            rate = r['ticks'] / r['seconds']
+            print(f"{count:>7} {design:<8} {rate:>9.1f} {1000 / rate:>8.2f} {1000 * r['drawing'] / r['ticks']:>8.2f} "
+                  f"{rate * count:>14,.0f} "
+                  f"{r['rss_kib'] / 1024:>11.1f} {r['rss_kib'] * 1024 / count:>8,.0f} "
+                  f"{'' if design == 'sprites' else 'yes' if same else 'NO':>11}")
+            status |= not same
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import os
+import sys
+import json
+import zipfile
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from build_game import build_game, find_python, target_python
+
+# Runs main.py the way pygbag does once the archive is mounted: pygame is
+# already imported, the working directory is the archive's assets/ folder and
+# nothing is cached between page loads. NumPy is hidden because the browser
+# build doesn't ship it. The first present is the start screen; a click is
+# queued then, so the second present is the first gameplay frame.
+CHILD = '''
+import os, sys, time, json, runpy
+import pygame
+sys.modules['numpy'] = None
+start = time.perf_counter()
+marks = {}
+
+def timed(present):
+    def wrapper(*args):
+        result = present(*args)
+        now = time.perf_counter() - start
+        if 'first_frame' not in marks:
+            marks['first_frame'] = now
+            marks['modules_first_frame'] = len(sys.modules)
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=1))
+        else:
+            marks['first_game_frame'] = now
+            marks['modules_first_game_frame'] = len(sys.modules)
+            print(json.dumps(marks), flush=True)
+            os._exit(0)
+        return result
+    return wrapper
+
+pygame.display.flip = timed(pygame.display.flip)
+pygame.display.update = timed(pygame.display.update)
+sys.path.insert(0, os.getcwd())
+runpy.run_path('main.py', run_name='__main__')
+'''
+
+
+def measure(apk_path, python, runs):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy',
+               PYTHONDONTWRITEBYTECODE='1', PYGAME_HIDE_SUPPORT_PROMPT='1')
+    samples = []
+    with tempfile.TemporaryDirectory() as mount:
+        with zipfile.ZipFile(apk_path) as apk:
+            apk.extractall(mount)
+        cwd = os.path.join(mount, 'assets')
+        for _ in range(runs):
+            output = subprocess.run([python, '-c', CHILD], cwd=cwd, env=env, capture_output=True, text=True,
+                                    check=True, timeout=60)
+            samples.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the pygbag bundle from main.py to its first frames")
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--python', help="interpreter matching the browser runtime (default: pythonX.Y from the template)")
+    args = parser.parse_args()
+
+    version = target_python()
+    python = args.python or find_python(version)
+    if python is None:
+        print("python{}.{} not found; pass --python".format(*version))
+        return 1
+
+    results = []
+    with tempfile.TemporaryDirectory() as out:
+        for variant, compiler in (('source', None), ('bytecode', python)):
+            apk_path = os.path.join(out, f'{variant}.apk')
+            build_game(apk_path, python=compiler)
+            results.append((variant, os.path.getsize(apk_path), measure(apk_path, python, args.runs)))
+
+    print(f"{args.runs} runs per archive, {python}, SDL dummy drivers, no bytecode cache")
+    print(f"{'archive':<9} {'size':>9} {'first frame ms':>15} {'p90':>7} {'first game frame ms':>20} {'p90':>7} "
+          f"{'modules':>8}")
+    for variant, size, samples in results:
+        row = [f"{variant:<9}", f"{size:>9,}"]
+        for phase, width in (('first_frame', 15), ('first_game_frame', 20)):
+            values = sorted(s[phase] * 1000 for s in samples)
+            p90 = values[min(len(values) - 1, int(len(values) * 0.9))]
+            row += [f"{statistics.median(values):>{width}.1f}", f"{p90:>7.1f}"]
+        row.append(f"{samples[0]['modules_first_frame']:>3} / {samples[0]['modules_first_game_frame']}")
+        print(' '.join(row))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+import json
+import time
+import signal
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REQUESTS_PATTERN = re.compile(r'^echo_weaver_http_requests_total\{(.*)\} (\d+)$', re.M)
+READS_PATTERN = re.compile(r'^echo_weaver_highscore_reads_total (\d+)$', re.M)
+
+
+def wait_for_port(port, timeout=15.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+async def request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    payload = json.dumps(body).encode() if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    await writer.drain()
+    data = await reader.read()
+    writer.close()
+    return data.split(b'\r\n\r\n', 1)[1].decode('utf-8', 'replace')
+
+
+async def scrape(port):
+    text = await request(port, 'GET', '/metrics')
+    served = sum(int(count) for labels, count in REQUESTS_PATTERN.findall(text) if '/metrics' not in labels)
+    reads = READS_PATTERN.search(text)
+    return served, int(reads.group(1)) if reads else 0
+
+
+async def poller(port, interval, deadline, received):
+    while time.perf_counter() < deadline:
+        await request(port, 'GET', '/api/highscores')
+        received.append(1)
+        await asyncio.sleep(interval)
+
+
+async def subscriber(port, deadline, received):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(b"GET /api/highscores/stream HTTP/1.1\r\nHost: localhost\r\nAccept: text/event-stream\r\n\r\n")
+    await writer.drain()
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(reader.read(65536), remaining)
+            except asyncio.TimeoutError:
+                break
+            if not chunk:
+                break
+            received.extend([1] * chunk.count(b'event: '))
+    finally:
+        writer.close()
+
+
+async def writer_task(port, interval, deadline, posted):
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(interval)
+        score = int(time.time() * 1000)
+        await request(port, 'POST', '/api/highscores', {'name': f'bench{len(posted) % 3}', 'score': score})
+        posted.append(score)
+
+
+async def run_mode(mode, args):
+    before = await scrape(args.port)
+    deadline = time.perf_counter() + args.duration
+    received = []
+    posted = []
+    if mode == 'poll':
+        clients = [poller(args.port, args.poll_interval, deadline, received) for _ in range(args.clients)]
+    else:
+        clients = [subscriber(args.port, deadline, received) for _ in range(args.clients)]
+    await asyncio.gather(writer_task(args.port, args.post_interval, deadline, posted), *clients)
+    after = await scrape(args.port)
+    return {
+        'mode': mode,
+        'requests': after[0] - before[0],
+        'reads': after[1] - before[1],
+        'updates_per_client': len(received) / args.clients,
+        'scores_posted': len(posted),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare server load of leaderboard polling and the event stream")
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--duration', type=float, default=20.0)
+    parser.add_argument('--poll-interval', type=float, default=2.0)
+    parser.add_argument('--post-interval', type=float, default=2.0)
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--min-ratio', type=float, default=2.0,
+                        help="fail unless streaming cuts requests and file reads by at least this factor")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, FLASK_HIGHSCORE_FILE=os.path.join(tmp, 'highscores.json'),
+                   FLASK_LEADERBOARD_MAX_SUBSCRIBERS=str(args.clients + 10))
+        proc = subprocess.Popen(['uvicorn', '--port', str(args.port), '--log-level', 'warning', 'asgi_app:app'],
+                                cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                start_new_session=True)
+        try:
+            if not wait_for_port(args.port):
+                print("server did not start")
+                return 1
+            results = [asyncio.run(run_mode(mode, args)) for mode in ('poll', 'push')]
+        finally:
+            os.killpg(proc.pid, signal.SIGTERM)
+            proc.wait()
+
+    print(f"{args.clients} clients, {args.duration:.0f} s, a new top score every {args.post_interval:.1f} s, "
+          f"polling every {args.poll_interval:.1f} s")
+    print(f"{'mode':<6} {'requests':>9} {'file reads':>11} {'updates/client':>15} {'scores posted':>14}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['requests']:>9} {r['reads']:>11} {r['updates_per_client']:>15.1f} "
+              f"{r['scores_posted']:>14}")
+    poll, push = results
+    failures = []
+    for key, label in (('requests', 'server requests'), ('reads', 'file reads')):
+        ratio = poll[key] / max(push[key], 1)
+        print(f"{label}: {ratio:.1f}x fewer with the event stream")
+        if ratio < args.min_ratio:
+            failures.append(f"{label} cut only {ratio:.1f}x (need {args.min_ratio:.1f}x)")
+    # Fewer requests mean nothing if the stream stopped delivering: every
+    # subscriber should see updates beyond the snapshot it gets on connect.
+    if push['scores_posted'] and push['updates_per_client'] <= 1:
+        failures.append("subscribers received no updates after the snapshot")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import os
+import sys
+import random
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from settings import WIDTH, HEIGHT
+import enemy
+from enemy_trail import TrailStore
+from wave_manager import WaveManager
+
+
+class Core:
+    # All the store reads from the core is where it sits.
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 40, 40)
+        self.rect.center = (WIDTH // 2, HEIGHT // 2)
+
+
+def row_state(store):
+    # The columns both stores keep; the array store's velocity is scratch space.
+    columns = [getattr(store, name) for name in enemy.ListEnemyStore.COLUMNS]
+    return [tuple(tuple(map(float, column[i])) if name in ('position', 'previous') else float(column[i])
+                  for name, column in zip(enemy.ListEnemyStore.COLUMNS, columns))
+            for i in range(store.count)]
+
+
+def play(store_class, wave, ticks, seed):
+    """One seeded wave through a store, with waves hitting, pulling and killing
+    enemies the way gameplay does. Returns the state after every tick and the
+    final frame."""
+    random.seed(seed)
+    store = store_class()
+    trails = TrailStore(enemy.KIND_COLORS)
+    core = Core()
+    waves = WaveManager()
+    waves.current_wave = wave - 1
+    waves.start_next_wave()
+    # The wave spawns a few kinds at a time; seed every kind so healers,
+    # spawners and splitters act from the first tick.
+    for i in range(90):
+        store.spawn(i % len(enemy.KIND_NAMES))
+
+    states = []
+    for tick in range(ticks):
+        waves.update(store, core)
+        store.begin_tick()
+        store.update(core, waves.enemy_speed, trails)
+        trails.update()
+        if tick % 7 == 0:
+            store.pull((random.randint(0, WIDTH), random.randint(0, HEIGHT)), 150, 4)
+        for handle in store.collide(pygame.Rect(random.randint(0, WIDTH), random.randint(0, HEIGHT), 60, 60))[:2]:
+            if handle.kind == enemy.SPLITTER:
+                handle.split()
+            handle.hp -= 1
+            if handle.hp <= 0:
+                handle.kill()
+        nearby = store.within((random.randint(0, WIDTH), random.randint(0, HEIGHT)), 80)
+        if nearby and tick % 5 == 0:
+            nearby[0].kill()
+        states.append((len(store), len(trails), row_state(store)))
+
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    rects = [tuple(rect) for rect in store.draw(surface, 0.37)]
+    trails.draw(surface)
+    return states, rects, pygame.image.tobytes(surface, 'RGB')
+
+
+def first_difference(states_a, states_b):
+    for tick, (a, b) in enumerate(zip(states_a, states_b)):
+        if a != b:
+            if a[:2] != b[:2]:
+                return f"tick {tick}: {a[0]} enemies and {a[1]} trails vs {b[0]} and {b[1]}"
+            row = next(i for i, (x, y) in enumerate(zip(a[2], b[2])) if x != y)
+            columns = ', '.join(f"{name} {x} vs {y}" for name, x, y in
+                                zip(enemy.ListEnemyStore.COLUMNS, a[2][row], b[2][row]) if x != y)
+            return f"tick {tick}, row {row}: {columns}"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the NumPy and list enemy stores play a wave identically")
+    parser.add_argument('--wave', type=int, default=12, help="wave number; 10 and up spawns every kind")
+    parser.add_argument('--ticks', type=int, default=900)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    if enemy.np is None:
+        print("numpy is not installed; only ListEnemyStore is available, so there is nothing to compare")
+        return 1
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    arrays = play(enemy.ArrayEnemyStore, args.wave, args.ticks, args.seed)
+    lists = play(enemy.ListEnemyStore, args.wave, args.ticks, args.seed)
+    pygame.quit()
+
+    last = arrays[0][-1]
+    print(f"wave {args.wave}, {args.ticks} ticks, seed {args.seed}: {last[0]} enemies and {last[1]} trails at the end")
+    failures = []
+    difference = first_difference(arrays[0], lists[0])
+    if difference:
+        failures.append(f"stores diverge at {difference}")
+    if arrays[1] != lists[1]:
+        failures.append("draw() returned different dirty rects")
+    if arrays[2] != lists[2]:
+        failures.append("the final frames differ")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("positions, hit points and timers identical every tick; final frames identical")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
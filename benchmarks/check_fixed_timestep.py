@@ -0,0 +1,137 @@
+import os
+import sys
+import glob
+import shutil
+import random
+import hashlib
+import argparse
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def game_tree(target):
+    # The modules main.py imports, as build_game.py packs them into the pygbag
+    # archive, plus the desktop sound files.
+    sys.path.insert(0, ROOT)
+    from build_game import stage
+
+    stage(target)
+    shutil.copytree(os.path.join(ROOT, 'assets'), os.path.join(target, 'assets'), dirs_exist_ok=True)
+
+
+def scripted_input(seed, ticks):
+    import pygame
+    from settings import WIDTH, HEIGHT
+
+    rng = random.Random(seed)
+    center = (WIDTH // 2, HEIGHT // 2)
+    inputs = {}
+    # Defend for ten seconds, then stand still for ten so enemies reach the
+    # core: game over, the screen shake and restarts are all exercised.
+    for tick in (t for t in range(10, ticks, 12) if t % 1200 < 600):
+        target = (rng.randint(0, WIDTH), rng.randint(0, HEIGHT))
+        inputs.setdefault(tick, []).append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=center, button=1))
+        inputs.setdefault(tick + 4, []).append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=target, button=1))
+    for tick in range(45, ticks, 90):
+        key, char = rng.choice([(pygame.K_SPACE, ' '), (pygame.K_1, '1'), (pygame.K_2, '2'), (pygame.K_3, '3')])
+        inputs.setdefault(tick, []).append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char))
+    for tick in range(300, ticks, 300):
+        inputs.setdefault(tick, []).append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r, unicode='r'))
+    return inputs
+
+
+def state_digest(game):
+    enemies = sorted((e.kind_name, e.rect.center) for e in game.enemies)
+    state = (game.state, game.score, game.wave_manager.current_wave, game.combo_manager.combo_count,
+             game.fever_manager.fever_charge, game.fever_manager.fever_timer, game.echo_burst_cooldown,
+             len(game.waves), len(game.powerups), len(game.damage_numbers), enemies)
+    return hashlib.sha256(repr(state).encode()).hexdigest()[:16]
+
+
+def run(fps, ticks, seed, screen):
+    from game import Game
+    from sim_clock import SimClock
+
+    random.seed(seed)
+    game = Game()
+    inputs = scripted_input(seed, ticks)
+    sim_clock = SimClock()
+    # Frame times vary by +/-25 % around the target rate. Drawn from a separate
+    # generator so rendering never touches the game's random sequence.
+    frames = random.Random(seed * 1000 + fps)
+    trace = []
+    rendered = 0
+    most_per_frame = 0
+    while sim_clock.ticks < ticks:
+        first = sim_clock.ticks
+        steps = sim_clock.advance(frames.uniform(0.75, 1.25) / fps)
+        most_per_frame = max(most_per_frame, steps)
+        for tick in range(first, min(first + steps, ticks)):
+            for event in inputs.get(tick, ()):
+                game.handle_event(event)
+            game.update()
+            if tick % 60 == 59:
+                trace.append(state_digest(game))
+        game.draw(screen, sim_clock.alpha)
+        rendered += 1
+    return {
+        'fps': fps,
+        'frames': rendered,
+        'most_per_frame': most_per_frame,
+        'score': game.score,
+        'wave': game.wave_manager.current_wave,
+        'trace': trace,
+        'digest': hashlib.sha256(''.join(trace).encode()).hexdigest()[:16],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that gameplay is identical at different render rates")
+    parser.add_argument('--fps', type=int, nargs='+', default=[30, 60, 144])
+    parser.add_argument('--seconds', type=float, default=60.0, help="simulated game time")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--expect', help="digest the run must produce; it depends on --seconds and --seed")
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    with tempfile.TemporaryDirectory() as tree:
+        game_tree(tree)
+        sys.path.insert(0, tree)
+        os.chdir(tree)
+
+        import pygame
+        from settings import WIDTH, HEIGHT
+        from sim_clock import TICK_RATE
+
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        ticks = int(args.seconds * TICK_RATE)
+        results = []
+        for fps in args.fps:
+            for path in glob.glob('highscore*.txt'):
+                os.remove(path)
+            results.append(run(fps, ticks, args.seed, screen))
+        pygame.quit()
+
+    print(f"{ticks} ticks ({args.seconds:.0f} s of game time at {TICK_RATE} Hz), seed {args.seed}")
+    print(f"{'fps':>5} {'frames':>7} {'max ticks/frame':>16} {'score':>6} {'wave':>5} {'digest':>17}")
+    for r in results:
+        print(f"{r['fps']:>5} {r['frames']:>7} {r['most_per_frame']:>16} {r['score']:>6} {r['wave']:>5} {r['digest']:>17}")
+
+    reference = results[0]
+    for r in results[1:]:
+        if r['trace'] != reference['trace']:
+            second = next(i for i, (a, b) in enumerate(zip(reference['trace'], r['trace'])) if a != b)
+            print(f"MISMATCH: {r['fps']} fps diverges from {reference['fps']} fps at game second {second + 1}")
+            return 1
+    print("outcomes identical at every render rate")
+    if args.expect and reference['digest'] != args.expect:
+        print(f"MISMATCH: digest {reference['digest']}, expected {args.expect}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import os
+import sys
+import argparse
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import metrics
+
+
+def request(barrier):
+    # One short-lived request thread, as Werkzeug's threaded server starts them.
+    metrics.inc('echo_weaver_http_requests_total', endpoint='/api/highscores', status='200')
+    barrier.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that per-thread metric shards stay bounded without scrapes")
+    parser.add_argument('--threads', type=int, default=2000, help="short-lived threads in total")
+    parser.add_argument('--concurrency', type=int, default=50, help="threads alive at once")
+    args = parser.parse_args()
+
+    most = 0
+    for start in range(0, args.threads, args.concurrency):
+        batch = min(args.concurrency, args.threads - start)
+        barrier = threading.Barrier(batch + 1)
+        threads = [threading.Thread(target=request, args=(barrier,)) for _ in range(batch)]
+        for thread in threads:
+            thread.start()
+        barrier.wait() # Every thread in the batch has registered its shard
+        most = max(most, len(metrics._shards))
+        for thread in threads:
+            thread.join()
+
+    counters, _ = metrics._collect()
+    served = counters.get(metrics._key('echo_weaver_http_requests_total',
+                                       {'endpoint': '/api/highscores', 'status': '200'}), 0)
+    # Finished threads are joined before the next batch starts, so only live
+    # threads, and the main thread's shard if it has one, may remain.
+    bound = args.concurrency + 1
+    print(f"{args.threads} threads, {args.concurrency} at a time: at most {most} shards retained "
+          f"(bound {bound}), {served} requests counted")
+    if most > bound or served != args.threads:
+        print("FAIL: shards of finished threads are not being retired, or counts were lost")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
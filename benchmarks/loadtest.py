@@ -0,0 +1,287 @@
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import ipaddress
+from urllib.parse import urlsplit
+
+BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+ASSET_PATTERN = re.compile(r'(?:src|href)="(/static/[^"?]+\.(?:js|css))[^"]*"')
+PLAYER_NAMES = ['Echo', 'Pulse', 'Wave', 'Weaver', 'Core', 'Nova', 'Drift', 'Flux']
+
+
+class RouteStats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+
+    def record(self, latency, ok):
+        self.latencies.append(latency)
+        if not ok:
+            self.errors += 1
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        histogram = [0] * (len(BUCKETS_MS) + 1)
+        for latency in latencies:
+            ms = latency * 1000
+            for i, bound in enumerate(BUCKETS_MS):
+                if ms <= bound:
+                    histogram[i] += 1
+                    break
+            else:
+                histogram[-1] += 1
+
+        def pct(p):
+            if not latencies:
+                return 0.0
+            return latencies[min(count - 1, int(count * p / 100))] * 1000
+
+        return {
+            'requests': count,
+            'errors': self.errors,
+            'error_rate': self.errors / count if count else 0.0,
+            'throughput': count / elapsed if elapsed else 0.0,
+            'p50_ms': pct(50),
+            'p95_ms': pct(95),
+            'p99_ms': pct(99),
+            'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+            'histogram': histogram,
+        }
+
+
+class Connection:
+    def __init__(self, host, port, timeout):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self.cookies = {}
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def request(self, method, path, body=None):
+        return await asyncio.wait_for(self._request(method, path, body), self.timeout)
+
+    async def _request(self, method, path, body):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        payload = b''
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            lines.append("Content-Type: application/json")
+            lines.append(f"Content-Length: {len(payload)}")
+        if self.cookies:
+            lines.append("Cookie: " + '; '.join(f"{k}={v}" for k, v in self.cookies.items()))
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + payload)
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        status = int(status_line.split(' ', 2)[1])
+        headers = {}
+        for line in header_lines:
+            if ':' not in line:
+                continue
+            key, value = line.split(':', 1)
+            key = key.strip().lower()
+            value = value.strip()
+            if key == 'set-cookie':
+                name, _, rest = value.partition('=')
+                self.cookies[name] = rest.split(';', 1)[0]
+            headers[key] = value
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            data = b''.join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, data
+
+
+class LoadTest:
+    def __init__(self, args):
+        url = urlsplit(args.url)
+        self.host = url.hostname
+        self.port = url.port or 80
+        self.args = args
+        self.stats = {}
+        self.deadline = 0.0
+
+    def route_stats(self, route):
+        if route not in self.stats:
+            self.stats[route] = RouteStats()
+        return self.stats[route]
+
+    async def call(self, conn, route, method, path, body=None):
+        start = time.perf_counter()
+        try:
+            status, data = await conn.request(method, path, body)
+            ok = status < 400
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            await conn.close()
+            status, data, ok = 0, b'', False
+        self.route_stats(route).record(time.perf_counter() - start, ok)
+        return status, data
+
+    async def think(self, seconds):
+        remaining = self.deadline - time.perf_counter()
+        await asyncio.sleep(max(0.0, min(seconds * random.uniform(0.5, 1.5), remaining)))
+
+    async def page_load(self, conn):
+        status, data = await self.call(conn, 'GET /', 'GET', '/')
+        assets = ASSET_PATTERN.findall(data.decode('utf-8', 'replace')) or ['/static/js/main.js']
+        for asset in dict.fromkeys(assets):
+            await self.call(conn, 'GET /static/<asset>', 'GET', asset)
+
+    async def player(self, index):
+        args = self.args
+        conn = Connection(self.host, self.port, args.timeout)
+        name = f"{random.choice(PLAYER_NAMES)}{index}"
+        try:
+            await self.think(args.ramp_up * index / max(1, args.users))
+            while time.perf_counter() < self.deadline:
+                await self.page_load(conn)
+                await self.call(conn, 'GET /api/player', 'GET', '/api/player')
+                await self.call(conn, 'POST /api/player', 'POST', '/api/player', {'name': name})
+                await self.call(conn, 'GET /api/highscores', 'GET', '/api/highscores')
+
+                game_end = time.perf_counter() + args.game_length * random.uniform(0.5, 1.5)
+                while time.perf_counter() < min(game_end, self.deadline):
+                    await self.think(args.poll_interval)
+                    await self.call(conn, 'GET /api/highscores', 'GET', '/api/highscores')
+
+                if time.perf_counter() >= self.deadline:
+                    break
+                await self.call(conn, 'POST /api/highscores', 'POST', '/api/highscores',
+                                {'name': name, 'score': random.randint(0, 1500)})
+                await self.call(conn, 'GET /api/highscores', 'GET', '/api/highscores')
+                await self.think(args.think_time)
+        finally:
+            await conn.close()
+
+    async def run(self):
+        start = time.perf_counter()
+        self.deadline = start + self.args.duration
+        await asyncio.gather(*(self.player(i) for i in range(self.args.users)))
+        elapsed = time.perf_counter() - start
+        routes = {route: stats.summary(elapsed) for route, stats in sorted(self.stats.items())}
+        totals = RouteStats()
+        for stats in self.stats.values():
+            totals.latencies.extend(stats.latencies)
+            totals.errors += stats.errors
+        return {
+            'config': {key: getattr(self.args, key) for key in
+                       ('url', 'users', 'duration', 'ramp_up', 'poll_interval', 'game_length', 'think_time')},
+            'elapsed': elapsed,
+            'total': totals.summary(elapsed),
+            'routes': routes,
+        }
+
+
+def print_report(report):
+    print(f"{'route':<26} {'reqs':>7} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'errors':>7}")
+    rows = list(report['routes'].items()) + [('TOTAL', report['total'])]
+    for route, s in rows:
+        print(f"{route:<26} {s['requests']:>7} {s['throughput']:>8.1f} {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} "
+              f"{s['p99_ms']:>8.1f} {s['max_ms']:>8.1f} {s['error_rate']:>6.1%}")
+
+    print("\nlatency histogram (all routes)")
+    histogram = report['total']['histogram']
+    peak = max(histogram) or 1
+    labels = [f"<= {b} ms" for b in BUCKETS_MS] + [f"> {BUCKETS_MS[-1]} ms"]
+    for label, count in zip(labels, histogram):
+        print(f"{label:>12} {count:>8} {'#' * int(40 * count / peak)}")
+
+
+def compare(report, baseline, threshold, min_delta_ms):
+    regressions = []
+    for route, base in baseline['routes'].items():
+        current = report['routes'].get(route)
+        if current is None:
+            regressions.append(f"{route}: missing from this run")
+            continue
+        for key in ('p95_ms', 'p99_ms'):
+            limit = base[key] * (1 + threshold)
+            if current[key] > limit and current[key] - base[key] > min_delta_ms:
+                regressions.append(f"{route}: {key} {current[key]:.1f} > {limit:.1f} (baseline {base[key]:.1f})")
+        if current['error_rate'] > base['error_rate'] + threshold / 10:
+            regressions.append(f"{route}: error rate {current['error_rate']:.1%} (baseline {base['error_rate']:.1%})")
+    return regressions
+
+
+def is_local(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a mix of Echo Weaver player traffic against a local server")
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--users', type=int, default=500, help="concurrent simulated players")
+    parser.add_argument('--duration', type=float, default=60.0, help="seconds to run")
+    parser.add_argument('--ramp-up', type=float, default=10.0, help="seconds over which players join")
+    parser.add_argument('--poll-interval', type=float, default=5.0, help="seconds between leaderboard polls")
+    parser.add_argument('--game-length', type=float, default=30.0, help="average seconds per game")
+    parser.add_argument('--think-time', type=float, default=3.0, help="average pause between games")
+    parser.add_argument('--timeout', type=float, default=10.0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json-out', help="write the report to this file (use it as a baseline)")
+    parser.add_argument('--compare', help="baseline JSON to compare against; exits 1 on regression")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed relative latency increase")
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help="ignore regressions smaller than this")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    host = urlsplit(args.url).hostname
+    if not is_local(host):
+        parser.error(f"refusing to load-test non-local host {host!r}")
+
+    report = asyncio.run(LoadTest(args).run())
+    print_report(report)
+
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nwrote {args.json_out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print("\nREGRESSIONS")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nno regressions against {args.compare}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
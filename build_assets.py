@@ -0,0 +1,437 @@
+import os
+import re
+import sys
+import json
+import gzip
+import shutil
+import hashlib
+import argparse
+import subprocess
+import wave
+
+from assets import BUNDLE_DIR, MANIFEST_FILE, SOUND_DIR
+from config import BASE_DIR
+
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+SCRIPT_DIR = os.path.join(STATIC_DIR, 'js')
+ENTRY_TEMPLATE = os.path.join(BASE_DIR, 'templates', 'index.html')
+BUNDLE_NAME = 'app.js'
+SPRITE_NAME = 'effects'
+# Silence between effects so a decoder's overlap never bleeds into the neighbour.
+SPRITE_GAP = 0.05
+OPUS_BITRATE = '64k'
+
+# Files that only make sense during development: the localStorage API stand-in,
+# the superseded touch controls and the old standalone boss class (BossEnemy
+# now lives in enemy.js, so bundling it would redeclare the class).
+DEV_ONLY = {'mock_api.js', 'mobile_controls.js', 'boss_enemy.js'}
+
+# Matches both url_for('static', filename='js/x.js') tags and the
+# '/static/js/x.js?...' URL of the dynamically inserted universal controls.
+SCRIPT_REF = re.compile(r"""(?:filename=['"]|/static/)js/([\w.-]+\.js)""")
+
+KEYWORDS_BEFORE_EXPRESSION = {
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+}
+BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+def resolve_scripts(template_path=ENTRY_TEMPLATE):
+    with open(template_path, encoding='utf-8') as f:
+        html = f.read()
+    order = []
+    for name in SCRIPT_REF.findall(html):
+        if name not in order:
+            order.append(name)
+    # The template loads universal_controls.js after the DOM is parsed, but
+    # main.js only touches it from its DOMContentLoaded handler, so keeping it
+    # just before main.js preserves the order the game code relies on.
+    return order
+
+
+def minify(source):
+    """Strip comments and indentation while keeping every statement on its own line.
+
+    Returns the minified lines as (text, original_line, original_column) so a
+    line-based source map can point back at the input. Strings, template
+    literals (including ${} nesting) and regular expression literals are copied
+    verbatim.
+    """
+    lines = []
+    current = []
+    origin = None
+    pending_space = False
+    line, column = 0, 0
+    i, n = 0, len(source)
+    template_depths = []
+    brace_depth = 0
+    last_token = ''
+
+    def emit(text, at_line, at_column):
+        nonlocal origin, pending_space
+        if origin is None:
+            origin = (at_line, at_column)
+        elif pending_space:
+            current.append(' ')
+        pending_space = False
+        current.append(text)
+
+    def newline():
+        nonlocal current, origin, pending_space
+        if origin is not None:
+            lines.append((''.join(current), origin[0], origin[1]))
+        current = []
+        origin = None
+        pending_space = False
+
+    def advance(text):
+        nonlocal line, column
+        newlines = text.count('\n')
+        if newlines:
+            line += newlines
+            column = len(text) - text.rfind('\n') - 1
+        else:
+            column += len(text)
+
+    def scan_string(start, quote):
+        j = start + 1
+        while j < n and source[j] != quote:
+            j += 2 if source[j] == '\\' else 1
+        return j + 1
+
+    def scan_template(start):
+        # Returns the end of the literal chunk and whether it stopped at ${.
+        j = start
+        while j < n:
+            if source[j] == '\\':
+                j += 2
+            elif source[j] == '`':
+                return j + 1, False
+            elif source.startswith('${', j):
+                return j + 2, True
+            else:
+                j += 1
+        return j, False
+
+    def scan_regex(start):
+        j = start + 1
+        in_class = False
+        while j < n:
+            c = source[j]
+            if c == '\\':
+                j += 2
+                continue
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                j += 1
+                break
+            elif c == '\n':
+                raise ValueError(f"unterminated regular expression at line {line + 1}")
+            j += 1
+        while j < n and (source[j].isalnum() or source[j] == '_'):
+            j += 1
+        return j
+
+    def emit_literal(text):
+        # Literals may span lines (template strings); keep those lines intact.
+        start_line, start_column = line, column
+        parts = text.split('\n')
+        emit(parts[0], start_line, start_column)
+        for offset, part in enumerate(parts[1:], 1):
+            newline()
+            emit(part, start_line + offset, 0)
+        advance(text)
+
+    def regex_allowed():
+        if not last_token:
+            return True
+        if last_token[-1].isalnum() or last_token[-1] in '_$':
+            return last_token in KEYWORDS_BEFORE_EXPRESSION
+        return last_token not in (')', ']', '}')
+
+    while i < n:
+        c = source[i]
+        if c == '\n':
+            newline()
+            advance(c)
+            i += 1
+        elif c in ' \t\r':
+            if current:
+                pending_space = True
+            advance(c)
+            i += 1
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            end = n if end == -1 else end
+            pending_space = bool(current)
+            advance(source[i:end])
+            i = end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            if end == -1:
+                raise ValueError(f"unterminated comment at line {line + 1}")
+            comment = source[i:end + 2]
+            if '\n' in comment:
+                newline()
+            else:
+                pending_space = bool(current)
+            advance(comment)
+            i = end + 2
+        elif c in '"\'':
+            end = scan_string(i, c)
+            emit_literal(source[i:end])
+            last_token = c
+            i = end
+        elif c == '`' or (c == '}' and template_depths and template_depths[-1] == brace_depth):
+            if c == '}':
+                template_depths.pop()
+            end, interpolates = scan_template(i + 1)
+            emit_literal(source[i:end])
+            if interpolates:
+                template_depths.append(brace_depth)
+                last_token = '{'
+            else:
+                last_token = '`'
+            i = end
+        elif c == '/' and regex_allowed():
+            end = scan_regex(i)
+            emit_literal(source[i:end])
+            last_token = '/'
+            i = end
+        elif c.isalnum() or c in '_$':
+            j = i
+            while j < n and (source[j].isalnum() or source[j] in '_$'):
+                j += 1
+            word = source[i:j]
+            emit(word, line, column)
+            advance(word)
+            last_token = word
+            i = j
+        else:
+            if c == '{':
+                brace_depth += 1
+            elif c == '}':
+                brace_depth -= 1
+            emit(c, line, column)
+            advance(c)
+            last_token = c
+            i += 1
+    newline()
+    return lines
+
+
+def _vlq(value):
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    encoded = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        if value:
+            digit |= 32
+        encoded += BASE64[digit]
+        if not value:
+            return encoded
+
+
+def build_bundle(scripts):
+    output = []
+    mappings = []
+    previous = (0, 0, 0)
+    for index, name in enumerate(scripts):
+        with open(os.path.join(SCRIPT_DIR, name), encoding='utf-8') as f:
+            lines = minify(f.read())
+        if lines and not lines[-1][0].endswith(';'):
+            # Guard the next file against being parsed as a continuation.
+            text, src_line, src_column = lines[-1]
+            lines[-1] = (text + ';', src_line, src_column)
+        for text, src_line, src_column in lines:
+            output.append(text)
+            segment = (index, src_line, src_column)
+            mappings.append('A' + ''.join(_vlq(now - before) for now, before in zip(segment, previous)))
+            previous = segment
+    code = '\n'.join(output) + '\n'
+    source_map = {
+        'version': 3,
+        'sources': [f'../js/{name}' for name in scripts],
+        'names': [],
+        'mappings': ';'.join(mappings),
+    }
+    return code, source_map
+
+
+def check_syntax(path):
+    node = shutil.which('node')
+    if node is None:
+        print("node not found, skipping syntax check")
+        return True
+    result = subprocess.run([node, '--check', path], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr.strip())
+    return result.returncode == 0
+
+
+def write_atomic(path, data):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data if isinstance(data, bytes) else data.encode('utf-8'))
+    os.replace(tmp, path)
+
+
+def build_scripts(out_dir=os.path.join(STATIC_DIR, BUNDLE_DIR)):
+    referenced = resolve_scripts()
+    scripts = [name for name in referenced if name not in DEV_ONLY]
+    code, source_map = build_bundle(scripts)
+
+    digest = hashlib.sha256(code.encode('utf-8')).hexdigest()[:10]
+    stem, ext = os.path.splitext(BUNDLE_NAME)
+    bundle_file = f'{stem}.{digest}{ext}'
+    source_map['file'] = bundle_file
+
+    os.makedirs(out_dir, exist_ok=True)
+    bundle_path = os.path.join(out_dir, bundle_file)
+    write_atomic(bundle_path, code + f'//# sourceMappingURL={bundle_file}.map\n')
+    write_atomic(bundle_path + '.map', json.dumps(source_map))
+    if not check_syntax(bundle_path):
+        os.remove(bundle_path)
+        os.remove(bundle_path + '.map')
+        return None
+
+    for stale in os.listdir(out_dir):
+        if stale.startswith(f'{stem}.') and stale not in (bundle_file, bundle_file + '.map'):
+            os.remove(os.path.join(out_dir, stale))
+    manifest = {BUNDLE_NAME: f'{BUNDLE_DIR}/{bundle_file}'}
+    write_atomic(os.path.join(out_dir, os.path.basename(MANIFEST_FILE)), json.dumps(manifest, indent=2) + '\n')
+    return {'scripts': scripts, 'path': bundle_path, 'code': code}
+
+
+def transcode_opus(wav_path, ogg_path):
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        print("ffmpeg not found, serving the WAV sprite only")
+        return False
+    result = subprocess.run([ffmpeg, '-y', '-loglevel', 'error', '-i', wav_path,
+                             '-c:a', 'libopus', '-b:a', OPUS_BITRATE, ogg_path],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"ffmpeg could not encode Opus, serving the WAV sprite only: {result.stderr.strip()}")
+        if os.path.exists(ogg_path):
+            os.remove(ogg_path)
+        return False
+    return True
+
+
+def build_audio(sound_dir=SOUND_DIR):
+    names = sorted(name[:-4] for name in os.listdir(sound_dir) if name.endswith('.wav'))
+    params = None
+    frames = []
+    sounds = {}
+    offset = 0
+    for name in names:
+        with wave.open(os.path.join(sound_dir, f'{name}.wav'), 'rb') as f:
+            current = (f.getnchannels(), f.getsampwidth(), f.getframerate())
+            if params is None:
+                params = current
+            elif current != params:
+                raise ValueError(f"{name}.wav is {current}, expected {params} (channels, sample width, rate)")
+            data = f.readframes(f.getnframes())
+        channels, width, rate = params
+        count = len(data) // (channels * width)
+        sounds[name] = {'start': round(offset / rate, 6), 'duration': round(count / rate, 6)}
+        gap = int(rate * SPRITE_GAP)
+        frames.extend([data, b'\0' * gap * channels * width])
+        offset += count + gap
+    pcm = b''.join(frames)
+
+    digest = hashlib.sha256(pcm).hexdigest()[:10]
+    out_dir = os.path.join(sound_dir, BUNDLE_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    wav_file = f'{SPRITE_NAME}.{digest}.wav'
+    ogg_file = f'{SPRITE_NAME}.{digest}.ogg'
+    wav_path = os.path.join(out_dir, wav_file)
+    tmp = f'{wav_path}.{os.getpid()}.tmp'
+    with wave.open(tmp, 'wb') as f:
+        f.setnchannels(params[0])
+        f.setsampwidth(params[1])
+        f.setframerate(params[2])
+        f.writeframes(pcm)
+    os.replace(tmp, wav_path)
+
+    sprite = {'audio/wav': f'{BUNDLE_DIR}/{wav_file}'}
+    if transcode_opus(wav_path, os.path.join(out_dir, ogg_file)):
+        sprite['audio/ogg'] = f'{BUNDLE_DIR}/{ogg_file}'
+
+    keep = {os.path.basename(path) for path in sprite.values()}
+    for stale in os.listdir(out_dir):
+        if stale.startswith(f'{SPRITE_NAME}.') and stale not in keep:
+            os.remove(os.path.join(out_dir, stale))
+    manifest = {
+        'version': digest,
+        'channels': params[0],
+        'sample_width': params[1],
+        'sample_rate': params[2],
+        'sprite': sprite,
+        'sounds': sounds,
+    }
+    write_atomic(os.path.join(sound_dir, MANIFEST_FILE), json.dumps(manifest, indent=2) + '\n')
+    return {'names': names, 'dir': sound_dir, 'manifest': manifest}
+
+
+def _sizes(data):
+    return len(data), len(gzip.compress(data, 9))
+
+
+def report_scripts(result):
+    def read(name):
+        with open(os.path.join(SCRIPT_DIR, name), 'rb') as f:
+            return f.read()
+
+    all_files = sorted(name for name in os.listdir(SCRIPT_DIR) if name.endswith('.js'))
+    before_raw = sum(_sizes(read(name))[0] for name in all_files)
+    loaded = result['scripts']
+    loaded_raw, loaded_gzip = map(sum, zip(*(_sizes(read(name)) for name in loaded)))
+    bundle_raw, bundle_gzip = _sizes(result['code'].encode('utf-8'))
+
+    print(f"bundled {len(loaded)} scripts into {os.path.relpath(result['path'], BASE_DIR)}")
+    skipped = [name for name in all_files if name not in loaded]
+    if skipped:
+        print(f"not bundled: {', '.join(skipped)}")
+    print(f"{'':<22} {'requests':>9} {'bytes':>9} {'gzip':>9}")
+    print(f"{'static/js (all files)':<22} {len(all_files):>9} {before_raw:>9} {'':>9}")
+    print(f"{'before (page scripts)':<22} {len(loaded):>9} {loaded_raw:>9} {loaded_gzip:>9}")
+    print(f"{'after (bundle)':<22} {1:>9} {bundle_raw:>9} {bundle_gzip:>9}")
+
+
+def report_audio(result):
+    sound_dir = result['dir']
+    before = sum(os.path.getsize(os.path.join(sound_dir, f'{name}.wav')) for name in result['names'])
+    print(f"packed {len(result['names'])} effects into one sprite")
+    print(f"{'':<22} {'requests':>9} {'bytes':>9}")
+    print(f"{'before (wav files)':<22} {len(result['names']):>9} {before:>9}")
+    for mimetype, path in result['manifest']['sprite'].items():
+        size = os.path.getsize(os.path.join(sound_dir, path))
+        print(f"{'after (' + mimetype + ')':<22} {1:>9} {size:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle static/js into static/dist and pack assets/sounds into a sprite")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    scripts = build_scripts()
+    if scripts is None:
+        print("bundle failed the syntax check, manifest left unchanged")
+        return 1
+    audio = build_audio()
+    if not args.quiet:
+        report_scripts(scripts)
+        print()
+        report_audio(audio)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+import os
+import re
+import io
+import ast
+import sys
+import glob
+import shutil
+import zipfile
+import argparse
+import tempfile
+import subprocess
+
+from build_assets import write_atomic
+from config import BASE_DIR
+
+PYGBAG_DIR = os.path.join(BASE_DIR, 'static', 'pygbag')
+APK_PATH = os.path.join(PYGBAG_DIR, 'echo_weaver.apk')
+ENTRY_MODULE = 'main'
+# pygbag runs the entry point with runpy, so it has to stay source.
+SOURCE_MODULES = {ENTRY_MODULE}
+# Fixed timestamp so an unchanged tree rebuilds to a byte-identical archive.
+ZIP_DATE = (2025, 1, 1, 0, 0, 0)
+
+# pygbag converts each sound to <name>-pygbag.ogg and ships it as <name>.ogg;
+# the game's other assets are drawn at runtime.
+GAME_ASSETS = ['assets/sounds/*-pygbag.ogg']
+
+# Runs under the interpreter the browser uses: bytecode is version specific.
+# Unchecked-hash pycs carry no timestamp, so rebuilds are reproducible.
+COMPILE = '''
+import sys, py_compile
+args = sys.argv[1:]
+for source, dfile, cfile in zip(args[::3], args[1::3], args[2::3]):
+    py_compile.compile(source, cfile, dfile, doraise=True, optimize=2,
+                       invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+'''
+
+
+def target_python(template=os.path.join(PYGBAG_DIR, 'index.html')):
+    with open(template, encoding='utf-8') as f:
+        match = re.search(r'data-python=python(\d+)\.(\d+)', f.read())
+    return int(match.group(1)), int(match.group(2))
+
+
+def module_imports(path):
+    """Return (eager, lazy) top-level module names imported by a source file.
+
+    Imports inside functions only run when the function does, so the modules
+    they name are still bundled but can load after the first frame.
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    eager, lazy = set(), set()
+
+    def visit(node, nested):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.Import):
+                names = [alias.name for alias in child.names]
+            elif isinstance(child, ast.ImportFrom) and not child.level:
+                names = [child.module]
+            else:
+                visit(child, nested or isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)))
+                continue
+            (lazy if nested else eager).update(name.split('.')[0] for name in names)
+
+    visit(tree, False)
+    return eager, lazy
+
+
+def resolve_modules(root=BASE_DIR, entry=ENTRY_MODULE):
+    """Walk the import graph from the entry module over the project's own files.
+
+    Returns {module: 'eager' | 'lazy'}; a module is eager if any chain of
+    top-level imports reaches it from the entry point.
+    """
+    modules = {}
+    pending = [(entry, 'eager')]
+    while pending:
+        name, kind = pending.pop()
+        if modules.get(name) == 'eager' or modules.get(name) == kind:
+            continue
+        modules[name] = kind
+        eager, lazy = module_imports(os.path.join(root, name + '.py'))
+        for imported in eager | lazy:
+            if os.path.isfile(os.path.join(root, imported + '.py')):
+                pending.append((imported, 'eager' if kind == 'eager' and imported in eager else 'lazy'))
+    return modules
+
+
+def find_python(version):
+    name = 'python{}.{}'.format(*version)
+    if sys.version_info[:2] == version:
+        return sys.executable
+    return shutil.which(name)
+
+
+def stage(target, root=BASE_DIR, python=None):
+    """Lay out the bundle contents under target, as the archive's assets/ folder.
+
+    With python set, every module but the entry point is written as sourceless
+    bytecode compiled by that interpreter; otherwise sources are copied.
+    """
+    modules = resolve_modules(root)
+    compiled = []
+    for name in sorted(modules):
+        source = os.path.join(root, name + '.py')
+        if python is None or name in SOURCE_MODULES:
+            shutil.copy(source, os.path.join(target, name + '.py'))
+        else:
+            compiled += [source, f'assets/{name}.py', os.path.join(target, name + '.pyc')]
+    if compiled:
+        subprocess.run([python, '-c', COMPILE] + compiled, check=True)
+    for pattern in GAME_ASSETS:
+        for path in glob.glob(os.path.join(root, pattern)):
+            relative = os.path.relpath(path, root).replace(os.sep, '/').replace('-pygbag.', '.')
+            os.makedirs(os.path.dirname(os.path.join(target, relative)), exist_ok=True)
+            shutil.copy(path, os.path.join(target, relative))
+    return modules
+
+
+def pack(folder):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as apk:
+        for directory, dirs, files in sorted(os.walk(folder)):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(directory, name)
+                info = zipfile.ZipInfo('assets/' + os.path.relpath(path, folder).replace(os.sep, '/'), ZIP_DATE)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with open(path, 'rb') as f:
+                    apk.writestr(info, f.read(), compresslevel=9)
+    return buffer.getvalue()
+
+
+def build_game(apk_path=APK_PATH, python=None):
+    with tempfile.TemporaryDirectory() as folder:
+        modules = stage(folder, python=python)
+        data = pack(folder)
+    previous = os.path.getsize(apk_path) if os.path.exists(apk_path) else None
+    write_atomic(apk_path, data)
+    with zipfile.ZipFile(apk_path) as apk:
+        members = [(info.filename, info.file_size, info.compress_size) for info in apk.infolist()]
+    return {'apk': apk_path, 'size': len(data), 'previous': previous, 'modules': modules, 'members': members}
+
+
+def report_game(result):
+    lazy = sorted(name for name, kind in result['modules'].items() if kind == 'lazy')
+    print(f"{os.path.relpath(result['apk'], BASE_DIR)}: {len(result['members'])} files, {result['size']:,} B"
+          + (f" (was {result['previous']:,} B)" if result['previous'] is not None else ''))
+    print(f"  {len(result['modules'])} modules from {ENTRY_MODULE}.py, imported after the first frame: {', '.join(lazy) or 'none'}")
+    for name, size, compressed in result['members']:
+        print(f"  {name:<42} {size:>8,} B  {compressed:>7,} B deflated")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the pygbag archive from the game modules main.py imports")
+    parser.add_argument('--python', help="interpreter matching the browser runtime (default: pythonX.Y from the template)")
+    parser.add_argument('--source', action='store_true', help="ship .py sources instead of precompiled bytecode")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    python = None
+    if not args.source:
+        version = target_python()
+        python = args.python or find_python(version)
+        if python is None:
+            print("python{}.{} not found; pass --python or build with --source".format(*version))
+            return 1
+    result = build_game(python=python)
+    if not args.quiet:
+        report_game(result)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import os
+import secrets
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+INSTANCE_DIR = os.path.join(BASE_DIR, 'instance')
+SECRET_KEY_FILE = os.path.join(INSTANCE_DIR, 'secret_key')
+
+DEFAULTS = {
+    'SECRET_KEY': None,
+    'HIGHSCORE_FILE': os.path.join(BASE_DIR, 'highscores', 'highscores.json'),
+    'LEADERBOARD_MAX_SUBSCRIBERS': 0,
+    'LEADERBOARD_HEARTBEAT': 15,
+    'ASSET_BUNDLES': True,
+}
+
+# Defaults that differ when serving through asgi_app: a stream listener is a
+# parked coroutine there rather than a worker thread.
+ASGI_DEFAULTS = {
+    'LEADERBOARD_MAX_SUBSCRIBERS': 1000,
+}
+
+
+def load_config(config=None, defaults=None):
+    """Settings for either serving mode, resolved the same way.
+
+    DEFAULTS, then the mode's own defaults, then FLASK_-prefixed environment
+    variables (values are JSON-decoded, as Flask does), then config.
+    """
+    from flask import Config
+
+    settings = Config(BASE_DIR)
+    settings.from_mapping(DEFAULTS)
+    if defaults is not None:
+        settings.from_mapping(defaults)
+    settings.from_prefixed_env()
+    if config is not None:
+        settings.from_mapping(config)
+    if not settings['SECRET_KEY']:
+        settings['SECRET_KEY'] = load_secret_key()
+    return settings
+
+
+def load_secret_key(path=SECRET_KEY_FILE):
+    try:
+        with open(path) as f:
+            key = f.read().strip()
+        if key:
+            return key
+    except FileNotFoundError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(secrets.token_hex(32))
+    os.chmod(tmp_path, 0o600)
+    try:
+        os.link(tmp_path, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.remove(tmp_path)
+
+    with open(path) as f:
+        return f.read().strip()
@@ -17,6 +17,7 @@ class DamageNumber(pygame.sprite.Sprite):
         self.font = pygame.font.Font(None, self.font_size)
 
         self._update_image()
+        self.previous_center = self.rect.center
 
     def _update_image(self):
         text_surface = self.font.render(str(self.value), True, self.color)
@@ -28,6 +29,7 @@ class DamageNumber(pygame.sprite.Sprite):
         self.image.set_alpha(alpha)
 
     def update(self):
+        self.previous_center = self.rect.center
         self.position += self.velocity
         self.lifetime -= 1
         if self.lifetime <= 0:
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+from importlib.metadata import version
+
+
+def take_inventory(root, instance_path, template_folder, static_folder):
+    """Snapshot of the install, taken once per process when the app starts."""
+
+    def exists(*parts):
+        return os.path.exists(os.path.join(root, *parts))
+
+    def listing(*parts):
+        path = os.path.join(root, *parts)
+        return sorted(os.listdir(path)) if os.path.isdir(path) else []
+
+    return {
+        'current_working_directory': os.getcwd(),
+        'python_version': sys.version,
+        'flask_version': version('flask'),
+        'app_root_path': root,
+        'app_instance_path': instance_path,
+        'app_template_folder': template_folder,
+        'app_static_folder': static_folder,
+        'templates_dir_exists': exists('templates'),
+        'static_dir_exists': exists('static'),
+        'index_template_exists': exists('templates', 'index.html'),
+        'play_template_exists': exists('templates', 'play.html'),
+        'app_py_exists': exists('app.py'),
+        'wsgi_py_exists': exists('wsgi.py'),
+        'requirements_exists': exists('requirements.txt'),
+        'directory_contents': {
+            'root': listing(),
+            'templates': listing('templates'),
+            'static': listing('static'),
+        },
+        'inventory_taken_at': time.time(),
+    }
+
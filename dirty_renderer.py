@@ -0,0 +1,120 @@
+import pygame
+
+# Above this share of the screen, one full flip is cheaper than pushing many
+# small rectangles (each update() rect is a separate canvas copy under pygbag).
+FULL_REDRAW_THRESHOLD = 0.5
+MAX_DIRTY_RECTS = 150
+# Past this many drawn rects, merging them costs more than a full flip saves.
+MAX_DRAWN_RECTS = 1000
+DIRTY_TILE = 16
+
+
+def merge_rects(rects, bounds, tile=DIRTY_TILE):
+    """Snap rects to a tile grid and return the covered area as few rects.
+
+    Trails and particles produce thousands of overlapping rects per frame;
+    pairwise merging is quadratic in that, marking tiles is linear. Each tile
+    row is a bit mask, runs of set bits become rects, and identical runs in
+    consecutive rows are joined vertically.
+    """
+    right_edge, bottom_edge = bounds.right, bounds.bottom
+    rows = [0] * ((bottom_edge + tile - 1) // tile)
+    for x, y, w, h in rects:
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + w, right_edge), min(y + h, bottom_edge)
+        if right <= left or bottom <= top:
+            continue
+        mask = (1 << ((right - 1) // tile + 1)) - (1 << (left // tile))
+        for row in range(top // tile, (bottom - 1) // tile + 1):
+            rows[row] |= mask
+
+    merged = []
+    open_runs = {}
+    for row, mask in enumerate(rows):
+        runs = {}
+        column = 0
+        while mask:
+            if mask & 1:
+                start = column
+                while mask & 1:
+                    mask >>= 1
+                    column += 1
+                rect = open_runs.get((start, column))
+                if rect is None:
+                    rect = pygame.Rect(start * tile, row * tile, (column - start) * tile, tile)
+                    merged.append(rect)
+                else:
+                    rect.height += tile
+                runs[(start, column)] = rect
+            else:
+                mask >>= 1
+                column += 1
+        open_runs = runs
+    return [rect.clip(bounds) for rect in merged]
+
+
+class DirtyRenderer:
+    """Redraws and presents only the parts of the screen that changed.
+
+    The game redraws its whole scene every frame and hands present() the rect
+    of everything it drew: sprites, the core, messages and HUD. begin() paints
+    the background back over what was drawn last frame, and present() pushes
+    both areas to the display, so moved and killed sprites are erased without
+    tracking each one. Drawn areas are kept merged into a handful of tile
+    rects, which keeps clearing cheap however many particles are on screen.
+    """
+
+    def __init__(self, screen, threshold=FULL_REDRAW_THRESHOLD, max_rects=MAX_DIRTY_RECTS,
+                 max_drawn=MAX_DRAWN_RECTS):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.threshold = threshold
+        self.max_rects = max_rects
+        self.max_drawn = max_drawn
+        self.background = None
+        self.full_redraw = True
+        self.drawn = []
+        self.frames = 0
+        self.full_frames = 0
+        self.presented_area = 0
+
+    def set_background(self, background):
+        if background is not self.background:
+            self.background = background
+            self.full_redraw = True
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def begin(self):
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            return
+        for rect in self.drawn:
+            self.screen.blit(self.background, rect, rect)
+
+    def present(self, rects):
+        screen_rect = self.screen_rect
+        screen_area = screen_rect.width * screen_rect.height
+        if len(rects) > self.max_drawn:
+            # A busy frame is likely followed by another, so the next one
+            # starts from a full background blit rather than many small ones.
+            self.drawn = []
+            crowded = True
+        else:
+            drawn = merge_rects(rects, screen_rect)
+            dirty = merge_rects(drawn + self.drawn, screen_rect)
+            self.drawn = drawn
+            area = sum(rect.width * rect.height for rect in dirty)
+            crowded = len(dirty) > self.max_rects or area > self.threshold * screen_area
+        full = self.full_redraw or crowded
+        if full:
+            pygame.display.flip()
+            self.full_frames += 1
+            area = screen_area
+        else:
+            pygame.display.update(dirty)
+        self.full_redraw = crowded
+        self.frames += 1
+        self.presented_area += area
+        return full
@@ -0,0 +1,487 @@
+import pygame
+import random
+import math
+from settings import *
+
+try:
+    import numpy as np
+except ImportError: # The pygbag build ships without NumPy; see ListEnemyStore
+    np = None
+
+# Enemy type ids. The names are the classes each kind used to be, so traces
+# and messages read the same as before the store.
+BASIC, ZIGZAG, GHOST, CHARGER, SPLITTER, SHIELDED, HEALER, SPAWNER, DISRUPTOR = range(9)
+KIND_NAMES = ('Enemy', 'ZigzagEnemy', 'GhostEnemy', 'ChargerEnemy', 'SplitterEnemy', 'ShieldedEnemy',
+              'HealerEnemy', 'SpawnerEnemy', 'DisruptorEnemy')
+KIND_COLORS = (RED, GREEN, GHOST_ENEMY_COLOR, CHARGER_ENEMY_COLOR, SPLITTER_ENEMY_COLOR, SHIELDED_ENEMY_COLOR,
+               HEALER_ENEMY_COLOR, SPAWNER_ENEMY_COLOR, DISRUPTOR_ENEMY_COLOR)
+# Hits each kind takes before it is defeated; only ghosts and shields count down.
+KIND_HP = {GHOST: GHOST_ENEMY_HITS_REQUIRED, SHIELDED: SHIELDED_ENEMY_SHIELD_HEALTH}
+SPAWNER_KINDS = {'basic': BASIC, 'zigzag': ZIGZAG}
+
+ZIGZAG_FREQUENCY = 30
+ZIGZAG_AMPLITUDE = 5
+
+def draw_enemy_shape(surface, color, outline_color, radius, outline_width):
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    pygame.draw.circle(surface, outline_color, (radius, radius), radius, outline_width)
+
+def render_enemy(kind, radius, state):
+    """Draw one enemy sprite. state is the remaining ghost hits, whether a
+    shield is up or whether a charger is charging; other kinds ignore it."""
+    image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    if kind == CHARGER and state:
+        draw_enemy_shape(image, CHARGER_ENEMY_COLOR, YELLOW, radius, 3) # Yellow outline when charging
+    else:
+        draw_enemy_shape(image, KIND_COLORS[kind], WHITE, radius, 2)
+    if kind == GHOST:
+        for i in range(state):
+            pygame.draw.circle(image, YELLOW, (ENEMY_RADIUS + (i - (GHOST_ENEMY_HITS_REQUIRED - 1) / 2) * 8, ENEMY_RADIUS + ENEMY_RADIUS // 2), 3)
+    elif kind == SHIELDED and state:
+        pygame.draw.circle(image, SHIELDED_ENEMY_SHIELD_COLOR, (ENEMY_RADIUS, ENEMY_RADIUS), ENEMY_RADIUS + 5, 3)
+    return image
+
+
+class EnemyHandle:
+    """One enemy as gameplay code sees it: a row of an EnemyStore.
+
+    Handles of enemies killed this tick stay readable until the store's next
+    update(), which compacts the arrays.
+    """
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def kind(self):
+        return int(self.store.kind[self.index])
+
+    @property
+    def kind_name(self):
+        return KIND_NAMES[self.kind]
+
+    @property
+    def radius(self):
+        return float(self.store.radius[self.index])
+
+    @property
+    def rect(self):
+        return self.store.rect(self.index)
+
+    @property
+    def image(self):
+        return self.store.image(self.index)
+
+    @property
+    def hp(self):
+        return float(self.store.hp[self.index])
+
+    @hp.setter
+    def hp(self, value):
+        self.store.hp[self.index] = value
+
+    # The names gameplay code used for hp on ghosts and shielded enemies.
+    hits_remaining = shield_health = hp
+
+    @property
+    def charging(self):
+        return bool(self.store.charging[self.index])
+
+    def alive(self):
+        return self.index >= 0 and bool(self.store.alive[self.index])
+
+    def kill(self):
+        self.store.kill(self.index)
+
+    def split(self):
+        return self.store.split(self.index)
+
+
+class BaseEnemyStore:
+    """Every enemy in a wave, kept as parallel columns indexed by row.
+
+    Positions are rect centres and always whole pixels: each tick's movement
+    is truncated the way Rect.move_ip truncates, so enemies follow exactly
+    the paths the per-sprite classes did. Rows stay in spawn order, which is
+    also the order collisions are resolved in. Sprites share one cached image
+    per kind, size and state instead of owning a Surface each.
+
+    ArrayEnemyStore keeps the columns in NumPy arrays and updates them in
+    bulk; ListEnemyStore keeps Python lists for builds without NumPy. Both
+    do the same float operations in the same order, so a seeded game plays
+    out identically on either.
+    """
+
+    def __init__(self):
+        self.count = 0 # Rows in use, including enemies killed since the last update
+        self.live = 0
+        self.handles = []
+        self.images = {}
+        self.zigzag_sines = [] # sin(timer / frequency), computed with math.sin as the sprites did
+
+    def __len__(self):
+        return self.live
+
+    def __iter__(self):
+        return iter([handle for handle in self.handles if self.alive[handle.index]])
+
+    def spawn(self, kind, center=None, radius=ENEMY_RADIUS):
+        # Same random draws as the old sprite constructors, so seeded games
+        # play out identically even when the spawn point is overridden.
+        edge = random.choice(['top', 'bottom', 'left', 'right'])
+        if edge == 'top':
+            edge_point = (random.randint(0, WIDTH), 0)
+        elif edge == 'bottom':
+            edge_point = (random.randint(0, WIDTH), HEIGHT)
+        elif edge == 'left':
+            edge_point = (0, random.randint(0, HEIGHT))
+        else: # right
+            edge_point = (WIDTH, random.randint(0, HEIGHT))
+
+        x, y = center if center is not None else edge_point
+        self._add_row(kind, float(x), float(y), radius, KIND_HP.get(kind, 1))
+        self.count += 1
+        self.live += 1
+        handle = EnemyHandle(self, self.count - 1)
+        self.handles.append(handle)
+        return handle
+
+    def kill(self, index):
+        if index >= 0 and self.alive[index]:
+            self.alive[index] = False
+            self.live -= 1
+
+    def empty(self):
+        for handle in self.handles:
+            handle.index = -1
+        self.handles = []
+        self._clear()
+        self.count = self.live = 0
+
+    def compact(self):
+        if self.live == self.count:
+            return
+        keep = [index for index in range(self.count) if self.alive[index]]
+        self._keep_rows(keep)
+        for handle in self.handles:
+            handle.index = -1
+        self.handles = [self.handles[i] for i in keep]
+        for index, handle in enumerate(self.handles):
+            handle.index = index
+        self.count = len(keep)
+
+    def rect(self, index):
+        x, y = self.position[index]
+        size = int(self.size[index])
+        return pygame.Rect(int(x) - size // 2, int(y) - size // 2, size, size)
+
+    def image(self, index):
+        kind = int(self.kind[index])
+        if kind == GHOST:
+            state = max(int(self.hp[index]), 0)
+        elif kind == SHIELDED:
+            state = bool(self.hp[index] > 0)
+        else:
+            state = bool(self.charging[index])
+        key = (kind, float(self.radius[index]), state)
+        image = self.images.get(key)
+        if image is None:
+            image = self.images[key] = render_enemy(*key)
+        return image
+
+    def split(self, index):
+        # Returns the smaller enemies that replace a splitter
+        radius = float(self.radius[index])
+        new_enemies = []
+        if radius * SPLITTER_ENEMY_RADIUS_MULTIPLIER > 5: # Don't split if too small
+            center = tuple(self.position[index])
+            for _ in range(SPLITTER_ENEMY_COUNT):
+                new_enemies.append(self.spawn(SPLITTER, center, radius * SPLITTER_ENEMY_RADIUS_MULTIPLIER))
+        return new_enemies
+
+    def _zigzag_sine(self, timer):
+        table = self.zigzag_sines
+        for t in range(len(table), timer + 1):
+            table.append(math.sin(t / ZIGZAG_FREQUENCY))
+        return table[timer]
+
+    def _spawn_minions(self, index):
+        for _ in range(SPAWNER_ENEMY_SPAWN_COUNT):
+            self.spawn(SPAWNER_KINDS[SPAWNER_ENEMY_SPAWN_TYPE], tuple(self.position[index]))
+
+
+class ArrayEnemyStore(BaseEnemyStore):
+    COLUMNS = ('position', 'previous', 'velocity', 'radius', 'size', 'kind', 'hp', 'timer', 'charging', 'alive')
+
+    def __init__(self, capacity=64):
+        super().__init__()
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self.count
+        for name, dtype, shape in (
+            ('position', np.float64, (capacity, 2)),
+            ('previous', np.float64, (capacity, 2)), # position at the start of the tick, for drawing
+            ('velocity', np.float64, (capacity, 2)),
+            ('radius', np.float64, (capacity,)),
+            ('size', np.int32, (capacity,)),
+            ('kind', np.int8, (capacity,)),
+            ('hp', np.float64, (capacity,)),
+            ('timer', np.int32, (capacity,)),
+            ('charging', np.bool_, (capacity,)),
+            ('alive', np.bool_, (capacity,)),
+        ):
+            array = np.zeros(shape, dtype)
+            if old:
+                array[:old] = getattr(self, name)[:old]
+            setattr(self, name, array)
+
+    def __iter__(self):
+        return iter([self.handles[i] for i in np.flatnonzero(self.alive[:self.count])])
+
+    def _add_row(self, kind, x, y, radius, hp):
+        if self.count == len(self.alive):
+            self._allocate(len(self.alive) * 2)
+        i = self.count
+        self.position[i] = self.previous[i] = (x, y)
+        self.velocity[i] = 0
+        self.radius[i] = radius
+        self.size[i] = int(radius * 2)
+        self.kind[i] = kind
+        self.hp[i] = hp
+        self.timer[i] = 0
+        self.charging[i] = False
+        self.alive[i] = True
+
+    def _clear(self):
+        self.alive[:] = False
+
+    def _keep_rows(self, keep):
+        for name in self.COLUMNS:
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+        self.alive[len(keep):self.count] = False
+
+    def begin_tick(self):
+        # Called every tick, even while enemies are frozen, so drawing
+        # interpolates only across movement made during the tick.
+        self.previous[:self.count] = self.position[:self.count]
+
+    def update(self, core, speed, trails=None):
+        self.compact()
+        n = self.count
+        if not n:
+            return
+        kind = self.kind[:n]
+        position = self.position[:n]
+        timer = self.timer[:n]
+        timer += 1
+
+        # Home in on the core. Components are computed in the same order as
+        # Vector2.normalize_ip so the truncated steps match to the pixel.
+        core_x, core_y = core.rect.center
+        dx = core_x - position[:, 0]
+        dy = core_y - position[:, 1]
+        distance_squared = dx * dx + dy * dy
+        length = np.sqrt(distance_squared)
+        moving = length > 0
+        np.divide(dx, length, out=dx, where=moving)
+        np.divide(dy, length, out=dy, where=moving)
+
+        charging = (kind == CHARGER) & (distance_squared < CHARGER_ENEMY_CHARGE_DISTANCE ** 2)
+        self.charging[:n] = charging
+        step = np.where(charging, speed * CHARGER_ENEMY_CHARGE_SPEED_MULTIPLIER, speed)
+
+        velocity = self.velocity[:n]
+        velocity[:, 0] = dx
+        velocity[:, 1] = dy
+        zigzag = np.flatnonzero(kind == ZIGZAG)
+        if len(zigzag):
+            # Sideways sway along the perpendicular, (-y, x).
+            timers = timer[zigzag]
+            self._zigzag_sine(int(timers.max()))
+            sway = np.take(self.zigzag_sines, timers)
+            velocity[zigzag, 0] += -dy[zigzag] * sway * ZIGZAG_AMPLITUDE
+            velocity[zigzag, 1] += dx[zigzag] * sway * ZIGZAG_AMPLITUDE
+        velocity *= step[:, None]
+        position += np.trunc(velocity)
+
+        if trails is not None:
+            trails.add(position[:, 0].astype(np.int64).tolist(), position[:, 1].astype(np.int64).tolist(),
+                       (self.size[:n] // 2).tolist(), kind.tolist())
+
+        for i in np.flatnonzero((kind == HEALER) & (timer >= HEALER_ENEMY_HEAL_COOLDOWN)):
+            timer[i] = 0
+            self._heal_nearby(i)
+        for i in np.flatnonzero((kind == SPAWNER) & (timer >= SPAWNER_ENEMY_SPAWN_COOLDOWN)):
+            self.timer[i] = 0 # Spawning can reallocate the columns, leaving the timer view stale
+            self._spawn_minions(i)
+
+    def _heal_nearby(self, index):
+        n = self.count
+        offset = self.position[:n] - self.position[index]
+        nearby = ((self.kind[:n] == SHIELDED) & self.alive[:n]
+                  & (offset[:, 0] * offset[:, 0] + offset[:, 1] * offset[:, 1] < HEALER_ENEMY_HEAL_RADIUS ** 2))
+        self.hp[:n][nearby] = np.minimum(self.hp[:n][nearby] + HEALER_ENEMY_HEAL_AMOUNT, SHIELDED_ENEMY_SHIELD_HEALTH)
+
+    def pull(self, center, reach, strength):
+        # Wave magnet: drag live enemies within reach towards center.
+        n = self.count
+        offset = np.asarray(center, dtype=np.float64) - self.position[:n]
+        distance = np.sqrt(offset[:, 0] * offset[:, 0] + offset[:, 1] * offset[:, 1])
+        pulled = self.alive[:n] & (distance < reach) & (distance > 0)
+        offset = offset[pulled] / distance[pulled, None] * strength
+        self.position[:n][pulled] += np.trunc(offset)
+
+    def collide(self, rect):
+        """Live enemies whose rect overlaps rect, in spawn order (Rect.colliderect)."""
+        n = self.count
+        if not n or not rect.width or not rect.height:
+            return []
+        half = self.size[:n] // 2
+        left = self.position[:n, 0].astype(np.int64) - half
+        top = self.position[:n, 1].astype(np.int64) - half
+        size = self.size[:n]
+        hit = (self.alive[:n] & (size > 0)
+               & (left < rect.right) & (top < rect.bottom) & (left + size > rect.left) & (top + size > rect.top))
+        return [self.handles[i] for i in np.flatnonzero(hit)]
+
+    def within(self, center, radius):
+        """Live enemies whose centre is closer than radius to center, in spawn order."""
+        n = self.count
+        offset = self.position[:n] - np.asarray(center, dtype=np.float64)
+        distance = np.sqrt(offset[:, 0] * offset[:, 0] + offset[:, 1] * offset[:, 1])
+        return [self.handles[i] for i in np.flatnonzero(self.alive[:n] & (distance < radius))]
+
+    def draw(self, surface, alpha=1.0):
+        """Blit live enemies between their previous and current positions."""
+        live = np.flatnonzero(self.alive[:self.count])
+        previous = self.previous[live]
+        centers = np.round(previous + (self.position[live] - previous) * alpha).astype(np.int64)
+        half = self.size[live] // 2
+        return surface.blits([(self.image(i), (x - h, y - h))
+                              for i, (x, y), h in zip(live.tolist(), centers.tolist(), half.tolist())])
+
+
+class ListEnemyStore(BaseEnemyStore):
+    """The same store on plain lists, one row at a time."""
+
+    COLUMNS = ('position', 'previous', 'radius', 'size', 'kind', 'hp', 'timer', 'charging', 'alive')
+
+    def __init__(self):
+        super().__init__()
+        self._clear()
+
+    def _add_row(self, kind, x, y, radius, hp):
+        self.position.append([x, y])
+        self.previous.append([x, y])
+        self.radius.append(radius)
+        self.size.append(int(radius * 2))
+        self.kind.append(kind)
+        self.hp.append(hp)
+        self.timer.append(0)
+        self.charging.append(False)
+        self.alive.append(True)
+
+    def _clear(self):
+        for name in self.COLUMNS:
+            setattr(self, name, [])
+
+    def _keep_rows(self, keep):
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, [column[i] for i in keep])
+
+    def begin_tick(self):
+        self.previous = [list(position) for position in self.position]
+
+    def update(self, core, speed, trails=None):
+        self.compact()
+        n = self.count
+        if not n:
+            return
+        core_x, core_y = core.rect.center
+        charge_speed = speed * CHARGER_ENEMY_CHARGE_SPEED_MULTIPLIER
+        for i in range(n):
+            self.timer[i] += 1
+            position = self.position[i]
+            dx = core_x - position[0]
+            dy = core_y - position[1]
+            distance_squared = dx * dx + dy * dy
+            length = math.sqrt(distance_squared)
+            if length > 0:
+                dx = dx / length
+                dy = dy / length
+            kind = self.kind[i]
+            charging = self.charging[i] = kind == CHARGER and distance_squared < CHARGER_ENEMY_CHARGE_DISTANCE ** 2
+            step = charge_speed if charging else speed
+            vx, vy = dx, dy
+            if kind == ZIGZAG:
+                sway = self._zigzag_sine(self.timer[i])
+                vx += -dy * sway * ZIGZAG_AMPLITUDE
+                vy += dx * sway * ZIGZAG_AMPLITUDE
+            position[0] += math.trunc(vx * step)
+            position[1] += math.trunc(vy * step)
+
+        if trails is not None:
+            trails.add([int(x) for x, _ in self.position], [int(y) for _, y in self.position],
+                       [size // 2 for size in self.size], self.kind[:])
+
+        # Every healer before any spawner, as the array store does.
+        for i in range(n):
+            if self.kind[i] == HEALER and self.timer[i] >= HEALER_ENEMY_HEAL_COOLDOWN:
+                self.timer[i] = 0
+                self._heal_nearby(i)
+        for i in range(n):
+            if self.kind[i] == SPAWNER and self.timer[i] >= SPAWNER_ENEMY_SPAWN_COOLDOWN:
+                self.timer[i] = 0
+                self._spawn_minions(i)
+
+    def _heal_nearby(self, index):
+        x, y = self.position[index]
+        for i in range(self.count):
+            if self.kind[i] == SHIELDED and self.alive[i]:
+                ox = self.position[i][0] - x
+                oy = self.position[i][1] - y
+                if ox * ox + oy * oy < HEALER_ENEMY_HEAL_RADIUS ** 2:
+                    self.hp[i] = min(self.hp[i] + HEALER_ENEMY_HEAL_AMOUNT, SHIELDED_ENEMY_SHIELD_HEALTH)
+
+    def pull(self, center, reach, strength):
+        center_x, center_y = center
+        for i in range(self.count):
+            if not self.alive[i]:
+                continue
+            position = self.position[i]
+            ox = center_x - position[0]
+            oy = center_y - position[1]
+            distance = math.sqrt(ox * ox + oy * oy)
+            if 0 < distance < reach:
+                position[0] += math.trunc(ox / distance * strength)
+                position[1] += math.trunc(oy / distance * strength)
+
+    def collide(self, rect):
+        return [self.handles[i] for i in range(self.count) if self.alive[i] and rect.colliderect(self.rect(i))]
+
+    def within(self, center, radius):
+        center_x, center_y = center
+        hits = []
+        for i in range(self.count):
+            ox = self.position[i][0] - center_x
+            oy = self.position[i][1] - center_y
+            if self.alive[i] and math.sqrt(ox * ox + oy * oy) < radius:
+                hits.append(self.handles[i])
+        return hits
+
+    def draw(self, surface, alpha=1.0):
+        blits = []
+        for i in range(self.count):
+            if self.alive[i]:
+                (px, py), (x, y) = self.previous[i], self.position[i]
+                half = self.size[i] // 2
+                blits.append((self.image(i), (round(px + (x - px) * alpha) - half, round(py + (y - py) * alpha) - half)))
+        return surface.blits(blits)
+
+
+EnemyStore = ArrayEnemyStore if np is not None else ListEnemyStore
@@ -1,19 +1,62 @@
 import pygame
+from collections import deque
 
-class EnemyTrail(pygame.sprite.Sprite):
-    def __init__(self, position, color, size):
-        super().__init__()
-        self.image = pygame.Surface((size, size), pygame.SRCALPHA)
-        self.color = color
-        self.image.fill(self.color)
-        self.rect = self.image.get_rect(center=position)
-        self.lifetime = 30
-        self.initial_lifetime = self.lifetime
+TRAIL_LIFETIME = 30
+
+
+class TrailStore:
+    """The fading squares enemies leave behind, one batch per tick.
+
+    Each batch holds where every enemy that moved that tick left a trail,
+    its colour index and size, plus the ticks the batch has left; all trails
+    in a batch fade together, so ageing them is one counter per batch.
+    Drawing is a single blits() call from surfaces cached per colour, size
+    and alpha. The surfaces use surface alpha rather than per-pixel alpha,
+    which blits several times faster and looks the same for a flat square.
+    """
+
+    def __init__(self, palette, lifetime=TRAIL_LIFETIME):
+        self.palette = palette
+        self.lifetime = lifetime
+        # [remaining, lefts, tops, colors, sizes, distinct (color, size) pairs], oldest first.
+        # Flat lists of ints keep thousands of tuples a tick away from the garbage collector.
+        self.batches = deque()
+        self.images = {}
+
+    def __len__(self):
+        return sum(len(batch[1]) for batch in self.batches)
+
+    def add(self, xs, ys, sizes, colors):
+        """Start a trail centred on each (x, y); sizes are side lengths, colors palette indices."""
+        if not xs:
+            return
+        lefts = [x - size // 2 for x, size in zip(xs, sizes)]
+        tops = [y - size // 2 for y, size in zip(ys, sizes)]
+        self.batches.append([self.lifetime, lefts, tops, colors, sizes, set(zip(colors, sizes))])
 
     def update(self):
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
-        
-        alpha = int(255 * (self.lifetime / self.initial_lifetime))
-        self.image.set_alpha(alpha)
+        for batch in self.batches:
+            batch[0] -= 1
+        while self.batches and self.batches[0][0] <= 0:
+            self.batches.popleft()
+
+    def empty(self):
+        self.batches.clear()
+
+    def image(self, color, size, alpha):
+        key = (color, size, alpha)
+        image = self.images.get(key)
+        if image is None:
+            image = self.images[key] = pygame.Surface((size, size))
+            image.fill(self.palette[color])
+            image.set_alpha(alpha)
+        return image
+
+    def draw(self, surface):
+        return surface.blits(self._blits())
+
+    def _blits(self):
+        for remaining, lefts, tops, colors, sizes, distinct in self.batches:
+            alpha = int(255 * (remaining / self.lifetime))
+            images = {key: self.image(*key, alpha) for key in distinct}
+            yield from zip(map(images.__getitem__, zip(colors, sizes)), zip(lefts, tops))
@@ -0,0 +1,395 @@
+
+import pygame
+import os
+import random
+from settings import *
+from player import Core
+from enemy import EnemyStore, KIND_COLORS, GHOST, SPLITTER, SHIELDED
+from sound_wave import SoundWave
+from utils import draw_text
+from particle import Particle
+from powerup import PowerUp
+from sound_manager import SoundManager
+from wave_manager import WaveManager
+from screen_shake import ScreenShake
+from combo_manager import ComboManager
+from fever_manager import FeverManager
+from message_display import MessageDisplay
+from background_particle import BackgroundParticle
+from enemy_trail import TrailStore
+from damage_number import DamageNumber
+from impact_effect import ImpactEffect
+from sim_clock import interpolated
+
+class Game:
+    def __init__(self):
+        self.state = 'playing'
+        self.score = 0
+        self.core = Core()
+        self.enemies = EnemyStore()
+        self.waves = pygame.sprite.Group()
+        self.particles = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.background_particles = pygame.sprite.Group()
+        self.enemy_trails = TrailStore(KIND_COLORS)
+        self.damage_numbers = pygame.sprite.Group()
+        self.impact_effects = pygame.sprite.Group()
+
+        for _ in range(50):
+            self.background_particles.add(BackgroundParticle())
+
+        self.sound_manager = SoundManager()
+        self.wave_manager = WaveManager()
+        self._high_score_manager = None
+        self.top_score = None
+        self.screen_shake = None
+        self.combo_manager = ComboManager()
+        self.fever_manager = FeverManager()
+        self.message_display = MessageDisplay()
+
+        self.powerup_timers = {
+            'invincibility': 0,
+            'wave_boost': 0,
+            'slow_time': 0,
+            'wave_width': 0,
+            'time_stop': 0,
+            'wave_magnet': 0
+        }
+        self.active_powerups = {}
+
+        self.echo_burst_cooldown = 0
+        self.current_wave_mode = 'normal'
+        self.start_pos = None
+        self.player_name = ""
+        # Grid drawn once for dirty-rectangle rendering; state last presented.
+        self.static_background = None
+        self.rendered_state = None
+
+        self.wave_manager.start_next_wave()
+
+    @property
+    def high_score_manager(self):
+        # The full leaderboard is loaded at the first game over, when it is
+        # shown or saved, and then kept for the rest of the session.
+        if self._high_score_manager is None:
+            from high_score import HighScoreManager
+            self._high_score_manager = HighScoreManager()
+        return self._high_score_manager
+
+    def load_top_score(self):
+        # The HUD only needs the best score. main.py reads it behind the start
+        # screen, so drawing never touches the score file; save_score keeps it
+        # up to date after that.
+        if self.top_score is None:
+            from leaderboard import read_top_score
+            self.top_score = read_top_score()
+
+    def save_score(self):
+        self.high_score_manager.save_high_score(self.player_name, self.score)
+        self.top_score = self.high_score_manager.get_high_score()
+
+    def handle_event(self, event):
+        if self.state == 'playing':
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.start_pos = event.pos
+            elif event.type == pygame.MOUSEBUTTONUP and self.start_pos:
+                end_pos = event.pos
+                wave_params = WAVE_MODE_NORMAL
+                if self.current_wave_mode == 'focused':
+                    wave_params = WAVE_MODE_FOCUSED
+                elif self.current_wave_mode == 'wide':
+                    wave_params = WAVE_MODE_WIDE
+                
+                new_wave = SoundWave(self.start_pos, end_pos, self.active_powerups.get('wave_width_active', False), self.active_powerups.get('wave_magnet_active', False), damage_multiplier=wave_params['damage_multiplier'])
+                self.waves.add(new_wave)
+                self.sound_manager.play_sound('wave_create')
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE and self.echo_burst_cooldown == 0:
+                    self.activate_echo_burst()
+                elif event.key == pygame.K_1:
+                    self.current_wave_mode = 'normal'
+                elif event.key == pygame.K_2:
+                    self.current_wave_mode = 'focused'
+                elif event.key == pygame.K_3:
+                    self.current_wave_mode = 'wide'
+
+        elif self.state == 'game_over':
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    self.reset_game()
+                elif event.key == pygame.K_BACKSPACE:
+                    self.player_name = self.player_name[:-1]
+                else:
+                    self.player_name += event.unicode
+
+    def update(self):
+        if self.screen_shake:
+            self.screen_shake.update()
+        if self.state == 'playing':
+            self.wave_manager.update(self.enemies, self.core)
+            if not self.wave_manager.wave_active and len(self.enemies) == 0:
+                self.wave_manager.start_next_wave()
+
+            self.core.update()
+            self.enemies.begin_tick()
+            if not self.active_powerups.get('time_stop_active', False):
+                self.enemies.update(self.core, self.wave_manager.enemy_speed, self.enemy_trails)
+            
+            self.waves.update(self.enemies)
+            self.particles.update()
+            self.powerups.update()
+            self.combo_manager.update()
+            self.fever_manager.update()
+            self.message_display.update()
+            self.background_particles.update()
+            self.enemy_trails.update()
+            self.damage_numbers.update()
+            self.impact_effects.update()
+            self._update_powerup_timers()
+            self.check_collisions()
+
+            if self.echo_burst_cooldown > 0:
+                self.echo_burst_cooldown -= 1
+
+    def draw(self, screen, alpha=1.0):
+        screen_offset = (0, 0)
+        if self.screen_shake:
+            screen_offset = self.screen_shake.shake()
+
+        screen.fill(BLACK)
+        self._draw_group(screen, self.background_particles, alpha)
+        self._draw_grid(screen, screen_offset)
+        self._draw_scene(screen, alpha)
+
+    def draw_dirty(self, renderer, alpha=1.0):
+        screen_offset = (0, 0)
+        if self.screen_shake:
+            screen_offset = self.screen_shake.shake()
+        renderer.set_background(self._background(screen_offset))
+        if self.state != self.rendered_state:
+            self.rendered_state = self.state
+            renderer.invalidate()
+
+        renderer.begin()
+        rects = self._draw_group(renderer.screen, self.background_particles, alpha)
+        rects += self._draw_scene(renderer.screen, alpha)
+        return renderer.present(rects)
+
+    def _background(self, offset):
+        if offset == (0, 0) and self.static_background is not None:
+            return self.static_background
+        background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        background.fill(BLACK)
+        self._draw_grid(background, offset)
+        if offset == (0, 0):
+            self.static_background = background
+        return background
+
+    def _draw_group(self, screen, group, alpha=None):
+        # With alpha, sprites that move are drawn between their last two ticks
+        if alpha is not None:
+            return screen.blits(interpolated(group, alpha))
+        group.draw(screen)
+        return [sprite.rect for sprite in group]
+
+    def _draw_scene(self, screen, alpha):
+        rects = []
+        if self.state == 'playing':
+            rects += self.core.draw(screen, self.fever_manager.fever_active)
+            rects += self.enemy_trails.draw(screen)
+            rects += self.enemies.draw(screen, alpha)
+            rects += self._draw_group(screen, self.waves, alpha)
+            rects += self._draw_group(screen, self.particles, alpha)
+            rects += self._draw_group(screen, self.powerups, alpha)
+            rects += self._draw_group(screen, self.damage_numbers, alpha)
+            rects += self._draw_group(screen, self.impact_effects)
+            rects += self.message_display.draw(screen)
+
+            rects.append(draw_text(screen, f"Score: {self.score}", FONT_SIZE_SCORE, WIDTH / 2, 10, WHITE))
+            rects.append(draw_text(screen, f"Wave: {self.wave_manager.current_wave}", FONT_SIZE_SCORE, WIDTH / 2, 40, WHITE))
+            rects.append(draw_text(screen, f"High Score: {'-' if self.top_score is None else self.top_score}", FONT_SIZE_SCORE, WIDTH / 2, 70, WHITE))
+            rects.append(draw_text(screen, f"Combo: {self.combo_manager.combo_count}", FONT_SIZE_SCORE, 10, 10, WHITE))
+            rects += self._draw_fever_meter(screen)
+            rects += self._draw_echo_burst_cooldown(screen)
+            rects += self._draw_powerup_timers(screen)
+
+        elif self.state == 'game_over':
+            rects.append(draw_text(screen, "GAME OVER", FONT_SIZE_GAME_OVER, WIDTH / 2, HEIGHT / 4, RED))
+            rects.append(draw_text(screen, f"Final Score: {self.score}", FONT_SIZE_SCORE, WIDTH / 2, HEIGHT / 2, WHITE))
+            
+            # Leaderboard
+            leaderboard = self.high_score_manager.get_leaderboard()
+            rects.append(draw_text(screen, "Leaderboard", FONT_SIZE_SCORE, WIDTH / 2, HEIGHT / 2 + 50, YELLOW))
+            for i, entry in enumerate(leaderboard):
+                rects.append(draw_text(screen, f"{i+1}. {entry['name']} - {entry['score']}", FONT_SIZE_SCORE, WIDTH / 2, HEIGHT / 2 + 90 + i * 30, WHITE))
+
+            # Name Input
+            rects.append(draw_text(screen, "Enter Your Name:", FONT_SIZE_SCORE, WIDTH / 2, HEIGHT * 3 / 4, WHITE))
+            rects.append(pygame.draw.rect(screen, WHITE, (WIDTH / 2 - 100, HEIGHT * 3 / 4 + 40, 200, 40), 2))
+            rects.append(draw_text(screen, self.player_name, FONT_SIZE_SCORE, WIDTH / 2, HEIGHT * 3 / 4 + 60, WHITE))
+
+            rects.append(draw_text(screen, "Press 'R' to Restart", FONT_SIZE_SCORE, WIDTH / 2, HEIGHT * 3 / 4 + 120, WHITE))
+        return rects
+
+    def _draw_grid(self, screen, offset):
+        for x in range(0, WIDTH, 50):
+            pygame.draw.line(screen, GRID_COLOR, (x + offset[0], 0), (x + offset[0], HEIGHT))
+        for y in range(0, HEIGHT, 50):
+            pygame.draw.line(screen, GRID_COLOR, (0, y + offset[1]), (WIDTH, y + offset[1]))
+
+    def _draw_powerup_timers(self, screen):
+        rects = []
+        y_offset = 10
+        for powerup_type, timer in self.powerup_timers.items():
+            if timer > 0:
+                rects.append(draw_text(screen, f"{powerup_type.replace('_', ' ').title()}: {timer // FPS}", FONT_SIZE_POWERUP_TIMER, WIDTH - 100, y_offset, YELLOW))
+                y_offset += 30
+        return rects
+
+    def _draw_fever_meter(self, screen):
+        fever_percentage = self.fever_manager.get_charge_percentage()
+        return [
+            pygame.draw.rect(screen, WHITE, (10, HEIGHT - 20, 200, 10), 2),
+            pygame.draw.rect(screen, FEVER_MODE_COLOR, (10, HEIGHT - 20, 2 * fever_percentage, 10)),
+        ]
+
+    def _draw_echo_burst_cooldown(self, screen):
+        if self.echo_burst_cooldown > 0:
+            cooldown_percentage = self.echo_burst_cooldown / ECHO_BURST_COOLDOWN
+            return [
+                pygame.draw.rect(screen, BLUE, (WIDTH - 110, HEIGHT - 20, 100, 10)),
+                pygame.draw.rect(screen, WHITE, (WIDTH - 110, HEIGHT - 20, 100 * cooldown_percentage, 10)),
+            ]
+        return []
+
+    def check_collisions(self):
+        if not self.active_powerups.get('invincibility_active', False) and not self.fever_manager.fever_active:
+            crashed = self.enemies.collide(self.core.rect)
+            for enemy in crashed:
+                enemy.kill()
+            if crashed:
+                self.state = 'game_over'
+                self.sound_manager.play_sound('game_over')
+                self.save_score()
+                self.screen_shake = ScreenShake(10, 30)
+
+        # Every wave's hits are found before any are resolved, as groupcollide did
+        collided_enemies = {wave: self.enemies.collide(wave.rect) for wave in self.waves}
+        for wave, enemies_hit in collided_enemies.items():
+            for enemy in enemies_hit:
+                damage = 1 * wave.damage_multiplier
+                if self.fever_manager.fever_active:
+                    damage *= FEVER_MODE_PLAYER_WAVE_DAMAGE_MULTIPLIER
+                
+                if enemy.kind == SHIELDED:
+                    enemy.shield_health -= damage
+                    if enemy.shield_health <= 0:
+                        enemy.kill()
+                        self._handle_enemy_defeat(enemy, damage)
+                elif enemy.kind == SPLITTER:
+                    enemy.split()
+                    enemy.kill()
+                    self._handle_enemy_defeat(enemy, damage)
+                elif enemy.kind == GHOST:
+                    enemy.hits_remaining -= damage
+                    if enemy.hits_remaining <= 0:
+                        enemy.kill()
+                        self._handle_enemy_defeat(enemy, damage)
+                else:
+                    enemy.kill()
+                    self._handle_enemy_defeat(enemy, damage)
+
+        collected_powerups = pygame.sprite.spritecollide(self.core, self.powerups, True)
+        for powerup in collected_powerups:
+            self.sound_manager.play_sound('powerup_collect')
+            self._activate_powerup(powerup.type)
+
+    def _handle_enemy_defeat(self, enemy, damage=0):
+        self.combo_manager.add_hit()
+        self.fever_manager.add_charge(FEVER_MODE_CHARGE_PER_HIT)
+        self.score += 1 + self.combo_manager.get_bonus()
+        self.sound_manager.play_sound('enemy_hit')
+        for _ in range(10):
+            self.particles.add(Particle(enemy.rect.center, enemy.image.get_at((ENEMY_RADIUS, ENEMY_RADIUS))))
+        
+        if random.random() < POWERUP_SPAWN_CHANCE:
+            powerup_type = random.choice(['invincibility', 'wave_boost', 'slow_time', 'clear_screen', 'wave_width', 'time_stop', 'wave_magnet'])
+            self.powerups.add(PowerUp(enemy.rect.center, powerup_type))
+
+        combo_msg = self.combo_manager.get_combo_message()
+        if combo_msg:
+            self.message_display.add_message(combo_msg, (enemy.rect.centerx, enemy.rect.centery - 20), YELLOW, 24)
+
+        is_critical = random.random() < CRITICAL_HIT_CHANCE
+        if is_critical:
+            damage *= CRITICAL_HIT_MULTIPLIER
+        self.damage_numbers.add(DamageNumber(enemy.rect.center, int(damage), is_critical=is_critical))
+        self.impact_effects.add(ImpactEffect(enemy.rect.center, enemy.image.get_at((ENEMY_RADIUS, ENEMY_RADIUS))))
+
+    def _activate_powerup(self, powerup_type):
+        self.message_display.add_message(POWERUP_MESSAGES.get(powerup_type, ""), (WIDTH/2, HEIGHT/2), YELLOW, 36)
+        if powerup_type == 'invincibility':
+            self.powerup_timers['invincibility'] = POWERUP_DURATION_INVINCIBILITY
+            self.active_powerups['invincibility_active'] = True
+        elif powerup_type == 'wave_boost':
+            self.powerup_timers['wave_boost'] = POWERUP_DURATION_WAVE_BOOST
+            self.active_powerups['wave_boost_active'] = True
+        elif powerup_type == 'slow_time':
+            self.powerup_timers['slow_time'] = POWERUP_DURATION_SLOW_TIME
+            self.active_powerups['slow_time_active'] = True
+        elif powerup_type == 'clear_screen':
+            for enemy in self.enemies:
+                enemy.kill()
+                self._handle_enemy_defeat(enemy)
+            self.powerups.empty()
+        elif powerup_type == 'wave_width':
+            self.powerup_timers['wave_width'] = POWERUP_DURATION_WAVE_WIDTH
+            self.active_powerups['wave_width_active'] = True
+        elif powerup_type == 'time_stop':
+            self.powerup_timers['time_stop'] = POWERUP_DURATION_TIME_STOP
+            self.active_powerups['time_stop_active'] = True
+        elif powerup_type == 'wave_magnet':
+            self.powerup_timers['wave_magnet'] = POWERUP_DURATION_WAVE_MAGNET
+            self.active_powerups['wave_magnet_active'] = True
+
+    def activate_echo_burst(self):
+        self.echo_burst_cooldown = ECHO_BURST_COOLDOWN
+        self.sound_manager.play_sound('echo_burst')
+        for enemy in self.enemies.within(self.core.rect.center, ECHO_BURST_RADIUS):
+            enemy.kill()
+            self._handle_enemy_defeat(enemy, 5)
+        self.impact_effects.add(ImpactEffect(self.core.rect.center, ECHO_BURST_COLOR))
+
+    def _update_powerup_timers(self):
+        for powerup_type in list(self.powerup_timers.keys()):
+            if self.powerup_timers[powerup_type] > 0:
+                self.powerup_timers[powerup_type] -= 1
+                if self.powerup_timers[powerup_type] == 0:
+                    self.active_powerups[f'{powerup_type}_active'] = False
+
+    def reset_game(self):
+        self.state = 'playing'
+        self.score = 0
+        self.enemies.empty()
+        self.waves.empty()
+        self.particles.empty()
+        self.powerups.empty()
+        self.core = Core()
+        self.wave_manager = WaveManager()
+        self.combo_manager = ComboManager()
+        self.fever_manager = FeverManager()
+        self.message_display = MessageDisplay()
+        self.powerup_timers = {
+            'invincibility': 0,
+            'wave_boost': 0,
+            'slow_time': 0,
+            'wave_width': 0,
+            'time_stop': 0,
+            'wave_magnet': 0
+        }
+        self.active_powerups = {}
+        self.echo_burst_cooldown = 0
+        self.current_wave_mode = 'normal'
+        self.player_name = ""
+        self.wave_manager.start_next_wave()
+
@@ -0,0 +1,371 @@
+"""Request handlers shared by the Flask app (app.py) and the ASGI app (asgi_app.py).
+
+Each handler is a plain blocking function: handler(site, request, session,
+**url_args) -> Reply. request is a Werkzeug request (Flask's, or one asgi_app
+builds from the ASGI scope) and session a Flask cookie session. The frontends
+only translate: app.py turns the Reply into a Flask response, asgi_app.py runs
+the handler in a worker thread and writes the Reply as ASGI messages. Routes
+are listed once, in ROUTES, and both apps register them from there.
+"""
+import os
+import json
+import logging
+
+import highscore_store
+import metrics
+from assets import PYGBAG_CACHE_CONTROL, SOUND_DIR, load_manifest, negotiate_audio, static_cache_control
+from leaderboard_feed import LeaderboardFeed, format_event
+
+logger = logging.getLogger(__name__)
+
+HTML = 'text/html; charset=utf-8'
+JSON = 'application/json'
+METRICS = 'text/plain; version=0.0.4; charset=utf-8'
+ASSET_CACHE_CONTROL = 'public, max-age=86400'
+ISOLATION_HEADERS = [
+    ('Cross-Origin-Embedder-Policy', 'require-corp'),
+    ('Cross-Origin-Opener-Policy', 'same-origin'),
+]
+
+# (rule, handler, methods). The static folder's '/static/<path:filename>' is
+# Flask's own 'static' endpoint; both apps route it to static_files.
+ROUTES = [
+    ('/', 'index', ['GET']),
+    ('/game', 'game', ['GET']),
+    ('/guide', 'guide', ['GET']),
+    ('/play', 'play_direct', ['GET']),
+    ('/wasm-test', 'wasm_test', ['GET']),
+    ('/assets/<path:filename>', 'assets', ['GET']),
+    ('/static/pygbag/<path:filename>', 'pygbag_files', ['GET']),
+    ('/audio/effects.json', 'sound_sprite_manifest', ['GET']),
+    ('/audio/effects', 'sound_sprite', ['GET']),
+    ('/api/highscores', 'get_highscores', ['GET']),
+    ('/api/highscores/stream', 'stream_highscores', ['GET']),
+    ('/api/highscores', 'save_highscore', ['POST']),
+    ('/api/player', 'get_player', ['GET']),
+    ('/api/player', 'save_player', ['POST']),
+    ('/health', 'health_check', ['GET']),
+    ('/metrics', 'metrics_endpoint', ['GET']),
+    ('/test-universal-controls', 'test_universal_controls', ['GET']),
+    ('/diagnose', 'diagnose', ['GET']),
+]
+STATIC_RULE = '/static/<path:filename>'
+
+
+class Site:
+    """Per-process state the handlers read: settings, the leaderboard feed,
+    manifests, the startup inventory and the frontend's template renderer."""
+
+    def __init__(self, config, inventory, render_template, render_template_string):
+        self.config = config
+        self.root = config.root_path
+        self.static_dir = os.path.join(self.root, 'static')
+        self.inventory = inventory
+        self.render_template = render_template
+        self.render_template_string = render_template_string
+        self.feed = LeaderboardFeed(config['HIGHSCORE_FILE'], config['LEADERBOARD_MAX_SUBSCRIBERS'])
+        self.asset_manifest = load_manifest(self.static_dir) if config['ASSET_BUNDLES'] else {}
+        self.sound_manifest = load_manifest(SOUND_DIR)
+        self.on_change = None # Called after a publish changes the leaderboard
+
+    def publish(self, highscores):
+        if self.feed.publish(highscores) and self.on_change is not None:
+            self.on_change()
+
+
+class Reply:
+    def __init__(self, body, status=200, headers=(), content_type=HTML):
+        self.body = body.encode('utf-8') if isinstance(body, str) else body
+        self.status = status
+        self.headers = list(headers)
+        self.content_type = content_type
+
+
+class FileReply:
+    """A file for the frontend to send; a missing file gets not_found()."""
+
+    def __init__(self, directory, filename, cache_control=None, headers=(), mimetype=None):
+        self.directory = directory
+        self.filename = filename
+        self.cache_control = cache_control
+        self.headers = list(headers)
+        self.mimetype = mimetype
+
+
+class StreamReply:
+    """The leaderboard event stream; the frontend runs the loop, sync or async."""
+
+    headers = [('Cache-Control', 'no-cache'), ('X-Accel-Buffering', 'no')]
+    content_type = 'text/event-stream'
+
+    def __init__(self, feed, heartbeat):
+        self.feed = feed
+        self.heartbeat = heartbeat
+
+    def preamble(self, snapshot):
+        return f"retry: {int(self.heartbeat * 1000)}\n" + format_event('snapshot', snapshot)
+
+
+def json_reply(data, status=200, headers=()):
+    # Flask's default JSON provider: sorted keys, compact separators, newline.
+    return Reply(json.dumps(data, sort_keys=True, separators=(',', ':')) + '\n', status, headers, JSON)
+
+
+def cors_headers(path):
+    if '/pygbag/' in path or '/play' in path or '/wasm-test' in path:
+        return ISOLATION_HEADERS + [('Cross-Origin-Resource-Policy', 'cross-origin')]
+    return [
+        ('Access-Control-Allow-Origin', '*'),
+        ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+        ('Access-Control-Allow-Headers', 'Content-Type'),
+    ]
+
+
+def index(site, request, session):
+    logger.info("Serving index page")
+    try:
+        return Reply(site.render_template('index.html'))
+    except Exception as e:
+        logger.error(f"Error rendering index.html: {e}")
+        return Reply('''
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Echo Weaver</title>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <style>
+                body { font-family: Arial, sans-serif; text-align: center; padding: 50px; background: #000; color: #fff; }
+                .container { max-width: 600px; margin: 0 auto; }
+                h1 { color: #00ff00; }
+                .error { color: #ff0000; background: #300; padding: 20px; border-radius: 10px; margin: 20px 0; }
+                .info { color: #00ffff; background: #003; padding: 20px; border-radius: 10px; margin: 20px 0; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>ECHO WEAVER</h1>
+                <div class="error">
+                    <h2>Template Error</h2>
+                    <p>Error: ''' + str(e) + '''</p>
+                    <p>This is a fallback page. The template system is not working properly.</p>
+                </div>
+                <div class="info">
+                    <h3>Debug Information</h3>
+                    <p>App root: ''' + site.root + '''</p>
+                    <p>Templates directory exists: ''' + str(os.path.isdir(os.path.join(site.root, 'templates'))) + '''</p>
+                    <p>Index.html exists: ''' + str(os.path.exists(os.path.join(site.root, 'templates', 'index.html'))) + '''</p>
+                </div>
+                <p><a href="/diagnose" style="color: #00ff00;">Click here for detailed diagnostics</a></p>
+            </div>
+        </body>
+        </html>
+        ''')
+
+
+def game(site, request, session):
+    logger.info("Serving game page via /game route")
+    return index(site, request, session)
+
+
+def guide(site, request, session):
+    logger.info("Serving game guide page")
+    try:
+        return Reply(site.render_template('guide.html'))
+    except Exception as e:
+        logger.error(f"Error rendering guide page: {e}")
+        return Reply('''
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Echo Weaver - Game Guide</title>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <style>
+                body { font-family: Arial, sans-serif; text-align: center; padding: 50px; background: #000; color: #fff; }
+                .container { max-width: 600px; margin: 0 auto; }
+                h1 { color: #00ff00; }
+                .error { color: #ff0000; background: #300; padding: 20px; border-radius: 10px; margin: 20px 0; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>ECHO WEAVER - GAME GUIDE</h1>
+                <div class="error">
+                    <h2>Guide Template Error</h2>
+                    <p>Error: ''' + str(e) + '''</p>
+                    <p>The guide template is not loading properly.</p>
+                </div>
+                <p><a href="/" style="color: #00ff00;">← Back to Game</a></p>
+            </div>
+        </body>
+        </html>
+        ''')
+
+
+def not_found(site, request, session):
+    # Unknown paths, missing files included, get the game page, as they always have.
+    logger.info(f"404 error for path: {request.path}")
+    try:
+        return Reply(site.render_template('index.html'))
+    except Exception as template_error:
+        logger.error(f"Error rendering template in 404 handler: {template_error}")
+        return Reply('''
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Echo Weaver - Page Not Found</title>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <style>
+                body { font-family: Arial, sans-serif; text-align: center; padding: 50px; background: #000; color: #fff; }
+                .container { max-width: 600px; margin: 0 auto; }
+                h1 { color: #00ff00; }
+                .error { color: #ff0000; background: #300; padding: 20px; border-radius: 10px; margin: 20px 0; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>ECHO WEAVER</h1>
+                <div class="error">
+                    <h2>Page Not Found</h2>
+                    <p>The requested page was not found: ''' + request.path + '''</p>
+                    <p>Template error: ''' + str(template_error) + '''</p>
+                </div>
+                <p><a href="/" style="color: #00ff00;">Go to Home Page</a></p>
+                <p><a href="/diagnose" style="color: #00ffff;">View Diagnostics</a></p>
+            </div>
+        </body>
+        </html>
+        ''')
+
+
+def server_error(error):
+    return json_reply({'error': 'Server error occurred', 'message': str(error)}, 500)
+
+
+def play_direct(site, request, session):
+    logger.info("Serving WebAssembly game via /play route")
+    return FileReply(os.path.join(site.static_dir, 'pygbag'), 'index.html', headers=ISOLATION_HEADERS)
+
+
+def wasm_test(site, request, session):
+    logger.info("Serving WebAssembly test page")
+    return FileReply(site.static_dir, 'wasm_test.html', headers=ISOLATION_HEADERS)
+
+
+def assets(site, request, session, filename):
+    return FileReply(os.path.join(site.root, 'assets'), filename, ASSET_CACHE_CONTROL)
+
+
+def static_files(site, request, session, filename):
+    return FileReply(site.static_dir, filename, static_cache_control(filename))
+
+
+def pygbag_files(site, request, session, filename):
+    return FileReply(os.path.join(site.static_dir, 'pygbag'), filename, PYGBAG_CACHE_CONTROL,
+                     ISOLATION_HEADERS + [('Cross-Origin-Resource-Policy', 'cross-origin')])
+
+
+def sound_sprite_manifest(site, request, session):
+    if not site.sound_manifest:
+        return json_reply({'error': 'Sound sprite not built'}, 404)
+    return json_reply(site.sound_manifest, headers=[('Cache-Control', 'no-cache')])
+
+
+def sound_sprite(site, request, session):
+    mimetype, filename = negotiate_audio(site.sound_manifest, request.headers.get('Accept'))
+    if filename is None:
+        return json_reply({'error': 'Sound sprite not built'}, 404)
+    return FileReply(SOUND_DIR, filename, ASSET_CACHE_CONTROL, [('Vary', 'Accept')], mimetype=mimetype)
+
+
+def get_highscores(site, request, session):
+    try:
+        highscores = highscore_store.load_highscores(site.config['HIGHSCORE_FILE'])
+        site.publish(highscores)
+        return json_reply(highscores)
+    except Exception as e:
+        logger.error(f"Error getting highscores: {e}")
+        return json_reply([])
+
+
+def stream_highscores(site, request, session):
+    if not site.feed.acquire():
+        return json_reply({'error': 'Leaderboard stream unavailable, poll /api/highscores'}, 503,
+                          [('Retry-After', '60')])
+    return StreamReply(site.feed, site.config['LEADERBOARD_HEARTBEAT'])
+
+
+def save_highscore(site, request, session):
+    try:
+        data = request.json
+        name = data.get('name', session.get('player_name', 'Anonymous'))
+        score = data.get('score', 0)
+
+        highscores = highscore_store.save_highscore(site.config['HIGHSCORE_FILE'], name, score)
+        site.publish(highscores)
+
+        return json_reply({"success": True})
+    except Exception as e:
+        logger.error(f"Error saving highscore: {e}")
+        return json_reply({"error": str(e), "success": False}, 500)
+
+
+def get_player(site, request, session):
+    return json_reply({"name": session.get('player_name', '')})
+
+
+def save_player(site, request, session):
+    data = request.json
+    session['player_name'] = data.get('name', 'Anonymous')
+    return json_reply({"success": True})
+
+
+def health_check(site, request, session):
+    return json_reply({'status': 'healthy'})
+
+
+def metrics_endpoint(site, request, session):
+    return Reply(metrics.render(), content_type=METRICS)
+
+
+def test_universal_controls(site, request, session):
+    logger.info("Testing universal_controls.js accessibility")
+    try:
+        full_path = os.path.join(site.static_dir, 'js', 'universal_controls.js')
+        if os.path.exists(full_path):
+            with open(full_path, 'r') as f:
+                content = f.read(100)
+            return json_reply({
+                'file_exists': True,
+                'file_size': os.path.getsize(full_path),
+                'content_preview': content,
+                'path': full_path
+            })
+        else:
+            return json_reply({
+                'file_exists': False,
+                'error': 'File not found',
+                'path': full_path
+            })
+    except Exception as e:
+        logger.error(f"Error testing universal_controls.js: {e}")
+        return json_reply({'error': str(e)}, 500)
+
+
+def diagnose(site, request, session):
+    logger.info("Running diagnostics")
+    highscore_file = site.config['HIGHSCORE_FILE']
+    diagnostic_info = dict(site.inventory)
+    diagnostic_info['highscore_file_exists'] = os.path.exists(highscore_file)
+    diagnostic_info['highscore_file_size'] = os.path.getsize(highscore_file) if os.path.exists(highscore_file) else 0
+
+    try:
+        site.render_template_string('<h1>Template Test</h1>')
+        diagnostic_info['template_system_working'] = True
+    except Exception as e:
+        diagnostic_info['template_system_working'] = False
+        diagnostic_info['template_error'] = str(e)
+
+    return json_reply(diagnostic_info)
@@ -0,0 +1,113 @@
+import os
+import json
+import logging
+import threading
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 10
+
+_lock = threading.Lock()
+
+
+def _read_raw(path):
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        _write(path, [])
+        return []
+
+    with open(path, 'r') as f:
+        content = f.read().strip()
+    metrics.inc('echo_weaver_highscore_reads_total')
+    if not content:
+        return []
+
+    try:
+        highscores = json.loads(content)
+    except json.JSONDecodeError:
+        metrics.inc('echo_weaver_highscore_parse_failures_total')
+        logger.error("Invalid JSON in highscores file")
+        return []
+    if not isinstance(highscores, list):
+        metrics.inc('echo_weaver_highscore_parse_failures_total')
+        logger.error(f"Highscores file contains invalid data: {highscores}")
+        return []
+    return highscores
+
+
+def _write(path, highscores):
+    data = json.dumps(highscores)
+    with open(path, 'w') as f:
+        f.write(data)
+    metrics.inc('echo_weaver_highscore_writes_total')
+    metrics.inc('echo_weaver_highscore_bytes_written_total', len(data.encode('utf-8')))
+
+
+def top_entries(highscores, limit=MAX_ENTRIES):
+    name_to_entry = {}
+    for entry in highscores:
+        if not isinstance(entry, dict):
+            continue
+
+        name = entry.get('name')
+        score = entry.get('score')
+
+        if not name or not isinstance(score, (int, float)):
+            continue
+
+        if name not in name_to_entry or score > name_to_entry[name]['score']:
+            name_to_entry[name] = {'name': name, 'score': score}
+
+    deduped_highscores = list(name_to_entry.values())
+    deduped_highscores.sort(key=lambda x: x['score'], reverse=True)
+    return deduped_highscores[:limit]
+
+
+def load_highscores(path):
+    with _lock:
+        highscores = _read_raw(path)
+        deduped_highscores = top_entries(highscores)
+
+        if deduped_highscores != highscores:
+            _write(path, deduped_highscores)
+
+        return deduped_highscores
+
+
+def save_highscore(path, name, score):
+    with _lock:
+        highscores = _read_raw(path)
+
+        player_exists = False
+        player_index = -1
+
+        filtered_highscores = []
+        for entry in highscores:
+            if isinstance(entry, dict) and entry.get('name') == name:
+                if not player_exists:
+                    player_exists = True
+                    player_index = len(filtered_highscores)
+                    filtered_highscores.append(entry)
+            else:
+                filtered_highscores.append(entry)
+
+        highscores = filtered_highscores
+
+        if player_exists:
+            if score > highscores[player_index].get('score', 0):
+                highscores[player_index]['score'] = score
+        else:
+            highscores.append({"name": name, "score": score})
+
+        def safe_get_score(item):
+            if isinstance(item, dict):
+                return item.get('score', 0)
+            return 0
+
+        highscores.sort(key=safe_get_score, reverse=True)
+        highscores = highscores[:MAX_ENTRIES]
+
+        _write(path, highscores)
+        return highscores
@@ -2,17 +2,27 @@
 import json
 from settings import HIGH_SCORE_FILE
 
+def read_scores(filepath=HIGH_SCORE_FILE):
+    try:
+        with open(filepath, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+
+def read_top_score(filepath=HIGH_SCORE_FILE):
+    # Scores are stored best first
+    scores = read_scores(filepath)
+    return scores[0]['score'] if scores else 0
+
+
 class Leaderboard:
     def __init__(self):
         self.filepath = HIGH_SCORE_FILE
         self.scores = self.load_scores()
 
     def load_scores(self):
-        try:
-            with open(self.filepath, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+        return read_scores(self.filepath)
 
     def save_scores(self):
         with open(self.filepath, 'w') as f:
@@ -0,0 +1,86 @@
+import os
+import json
+import threading
+
+import highscore_store
+import metrics
+
+
+def format_event(event, data):
+    return f"id: {data['version']}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+HEARTBEAT = ': heartbeat\n\n'
+
+
+class LeaderboardFeed:
+    def __init__(self, path, max_subscribers=0, size=highscore_store.MAX_ENTRIES):
+        self.path = path
+        self.max_subscribers = max_subscribers
+        self.size = size
+        self.version = 0
+        self.entries = None
+        self.subscribers = 0
+        self._last_diff = None
+        self._mtime = None
+        self._changed = threading.Condition()
+
+    def acquire(self):
+        with self._changed:
+            if self.subscribers >= self.max_subscribers:
+                return False
+            self.subscribers += 1
+        metrics.inc('echo_weaver_leaderboard_subscribers')
+        return True
+
+    def release(self):
+        with self._changed:
+            self.subscribers -= 1
+        metrics.dec('echo_weaver_leaderboard_subscribers')
+
+    def publish(self, highscores):
+        top = highscore_store.top_entries(highscores, self.size)
+        with self._changed:
+            if top == self.entries:
+                return False
+            previous = self.entries or []
+            changes = [
+                {'rank': rank, 'name': entry['name'], 'score': entry['score']}
+                for rank, entry in enumerate(top)
+                if rank >= len(previous) or previous[rank] != entry
+            ]
+            self.version += 1
+            self.entries = top
+            self._last_diff = {'version': self.version, 'base': self.version - 1,
+                               'length': len(top), 'changes': changes}
+            self._changed.notify_all()
+        metrics.inc('echo_weaver_leaderboard_events_total')
+        return True
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def sync(self):
+        if self.entries is not None and self._stat() == self._mtime:
+            return False
+        highscores = highscore_store.load_highscores(self.path)
+        self._mtime = self._stat()
+        return self.publish(highscores)
+
+    def snapshot(self):
+        with self._changed:
+            return {'version': self.version, 'entries': list(self.entries or [])}
+
+    def event_since(self, version):
+        with self._changed:
+            diff = self._last_diff
+            if diff is not None and diff['base'] == version:
+                return 'diff', diff
+        return 'snapshot', self.snapshot()
+
+    def wait(self, version, timeout):
+        with self._changed:
+            return self._changed.wait_for(lambda: self.version != version, timeout)
@@ -0,0 +1,97 @@
+import asyncio
+import pygame
+import sys
+import traceback
+from settings import WIDTH, HEIGHT, FPS, START_SCREEN_TITLE, START_SCREEN_INSTRUCTIONS
+from utils import draw_text
+from sim_clock import SimClock
+from dirty_renderer import DirtyRenderer
+
+async def main():
+    try:
+        pygame.init()
+        
+        # Initialize display with error handling
+        try:
+            screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Echo Weaver")
+        except pygame.error as e:
+            print(f"Display initialization error: {e}")
+            return
+        
+        clock = pygame.time.Clock()
+        game = None
+
+        show_start_screen = True
+        while show_start_screen:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return
+                if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                    show_start_screen = False
+
+            screen.fill((0, 0, 0))
+            draw_text(screen, START_SCREEN_TITLE, 72, WIDTH / 2, HEIGHT / 4, (255, 255, 255))
+            for i, line in enumerate(START_SCREEN_INSTRUCTIONS):
+                draw_text(screen, line, 24, WIDTH / 2, HEIGHT / 2 + i * 30, (255, 255, 255))
+            
+            # Add web-friendly instructions
+            draw_text(screen, "Click anywhere or press any key to start", 20, WIDTH / 2, HEIGHT * 3/4, (200, 200, 200))
+            
+            pygame.display.flip()
+            if game is None:
+                # Loaded behind the start screen so the first frame does not
+                # wait for every game module to be imported.
+                from game import Game
+                game = Game()
+                game.load_top_score()
+            await asyncio.sleep(0)
+
+        sim_clock = SimClock()
+        # Dirty rectangles by default; --full-redraw repaints and flips the whole screen every frame.
+        renderer = None if '--full-redraw' in sys.argv else DirtyRenderer(screen)
+        clock.tick()
+        running = True
+        while running:
+            try:
+                elapsed = clock.tick(FPS) / 1000
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    game.handle_event(event)
+
+                for _ in range(sim_clock.advance(elapsed)):
+                    game.update()
+                if renderer:
+                    game.draw_dirty(renderer, sim_clock.alpha)
+                else:
+                    game.draw(screen, sim_clock.alpha)
+                    pygame.display.flip()
+                await asyncio.sleep(0)
+                
+            except Exception as e:
+                print(f"Game loop error: {e}")
+                traceback.print_exc()
+                if renderer:
+                    renderer.invalidate()
+                # Continue running instead of crashing
+                await asyncio.sleep(0.1)
+
+    except Exception as e:
+        print(f"Fatal error in main: {e}")
+        traceback.print_exc()
+    finally:
+        try:
+            pygame.quit()
+        except:
+            pass
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("Game interrupted by user")
+    except Exception as e:
+        print(f"Failed to start game: {e}")
+        traceback.print_exc()
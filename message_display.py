@@ -25,8 +25,10 @@ class MessageDisplay:
                     self.messages.remove(msg)
 
     def draw(self, screen):
+        rects = []
         for msg in self.messages:
             font = pygame.font.Font(None, msg['font_size'])
             text_surface = font.render(msg['text'], True, msg['color'])
             text_surface.set_alpha(msg['alpha'])
-            screen.blit(text_surface, msg['position'])
+            rects.append(screen.blit(text_surface, msg['position']))
+        return rects
@@ -0,0 +1,143 @@
+import os
+import threading
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS = {
+    'echo_weaver_http_request_duration_seconds': ('histogram', 'Request latency by endpoint.'),
+    'echo_weaver_http_requests_total': ('counter', 'Requests served by endpoint and status.'),
+    'echo_weaver_http_requests_in_flight': ('gauge', 'Requests currently being served.'),
+    'echo_weaver_highscore_reads_total': ('counter', 'Highscore file reads.'),
+    'echo_weaver_highscore_writes_total': ('counter', 'Highscore file writes.'),
+    'echo_weaver_highscore_bytes_written_total': ('counter', 'Bytes written to the highscore file.'),
+    'echo_weaver_highscore_parse_failures_total': ('counter', 'Highscore file reads that did not parse to a list.'),
+    'echo_weaver_leaderboard_subscribers': ('gauge', 'Open leaderboard event streams.'),
+    'echo_weaver_leaderboard_events_total': ('counter', 'Leaderboard changes pushed to event streams.'),
+}
+
+# Long-lived responses. They are counted in requests_total and have their own
+# gauge, but are left out of latency and in-flight so that a stream's lifetime
+# does not read as a slow request, and both serving modes report alike.
+UNTIMED_ENDPOINTS = {'/api/highscores/stream'}
+
+_shards = []
+_shards_lock = threading.Lock()
+_local = threading.local()
+
+
+class _Shard:
+    def __init__(self, thread=None):
+        self.thread = thread
+        self.counters = {}
+        self.histograms = {}
+
+    def merge(self, other):
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, (buckets, total) in list(other.histograms.items()):
+            merged = self.histograms.setdefault(key, [[0] * len(buckets), 0.0])
+            for i, count in enumerate(buckets):
+                merged[0][i] += count
+            merged[1] += total
+
+
+_retired = _Shard()
+
+
+def _retire_dead_shards():
+    # Caller holds _shards_lock. Threaded servers start a thread per request,
+    # so shards are folded away as their threads exit, not only on a scrape.
+    for shard in [s for s in _shards if not s.thread.is_alive()]:
+        _retired.merge(shard)
+        _shards.remove(shard)
+
+
+def _shard():
+    shard = getattr(_local, 'shard', None)
+    if shard is None:
+        shard = _local.shard = _Shard(threading.current_thread())
+        with _shards_lock:
+            _retire_dead_shards()
+            _shards.append(shard)
+    return shard
+
+
+def _key(name, labels):
+    return (name, tuple(sorted(labels.items())))
+
+
+def inc(name, amount=1, **labels):
+    counters = _shard().counters
+    key = _key(name, labels)
+    counters[key] = counters.get(key, 0) + amount
+
+
+def dec(name, amount=1, **labels):
+    inc(name, -amount, **labels)
+
+
+def observe(name, value, **labels):
+    histograms = _shard().histograms
+    key = _key(name, labels)
+    histogram = histograms.get(key)
+    if histogram is None:
+        histogram = histograms[key] = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0]
+    histogram[0][bisect_left(LATENCY_BUCKETS, value)] += 1
+    histogram[1] += value
+
+
+def _collect():
+    with _shards_lock:
+        _retire_dead_shards()
+        shards = list(_shards)
+    total = _Shard()
+    total.merge(_retired)
+    for shard in shards:
+        total.merge(shard)
+    return total.counters, total.histograms
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=()):
+    items = list(labels) + list(extra)
+    if not items:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in items) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+def render():
+    counters, histograms = _collect()
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'histogram':
+            for (key_name, labels), (buckets, total) in sorted(histograms.items()):
+                if key_name != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, buckets):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_format_labels(labels, [("le", repr(bound))])} {cumulative}')
+                cumulative += buckets[-1]
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(total)}')
+                lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+        else:
+            samples = [(labels, value) for (key_name, labels), value in sorted(counters.items()) if key_name == name]
+            if not samples:
+                samples = [((), 0)]
+            for labels, value in samples:
+                lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+    lines.append(f'# worker pid {os.getpid()}')
+    return '\n'.join(lines) + '\n'
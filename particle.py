@@ -0,0 +1,31 @@
+import pygame
+import random
+from settings import *
+
+class Particle(pygame.sprite.Sprite):
+    def __init__(self, position, color):
+        super().__init__()
+        self.size = random.randint(3, 7) # Varied initial size
+        self.image = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
+        self.color = color
+        pygame.draw.circle(self.image, self.color, (self.size, self.size), self.size)
+        self.rect = self.image.get_rect(center=position)
+        self.previous_center = self.rect.center
+        self.velocity = pygame.math.Vector2(random.uniform(-PARTICLE_VELOCITY_VARIANCE, PARTICLE_VELOCITY_VARIANCE), random.uniform(-PARTICLE_VELOCITY_VARIANCE, PARTICLE_VELOCITY_VARIANCE))
+        self.lifetime = random.randint(PARTICLE_LIFETIME - 10, PARTICLE_LIFETIME + 10) # Varied lifetime
+        self.initial_lifetime = self.lifetime
+
+    def update(self):
+        self.previous_center = self.rect.center
+        self.rect.move_ip(self.velocity)
+        self.lifetime -= 1
+        if self.lifetime <= 0:
+            self.kill()
+        
+        # Fade out and shrink
+        alpha = int(self.lifetime / self.initial_lifetime * 255)
+        current_size = int(self.size * (self.lifetime / self.initial_lifetime))
+        if current_size <= 0: current_size = 1
+
+        self.image = pygame.Surface((current_size * 2, current_size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.image, (self.color[0], self.color[1], self.color[2], alpha), (current_size, current_size), current_size)
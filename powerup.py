@@ -0,0 +1,39 @@
+
+import pygame
+import random
+from settings import *
+
+class PowerUp(pygame.sprite.Sprite):
+    def __init__(self, position, power_up_type):
+        super().__init__()
+        self.type = power_up_type
+        self.image = pygame.Surface((POWERUP_RADIUS * 2, POWERUP_RADIUS * 2), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(center=position)
+        self.previous_center = self.rect.center
+
+        if self.type == 'invincibility':
+            pygame.draw.circle(self.image, POWERUP_COLOR_INVINCIBILITY, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+        elif self.type == 'wave_boost':
+            pygame.draw.circle(self.image, POWERUP_COLOR_WAVE_BOOST, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+        elif self.type == 'slow_time':
+            pygame.draw.circle(self.image, POWERUP_COLOR_SLOW_TIME, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+        elif self.type == 'clear_screen':
+            pygame.draw.circle(self.image, POWERUP_COLOR_CLEAR_SCREEN, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+        elif self.type == 'wave_width':
+            pygame.draw.circle(self.image, POWERUP_COLOR_WAVE_WIDTH, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+        elif self.type == 'time_stop':
+            pygame.draw.circle(self.image, POWERUP_COLOR_TIME_STOP, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+        elif self.type == 'wave_magnet':
+            pygame.draw.circle(self.image, POWERUP_COLOR_WAVE_MAGNET, (POWERUP_RADIUS, POWERUP_RADIUS), POWERUP_RADIUS)
+
+        self.velocity = pygame.math.Vector2(random.uniform(-POWERUP_SPEED, POWERUP_SPEED), random.uniform(-POWERUP_SPEED, POWERUP_SPEED))
+
+    def update(self):
+        self.previous_center = self.rect.center
+        self.rect.move_ip(self.velocity)
+
+        # Bounce off walls
+        if self.rect.left < 0 or self.rect.right > WIDTH:
+            self.velocity.x *= -1
+        if self.rect.top < 0 or self.rect.bottom > HEIGHT:
+            self.velocity.y *= -1
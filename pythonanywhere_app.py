@@ -1,10 +1,16 @@
 from flask import Flask, render_template, send_from_directory, redirect, jsonify, request
 import os
 import logging
+from assets import load_manifest
 
 app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+asset_manifest = load_manifest(app.static_folder)
+
+@app.context_processor
+def asset_helpers():
+    return {'asset_bundle': asset_manifest.get}
 
 @app.route('/')
 def index():
@@ -7,11 +7,16 @@ class ScreenShake:
         self.intensity = intensity
         self.duration = duration
         self.timer = 0
+        self.offset = (0, 0)
 
-    def shake(self):
+    def update(self):
         if self.timer < self.duration:
             self.timer += 1
             offset_x = random.randint(-self.intensity, self.intensity)
             offset_y = random.randint(-self.intensity, self.intensity)
-            return (offset_x, offset_y)
-        return (0, 0)
+            self.offset = (offset_x, offset_y)
+        else:
+            self.offset = (0, 0)
+
+    def shake(self):
+        return self.offset
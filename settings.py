@@ -0,0 +1,249 @@
+
+# Screen dimensions
+WIDTH = 800
+HEIGHT = 600
+
+# Game settings
+FPS = 60
+
+# Colors
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+# Player settings
+CORE_RADIUS = 20
+
+# Enemy settings
+ENEMY_RADIUS = 15
+ENEMY_SPEED = 1.5 # Slightly slower base speed
+ENEMY_SPAWN_RATE = 120 # Slightly slower initial spawn
+ENEMY_MAX_SPEED = 6 # Higher max speed for more challenge
+
+# Wave settings
+WAVE_SPEED = 6 # Slightly faster wave expansion
+WAVE_WIDTH = 10
+WAVE_LIFETIME = 50 # Shorter wave lifetime
+WAVE_WIDTH_BOOST_MULTIPLIER = 2 # How much wider the wave becomes with power-up
+
+# Wave system settings
+WAVE_DURATION = 400 # Longer wave duration
+ENEMIES_PER_WAVE_BASE = 7 # More enemies per wave initially
+ENEMIES_PER_WAVE_INCREMENT = 3 # More enemies added per wave progression
+SPAWN_RATE_DECREMENT = 8 # Faster decrease in spawn rate per wave
+
+# Font settings
+FONT_SIZE_SCORE = 30
+FONT_SIZE_GAME_OVER = 64
+FONT_SIZE_TITLE = 72
+FONT_SIZE_INSTRUCTIONS = 24
+FONT_SIZE_MENU_ITEM = 48
+FONT_SIZE_PAUSE = 72
+FONT_SIZE_POWERUP_TIMER = 20
+
+# New Colors
+YELLOW = (255, 255, 0)
+GREEN = (0, 255, 0)
+GRID_COLOR = (40, 40, 40)
+
+# Ghost Enemy settings
+GHOST_ENEMY_COLOR = (150, 150, 255) # Light purple/blue
+GHOST_ENEMY_HITS_REQUIRED = 2 # Ghost enemies are slightly weaker
+
+# Power-up settings
+POWERUP_RADIUS = 10
+POWERUP_SPEED = 1.5 # Power-ups move slightly faster
+POWERUP_SPAWN_CHANCE = 0.15 # Increased chance for power-ups to drop
+
+# Power-up durations (in frames)
+POWERUP_DURATION_INVINCIBILITY = 300 # 5 seconds
+POWERUP_DURATION_WAVE_BOOST = 240 # 4 seconds
+POWERUP_DURATION_SLOW_TIME = 240 # 4 seconds
+POWERUP_DURATION_CLEAR_SCREEN = 1 # Instant effect
+POWERUP_DURATION_WAVE_WIDTH = 240 # 4 seconds
+POWERUP_DURATION_TIME_STOP = 180 # 3 seconds
+POWERUP_DURATION_WAVE_MAGNET = 300 # 5 seconds
+
+# Power-up colors
+POWERUP_COLOR_INVINCIBILITY = (255, 215, 0) # Gold
+POWERUP_COLOR_WAVE_BOOST = (0, 255, 255) # Cyan
+POWERUP_COLOR_SLOW_TIME = (100, 100, 255) # Light blue
+POWERUP_COLOR_CLEAR_SCREEN = (255, 0, 255) # Magenta
+POWERUP_COLOR_WAVE_WIDTH = (255, 165, 0) # Orange
+POWERUP_COLOR_TIME_STOP = (150, 0, 150) # Purple
+POWERUP_COLOR_WAVE_MAGNET = (0, 255, 100) # Greenish-blue
+
+# Particle settings
+PARTICLE_LIFETIME = 30 # Shorter particle lifetime
+PARTICLE_VELOCITY_VARIANCE = 4 # More varied particle velocity
+
+# Charger Enemy settings
+CHARGER_ENEMY_COLOR = (255, 100, 0) # Orange
+CHARGER_ENEMY_CHARGE_SPEED_MULTIPLIER = 4 # Faster charge speed
+CHARGER_ENEMY_CHARGE_DISTANCE = 120 # Distance from core to trigger charge
+
+# Splitter Enemy settings
+SPLITTER_ENEMY_COLOR = (255, 0, 255) # Magenta
+SPLITTER_ENEMY_COUNT = 2 # Number of enemies to split into
+SPLITTER_ENEMY_RADIUS_MULTIPLIER = 0.7 # Size multiplier for split enemies
+
+# Shielded Enemy settings
+SHIELDED_ENEMY_COLOR = (100, 200, 255) # Light blue
+SHIELDED_ENEMY_SHIELD_COLOR = (200, 200, 200) # Grey
+SHIELDED_ENEMY_SHIELD_HEALTH = 3 # Hits required to break shield
+
+# Core settings
+CORE_HIT_ANIMATION_DURATION = 10 # Frames for hit animation
+
+# High Score settings
+HIGH_SCORE_FILE = "highscore.txt"
+
+# Combo settings
+COMBO_TIME_LIMIT = 60 # Frames (1 second)
+COMBO_BONUS_MULTIPLIER = 0.1 # Bonus score per combo hit
+
+# Humor settings
+GAME_OVER_MESSAGES = [
+    "You fought well, but the echoes faded.",
+    "The core is no more. Try again?",
+    "Game Over! Your sound defense was... lacking.",
+    "The waves have crashed. And so have you."
+]
+
+POWERUP_MESSAGES = {
+    'invincibility': "Feeling untouchable!",
+    'wave_boost': "Waves on steroids!",
+    'slow_time': "Time to chill... for them.",
+    'clear_screen': "A clean slate!",
+    'wave_width': "Wider waves, wider destruction!",
+    'time_stop': "Everything just... stopped.",
+    'wave_magnet': "Pulling them in!"
+}
+
+COMBO_MESSAGES = [
+    "Echo Combo!",
+    "Wave Chain!",
+    "Sonic Streak!",
+    "Resonance Rampage!"
+]
+
+HIGH_SCORE_MESSAGES = [
+    "New High Score! You're a legend!",
+    "Echoes of Greatness!",
+    "Top of the Sound Waves!"
+]
+
+ENEMY_DEFEAT_MESSAGES = {
+    'basic': "Basic Busted!",
+    'zigzag': "Zigzagged!",
+    'ghost': "Ghosted!",
+    'charger': "Charged Down!",
+    'splitter': "Split Apart!",
+    'shielded': "Shield Shattered!",
+    'healer': "Healer Silenced!",
+    'spawner': "Spawner Shut Down!"
+}
+
+# Wave Modes
+WAVE_MODE_NORMAL = {'width_multiplier': 1, 'damage_multiplier': 1}
+WAVE_MODE_FOCUSED = {'width_multiplier': 0.5, 'damage_multiplier': 1.5}
+WAVE_MODE_WIDE = {'width_multiplier': 1.5, 'damage_multiplier': 0.75}
+
+# Echo Burst settings
+ECHO_BURST_COOLDOWN = 300 # Frames (5 seconds)
+ECHO_BURST_RADIUS = 150
+ECHO_BURST_DAMAGE = 5 # Instant kill for most enemies, reduces shield health for shielded enemies
+ECHO_BURST_COLOR = (200, 200, 255) # Light purple/blue
+
+# Healer Enemy settings
+HEALER_ENEMY_COLOR = (100, 255, 100) # Light green
+HEALER_ENEMY_HEAL_AMOUNT = 1 # Amount of health healed per tick
+HEALER_ENEMY_HEAL_RADIUS = 100 # Radius within which enemies are healed
+HEALER_ENEMY_HEAL_COOLDOWN = 90 # Frames (1.5 seconds) between heals
+
+# Spawner Enemy settings
+SPAWNER_ENEMY_COLOR = (255, 100, 255) # Pink
+SPAWNER_ENEMY_SPAWN_COOLDOWN = 180 # Frames (3 seconds) between spawns
+SPAWNER_ENEMY_SPAWN_COUNT = 1 # Number of enemies spawned at once
+SPAWNER_ENEMY_SPAWN_TYPE = 'basic' # Type of enemy spawned (e.g., 'basic', 'zigzag')
+
+# Disruptor Enemy settings
+DISRUPTOR_ENEMY_COLOR = (128, 0, 128) # Purple
+DISRUPTOR_FIELD_RADIUS = 100
+DISRUPTOR_FIELD_DURATION = 180 # Frames (3 seconds)
+DISRUPTOR_WAVE_DAMPEN_FACTOR = 0.5 # Multiplier for wave damage in field
+DISRUPTOR_ENEMY_SLOW_FACTOR = 0.5 # Multiplier for enemy speed in field
+
+# Start Screen settings
+START_SCREEN_TITLE = "ECHO WEAVER"
+START_SCREEN_INSTRUCTIONS = [
+    "Defend the core by creating sound waves!",
+    "Click and drag to draw a line, release to unleash a wave.",
+    "Press 1, 2, 3 to switch wave modes (Normal, Focused, Wide).",
+    "Press SPACE for Echo Burst (clears nearby enemies, has cooldown).",
+    "Collect power-ups for temporary boosts.",
+    "Press any key to start."
+]
+
+# Message Display settings
+MESSAGE_DISPLAY_DURATION = 90 # Frames (1.5 seconds)
+MESSAGE_FADE_SPEED = 5 # Alpha reduction per frame
+
+# Core Visuals
+CORE_PULSE_COLOR = (50, 50, 200) # Darker blue for pulse
+CORE_SHIELD_COLOR = (0, 200, 255) # Cyan for shield
+
+# Wave Visuals
+WAVE_GRADIENT_COLOR_START = (255, 255, 255) # White
+WAVE_GRADIENT_COLOR_END = (150, 150, 255) # Light blue
+
+# Background Visuals
+BACKGROUND_PARTICLE_COLOR = (30, 30, 30) # Dark grey for subtle particles
+ENEMY_TRAIL_COLOR = (50, 50, 50) # Darker grey for enemy trails
+
+# Core Visuals (Advanced)
+CORE_ENERGY_FLOW_COLOR = (100, 100, 255) # Light blue for energy flow
+
+# Wave Visuals (Advanced)
+WAVE_DISTORTION_STRENGTH = 10 # How much waves distort in disruptor field
+
+# Enemy Visuals (Advanced)
+ENEMY_DAMAGE_COLOR_CHANGE_FACTOR = 0.5 # How much enemy color shifts towards red when damaged
+ENEMY_GLOW_COLOR = (255, 200, 0) # Orange-yellow glow for enemies
+
+# Enemy Colors (for different enemy types)
+ENEMY_COLORS = {
+    'Enemy': (255, 0, 0), # Red
+    'ZigzagEnemy': (0, 200, 0), # Green
+    'GhostEnemy': (150, 150, 255), # Light purple/blue
+    'ChargerEnemy': (255, 100, 0), # Orange
+    'SplitterEnemy': (255, 0, 255), # Magenta
+    'ShieldedEnemy': (100, 200, 255), # Light blue
+    'HealerEnemy': (100, 255, 100), # Light green
+    'SpawnerEnemy': (255, 100, 255), # Pink
+    'DisruptorEnemy': (128, 0, 128) # Purple
+}
+ENEMY_DAMAGE_COLOR = (255, 50, 50) # Color enemies shift towards when damaged (a lighter red)
+
+# Gameplay Feedback
+HIT_NUMBER_LIFETIME = 30 # Frames for hit numbers to display
+CRITICAL_HIT_CHANCE = 0.1 # 10% chance for a critical hit
+CRITICAL_HIT_MULTIPLIER = 2 # Critical hits deal double damage
+
+# Challenge Modifiers
+CHALLENGE_MODIFIER_CHANCE = 0.2 # 20% chance for a modifier per wave
+CHALLENGE_MODIFIERS = {
+    'enemies_faster': {'message': "Enemies are faster!", 'effect': {'enemy_speed_multiplier': 1.2}},
+    'waves_weaker': {'message': "Waves are weaker!", 'effect': {'wave_damage_multiplier': 0.7}},
+    'core_vulnerable': {'message': "Core is vulnerable!", 'effect': {'invincibility_duration_multiplier': 0.5}}
+}
+
+# Fever Mode settings
+FEVER_MODE_DURATION = 600 # Frames (10 seconds)
+FEVER_MODE_CHARGE_PER_HIT = 5 # Amount of charge gained per enemy hit
+FEVER_MODE_THRESHOLD = 1000 # Total charge needed to activate Fever Mode
+FEVER_MODE_ENEMY_DAMAGE_MULTIPLIER = 2 # Enemies take double damage in Fever Mode
+FEVER_MODE_PLAYER_WAVE_DAMAGE_MULTIPLIER = 1.5 # Player waves deal 1.5x damage in Fever Mode
+FEVER_MODE_COLOR = (255, 0, 255) # Magenta for Fever Mode
+
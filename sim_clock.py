@@ -0,0 +1,45 @@
+# Timers in settings.py are counted in 60 Hz ticks (what FPS used to mean).
+TICK_RATE = 60
+# Longest stretch of wall time one rendered frame may catch up on. Anything
+# beyond it (a breakpoint, a backgrounded tab) is dropped rather than replayed.
+MAX_FRAME_TIME = 0.25
+
+
+class SimClock:
+    """Fixed-timestep accumulator.
+
+    Each rendered frame reports how much wall time passed; advance() returns
+    how many fixed ticks to simulate, so a slow device runs several updates
+    per frame instead of slowing the game down. alpha is the fraction of a
+    tick left over, for interpolating between the last two simulated states.
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_frame_time=MAX_FRAME_TIME):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, elapsed):
+        self.accumulator += min(elapsed, self.max_frame_time)
+        steps = int(self.accumulator * self.tick_rate + 1e-9)
+        self.accumulator = max(self.accumulator - steps * self.dt, 0.0)
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator * self.tick_rate, 1.0)
+
+
+def interpolated(sprites, alpha):
+    """(image, rect) pairs drawing each sprite between its previous_center
+    and its current rect. The sprites' own rects stay as simulated."""
+    pairs = []
+    back = 1 - alpha
+    for sprite in sprites:
+        x, y = sprite.rect.center
+        px, py = sprite.previous_center
+        pairs.append((sprite.image, sprite.rect.move(round((px - x) * back), round((py - y) * back))))
+    return pairs
@@ -1,5 +1,12 @@
 import pygame
 import os
+import sys
+import json
+
+SOUND_DIR = os.path.join('assets', 'sounds')
+# The pygbag archive carries Ogg copies of the effects (see build_game.py).
+SOUND_EXT = '.ogg' if sys.platform == 'emscripten' else '.wav'
+SPRITE_MANIFEST = os.path.join(SOUND_DIR, 'dist', 'manifest.json')
 
 class SoundManager:
     def __init__(self):
@@ -8,7 +15,7 @@ class SoundManager:
 
     def _load_sound(self, filename):
         try:
-            path = os.path.join('assets', 'sounds', filename)
+            path = os.path.join(SOUND_DIR, filename)
             sound = pygame.mixer.Sound(path)
             return sound
         except FileNotFoundError:
@@ -16,12 +23,40 @@ class SoundManager:
         except Exception as e:
             return None
 
+    def _load_sprite(self):
+        # Slices the packed effects sprite written by build_assets.py. The
+        # mixer may have resampled it, so offsets are converted using the
+        # mixer's own format rather than the file's.
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            return None
+        try:
+            with open(SPRITE_MANIFEST) as f:
+                manifest = json.load(f)
+            sprite = pygame.mixer.Sound(os.path.join(SOUND_DIR, manifest['sprite']['audio/wav']))
+        except Exception:
+            return None
+
+        frequency, size, channels = mixer
+        frame_size = abs(size) // 8 * channels
+        raw = sprite.get_raw()
+        sounds = {}
+        for name, clip in manifest['sounds'].items():
+            start = round(clip['start'] * frequency) * frame_size
+            end = start + round(clip['duration'] * frequency) * frame_size
+            sounds[name] = pygame.mixer.Sound(buffer=raw[start:end])
+        return sounds
+
     def _load_sounds(self):
-        self.sounds['wave_create'] = self._load_sound('create_wave.wav')
-        self.sounds['enemy_hit'] = self._load_sound('enemy_hit.wav')
-        self.sounds['game_over'] = self._load_sound('game_over.wav')
-        self.sounds['powerup_collect'] = self._load_sound('powerup_collect.wav')
-        self.sounds['echo_burst'] = self._load_sound('echo_burst.wav')
+        clips = self._load_sprite() or {}
+        for name, filename in (
+            ('wave_create', 'create_wave'),
+            ('enemy_hit', 'enemy_hit'),
+            ('game_over', 'game_over'),
+            ('powerup_collect', 'powerup_collect'),
+            ('echo_burst', 'echo_burst'),
+        ):
+            self.sounds[name] = clips.get(filename) or self._load_sound(filename + SOUND_EXT)
 
     def play_sound(self, sound_name):
         sound = self.sounds.get(sound_name)
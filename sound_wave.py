@@ -0,0 +1,123 @@
+import pygame
+import math
+from settings import *
+
+class SoundWave(pygame.sprite.Sprite):
+    def __init__(self, start_pos, end_pos, boost_width=False, wave_magnet_active=False, damage_multiplier=1, width_multiplier=1):
+        super().__init__()
+        self.start_pos = pygame.math.Vector2(start_pos)
+        self.end_pos = pygame.math.Vector2(end_pos)
+        
+        self.vec = self.end_pos - self.start_pos
+        self.angle = self.vec.angle_to(pygame.math.Vector2(1, 0))
+        self.length = self.vec.length()
+
+        if self.length < 10:
+            self.kill()
+
+        initial_width = WAVE_WIDTH * width_multiplier
+        if boost_width:
+            initial_width *= WAVE_WIDTH_BOOST_MULTIPLIER
+            
+        self.image = pygame.Surface((self.length, initial_width), pygame.SRCALPHA)
+        self.rect = self.image.get_rect(center=self.start_pos.lerp(self.end_pos, 0.5))
+        self.previous_center = self.rect.center
+        
+        self.expansion_speed = WAVE_SPEED
+        self.current_width = initial_width
+        self.lifetime = 1.0
+        self.fade_speed = 0.02
+        self.wave_magnet_active = wave_magnet_active
+        self.damage_multiplier = damage_multiplier
+
+    def update(self, enemies=None, disruptors=None):
+        self.previous_center = self.rect.center
+        current_expansion_speed = self.expansion_speed
+        current_damage_multiplier = self.damage_multiplier
+
+        if disruptors:
+            for disruptor in disruptors:
+                if self.rect.colliderect(disruptor.rect.inflate(DISRUPTOR_FIELD_RADIUS * 2, DISRUPTOR_FIELD_RADIUS * 2)):
+                    # Check if wave center is within disruptor field
+                    if pygame.math.Vector2(self.rect.center).distance_to(disruptor.rect.center) < DISRUPTOR_FIELD_RADIUS:
+                        current_damage_multiplier *= DISRUPTOR_WAVE_DAMPEN_FACTOR
+
+        self.current_width += current_expansion_speed
+        self.lifetime -= self.fade_speed
+
+        if self.lifetime <= 0:
+            self.kill()
+        
+        center = self.rect.center
+        new_image_width = int(self.current_width)
+        if new_image_width <= 0:
+            self.kill()
+            return
+
+        new_image = pygame.Surface((self.length, new_image_width), pygame.SRCALPHA)
+        alpha = int(self.lifetime * 255)
+
+        # Draw the main wave rectangle with a gradient
+        for y in range(new_image_width):
+            lerp_factor = y / new_image_width
+            current_color = (
+                int(WAVE_GRADIENT_COLOR_START[0] * (1 - lerp_factor) + WAVE_GRADIENT_COLOR_END[0] * lerp_factor),
+                int(WAVE_GRADIENT_COLOR_START[1] * (1 - lerp_factor) + WAVE_GRADIENT_COLOR_END[1] * lerp_factor),
+                int(WAVE_GRADIENT_COLOR_START[2] * (1 - lerp_factor) + WAVE_GRADIENT_COLOR_END[2] * lerp_factor),
+                alpha
+            )
+            pygame.draw.line(new_image, current_color, (0, y), (self.length, y))
+
+        # Draw inner "rings" or layers
+        num_inner_layers = 2
+        for i in range(1, num_inner_layers + 1):
+            # Calculate dimensions for inner layer
+            inner_width_factor = 0.7 - (i * 0.1) # Make inner layers smaller
+            inner_alpha_factor = 0.8 - (i * 0.2) # Make inner layers more transparent
+
+            inner_width = new_image_width * inner_width_factor
+            inner_length = self.length * inner_width_factor # Also shrink length for inner layers
+            inner_alpha = int(alpha * inner_alpha_factor)
+
+            if inner_width <= 0 or inner_length <= 0: continue
+
+            inner_color = (255, 255, 255, inner_alpha)
+            
+            # Calculate position to center the inner rectangle
+            inner_x = (self.length - inner_length) / 2
+            inner_y = (new_image_width - inner_width) / 2
+            
+            pygame.draw.rect(new_image, inner_color, (inner_x, inner_y, inner_length, inner_width))
+
+        # Apply distortion if in disruptor field
+        if disruptors:
+            for disruptor in disruptors:
+                if self.rect.colliderect(disruptor.rect.inflate(DISRUPTOR_FIELD_RADIUS * 2, DISRUPTOR_FIELD_RADIUS * 2)):
+                    if pygame.math.Vector2(self.rect.center).distance_to(disruptor.rect.center) < DISRUPTOR_FIELD_RADIUS:
+                        # More complex distortion: radial displacement based on noise
+                        temp_surface = new_image.copy() # Create a copy to draw on
+                        new_image.fill((0,0,0,0)) # Clear original
+                        for x_orig in range(self.length):
+                            for y_orig in range(new_image_width):
+                                # Calculate distance from center of disruptor field
+                                dist_x = (self.rect.centerx - disruptor.rect.centerx) + x_orig - self.length / 2
+                                dist_y = (self.rect.centery - disruptor.rect.centery) + y_orig - new_image_width / 2
+                                distance_to_disruptor_center = math.sqrt(dist_x**2 + dist_y**2)
+
+                                # Apply radial distortion based on distance and time
+                                angle = math.atan2(dist_y, dist_x)
+                                distortion_amount = math.sin(distance_to_disruptor_center * 0.1 + pygame.time.get_ticks() * 0.01) * DISRUPTOR_WAVE_DAMPEN_FACTOR * WAVE_DISTORTION_STRENGTH
+
+                                new_x = int(x_orig + distortion_amount * math.cos(angle))
+                                new_y = int(y_orig + distortion_amount * math.sin(angle))
+
+                                if 0 <= new_x < self.length and 0 <= new_y < new_image_width:
+                                    new_image.set_at((new_x, new_y), temp_surface.get_at((x_orig, y_orig)))
+
+        self.image = pygame.transform.rotate(new_image, -self.angle)
+        self.rect = self.image.get_rect(center=center)
+
+        # Wave Magnet effect
+        if self.wave_magnet_active and enemies:
+            # Pull every enemy within range of the wave towards its center
+            enemies.pull(self.rect.center, self.current_width * 2, self.current_width * 0.05)
@@ -1067,8 +1067,13 @@ class Game {
     
     async _loadHighScores() {
         try {
-            const response = await fetch('/api/highscores');
-            let highscores = await response.json();
+            let highscores;
+            if (window.leaderboardFeed) {
+                highscores = await window.leaderboardFeed.refresh();
+            } else {
+                const response = await fetch('/api/highscores');
+                highscores = await response.json();
+            }
             
             console.log('Loaded highscores (raw data):', highscores);
             if (!Array.isArray(highscores)) {
@@ -0,0 +1,110 @@
+class LeaderboardFeed {
+    constructor(streamUrl = '/api/highscores/stream', pollUrl = '/api/highscores') {
+        this.streamUrl = streamUrl;
+        this.pollUrl = pollUrl;
+        this.entries = [];
+        this.version = -1;
+        this.connected = false;
+        this.listeners = [];
+        this.source = null;
+        this.retryDelay = 60000;
+        this.maxRetryDelay = 15 * 60000;
+        this.failures = 0;
+        this.streamed = false;
+        this.unavailable = false;
+        this.retryTimer = null;
+    }
+
+    subscribe(listener) {
+        this.listeners.push(listener);
+        if (this.version >= 0) {
+            listener(this.entries);
+        }
+        if (!this.source && !this.retryTimer && !this.unavailable) {
+            this._connect();
+        }
+    }
+
+    refresh() {
+        if (this.connected) {
+            return Promise.resolve(this.entries);
+        }
+        return fetch(this.pollUrl)
+            .then(response => response.json())
+            .then(highscores => {
+                this._update(Array.isArray(highscores) ? highscores : [], Math.max(this.version, 0));
+                return this.entries;
+            });
+    }
+
+    _connect() {
+        this.retryTimer = null;
+        if (typeof EventSource === 'undefined') {
+            this.refresh().catch(error => console.error('Error loading high scores:', error));
+            return;
+        }
+
+        const source = new EventSource(this.streamUrl);
+        this.source = source;
+
+        source.addEventListener('snapshot', event => {
+            const data = JSON.parse(event.data);
+            this.connected = true;
+            this.streamed = true;
+            this.failures = 0;
+            this._update(data.entries, data.version);
+        });
+
+        source.addEventListener('diff', event => {
+            const data = JSON.parse(event.data);
+            if (data.base !== this.version) {
+                this._reconnect(0);
+                return;
+            }
+            const entries = this.entries.slice(0, data.length);
+            data.changes.forEach(change => {
+                entries[change.rank] = { name: change.name, score: change.score };
+            });
+            this._update(entries, data.version);
+        });
+
+        source.onerror = () => {
+            this.connected = false;
+            if (source.readyState !== EventSource.CLOSED) {
+                return; // The browser is already reconnecting
+            }
+            // A stream that never opened was refused, typically a 503 from a
+            // server that does not stream. Stop asking and rely on fetches on
+            // load and after each submitted score. A stream that did work is
+            // retried with exponential backoff.
+            if (this.streamed) {
+                this._reconnect(Math.min(this.retryDelay * 2 ** this.failures, this.maxRetryDelay));
+                this.failures += 1;
+            } else {
+                source.close();
+                this.source = null;
+                this.unavailable = true;
+            }
+            this.refresh().catch(error => console.error('Error loading high scores:', error));
+        };
+    }
+
+    _reconnect(delay) {
+        if (this.source) {
+            this.source.close();
+            this.source = null;
+        }
+        this.connected = false;
+        if (!this.retryTimer) {
+            this.retryTimer = setTimeout(() => this._connect(), delay);
+        }
+    }
+
+    _update(entries, version) {
+        this.entries = entries;
+        this.version = version;
+        this.listeners.forEach(listener => listener(entries));
+    }
+}
+
+window.leaderboardFeed = new LeaderboardFeed();
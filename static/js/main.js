@@ -61,32 +61,23 @@ document.addEventListener('DOMContentLoaded', () => {
     SETTINGS.HEIGHT = canvas.height;
     
     const soundConfig = {
-        wave_create: '/static/assets/sounds/create_wave.wav',
-        enemy_hit: '/static/assets/sounds/enemy_hit.wav',
-        game_over: '/static/assets/sounds/game_over.wav',
-        powerup_collect: '/static/assets/sounds/powerup_collect.wav',
-        echo_burst: '/static/assets/sounds/echo_burst.wav',
-        boss_spawn: '/static/assets/sounds/enemy_hit.wav',
-        multi_wave: '/static/assets/sounds/create_wave.wav'
+        wave_create: 'create_wave',
+        enemy_hit: 'enemy_hit',
+        game_over: 'game_over',
+        powerup_collect: 'powerup_collect',
+        echo_burst: 'echo_burst',
+        boss_spawn: 'enemy_hit',
+        multi_wave: 'create_wave'
     };
 
-    const sounds = Object.entries(soundConfig).reduce((acc, [name, path]) => {
-        const audio = new Audio(path);
-        audio.preload = 'auto';
-        acc[name] = audio;
-        return acc;
-    }, {});
+    const sounds = new SoundSprite();
+    sounds.load([...new Set(Object.values(soundConfig))]);
 
     const DEFAULT_SOUND = 'wave_create';
     
     function playSound(soundName) {
-        const sound = sounds[soundName] || sounds[DEFAULT_SOUND];
-        if (sound) {
-            sound.currentTime = 0;
-            sound.play().catch(error => {
-                debugLog(`Error playing sound ${soundName}:`, error);
-            });
-        } else {
+        const clip = soundConfig[soundName] || soundConfig[DEFAULT_SOUND];
+        if (!sounds.play(clip)) {
             console.warn(`No audio resource available for sound ${soundName}`);
         }
     }
@@ -130,21 +121,18 @@ document.addEventListener('DOMContentLoaded', () => {
     debugLog('Loaded player name from cookie:', playerName);
     }
     
-    fetch('/api/highscores')
-        .then(response => response.json())
-        .then(highscores => {
-            debugLog('Initial highscores:', highscores);
-            
-            if (highscores && highscores.length > 0) {
-                const highscoreElement = document.getElementById('highscore');
-                if (highscoreElement) {
-                    highscoreElement.textContent = highscores[0].score;
-                }
+    window.leaderboardFeed.subscribe(highscores => {
+        debugLog('Leaderboard update:', highscores);
+        
+        if (highscores && highscores.length > 0) {
+            const highscoreElement = document.getElementById('highscore');
+            if (highscoreElement) {
+                highscoreElement.textContent = highscores[0].score;
             }
-            
-            updateLeaderboard(highscores);
-        })
-        .catch(error => console.error('Error loading high scores:', error));
+        }
+        
+        updateLeaderboard(highscores);
+    });
     
     let lastTime = 0;
     let accumulator = 0;
@@ -280,12 +268,7 @@ document.addEventListener('DOMContentLoaded', () => {
         submitScoreButton.disabled = true;
         submitScoreButton.textContent = 'Score Submitted!';
         
-        fetch('/api/highscores')
-            .then(response => response.json())
-            .then(highscores => {
-                debugLog('Received highscores after submit:', highscores);
-                updateLeaderboard(highscores);
-            })
+        window.leaderboardFeed.refresh()
             .catch(error => console.error('Error updating leaderboard:', error));
     });
     
@@ -372,12 +355,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 submitScoreButton.textContent = 'Score Submitted!';
             }
             
-            fetch('/api/highscores')
-                .then(response => response.json())
-                .then(highscores => {
-                    debugLog('Received highscores after auto-submit:', highscores);
-                    updateLeaderboard(highscores);
-                })
+            window.leaderboardFeed.refresh()
                 .catch(error => console.error('Error updating leaderboard:', error));
             
             return true;
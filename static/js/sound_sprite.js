@@ -0,0 +1,80 @@
+class SoundSprite {
+    constructor(spriteUrl = '/audio/effects', fallbackDir = '/assets/sounds/') {
+        this.spriteUrl = spriteUrl;
+        this.fallbackDir = fallbackDir;
+        this.context = null;
+        this.buffer = null;
+        this.clips = {};
+        this.fallback = {};
+    }
+
+    load(names) {
+        const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+        if (!AudioContextClass) {
+            this._loadFallback(names);
+            return Promise.resolve();
+        }
+
+        return fetch(`${this.spriteUrl}.json`)
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`sprite manifest returned ${response.status}`);
+                }
+                return response.json();
+            })
+            .then(manifest => {
+                this.clips = manifest.sounds;
+                const probe = document.createElement('audio');
+                const accept = probe.canPlayType('audio/ogg; codecs=opus') ? 'audio/ogg, audio/wav;q=0.5' : 'audio/wav';
+                return fetch(`${this.spriteUrl}?v=${manifest.version}`, { headers: { Accept: accept } });
+            })
+            .then(response => response.arrayBuffer())
+            .then(data => {
+                this.context = new AudioContextClass();
+                // Callback form: older Safari has no promise-based decodeAudioData.
+                return new Promise((resolve, reject) => this.context.decodeAudioData(data, resolve, reject));
+            })
+            .then(buffer => {
+                this.buffer = buffer;
+            })
+            .catch(error => {
+                console.warn('Sound sprite unavailable, loading individual files:', error);
+                this._loadFallback(names);
+            });
+    }
+
+    play(name) {
+        if (this.buffer) {
+            const clip = this.clips[name];
+            if (!clip) {
+                return false;
+            }
+            if (this.context.state === 'suspended') {
+                this.context.resume();
+            }
+            const source = this.context.createBufferSource();
+            source.buffer = this.buffer;
+            source.connect(this.context.destination);
+            source.start(0, clip.start, clip.duration);
+            return true;
+        }
+
+        const audio = this.fallback[name];
+        if (!audio) {
+            return false;
+        }
+        audio.currentTime = 0;
+        audio.play().catch(error => console.warn(`Error playing sound ${name}:`, error));
+        return true;
+    }
+
+    _loadFallback(names) {
+        names.forEach(name => {
+            if (!this.fallback[name]) {
+                const audio = new Audio(`${this.fallbackDir}${name}.wav`);
+                audio.preload = 'auto';
+                this.fallback[name] = audio;
+            }
+        });
+    }
+}
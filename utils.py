@@ -0,0 +1,11 @@
+
+import pygame
+from settings import *
+
+def draw_text(screen, text, size, x, y, color=WHITE, alpha=255):
+    font = pygame.font.Font(None, size)
+    text_surface = font.render(text, True, color)
+    text_surface.set_alpha(alpha)
+    text_rect = text_surface.get_rect()
+    text_rect.midtop = (x, y)
+    return screen.blit(text_surface, text_rect)
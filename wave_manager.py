@@ -1,7 +1,7 @@
 import pygame
 import random
 from settings import *
-from enemy import Enemy, ZigzagEnemy, GhostEnemy, ChargerEnemy, SplitterEnemy, ShieldedEnemy, HealerEnemy, SpawnerEnemy, DisruptorEnemy
+from enemy import BASIC, ZIGZAG, GHOST, CHARGER, SPLITTER, SHIELDED, HEALER, SPAWNER, DISRUPTOR
 
 class WaveManager:
     def __init__(self):
@@ -10,7 +10,7 @@ class WaveManager:
         self.spawned_enemies_count = 0
         self.spawn_timer = 0
         self.wave_active = False
-    self.enemy_speed = ENEMY_SPEED
+        self.enemy_speed = ENEMY_SPEED
 
     def start_next_wave(self):
         self.current_wave += 1
@@ -45,20 +45,20 @@ class WaveManager:
         enemy_type_roll = random.random()
 
         if self.current_wave >= 10 and enemy_type_roll < 0.05:
-            enemies_group.add(DisruptorEnemy())
+            enemies_group.spawn(DISRUPTOR)
         elif self.current_wave >= 9 and enemy_type_roll < 0.05:
-            enemies_group.add(SpawnerEnemy())
+            enemies_group.spawn(SPAWNER)
         elif self.current_wave >= 8 and enemy_type_roll < 0.08:
-            enemies_group.add(HealerEnemy())
+            enemies_group.spawn(HEALER)
         elif self.current_wave >= 7 and enemy_type_roll < 0.1:
-            enemies_group.add(ShieldedEnemy())
+            enemies_group.spawn(SHIELDED)
         elif self.current_wave >= 5 and enemy_type_roll < 0.15:
-            enemies_group.add(SplitterEnemy())
+            enemies_group.spawn(SPLITTER)
         elif self.current_wave >= 3 and enemy_type_roll < 0.15:
-            enemies_group.add(GhostEnemy())
+            enemies_group.spawn(GHOST)
         elif self.current_wave >= 5 and enemy_type_roll < 0.1:
-            enemies_group.add(ChargerEnemy())
+            enemies_group.spawn(CHARGER)
         elif enemy_type_roll < 0.3:
-            enemies_group.add(ZigzagEnemy())
+            enemies_group.spawn(ZIGZAG)
         else:
-            enemies_group.add(Enemy())
+            enemies_group.spawn(BASIC)